@@ -1,2 +1,2 @@
-__version__ = "1.2.1"
+__version__ = "1.3.0"
 default_app_config = "django_serializer.apps.DjangoSerializer"
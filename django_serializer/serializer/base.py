@@ -1,3 +1,5 @@
+import functools
+import operator
 from warnings import warn
 
 from django.conf import settings
@@ -53,6 +55,45 @@ if EXTRA_SERIALIZER_FIELD_MAPPING:
     SERIALIZER_FIELD_MAPPING.update(EXTRA_SERIALIZER_FIELD_MAPPING)
 
 
+def build_plan(fields):
+    """
+    Precomputes accessors and handlers of serializer fields.
+
+    Plan item is (field_name, field, getters, handler, source):
+
+    * getters - (attrgetter, itemgetter) of value, None for SerializerField
+    * handler - field.serialization_handler, None if field overrides
+      `serialize` and has to be serialized by generic code
+    * source - SerializerField source, callable or serializer method name
+
+    :param fields: list of (field_name, field)
+    :return: tuple of plan items
+    """
+    plan = []
+    for field_name, field in fields:
+        field_class = type(field)
+        getters, handler, source = None, None, None
+        if field_class.serialize is Field.serialize:
+            if isinstance(field, SerializerField):
+                if (
+                    field_class.serialization_handler
+                    is SerializerField.serialization_handler
+                ):
+                    source = field.source
+            else:
+                getters = (
+                    operator.attrgetter(field_name),
+                    operator.itemgetter(field_name),
+                )
+                handler = field.serialization_handler
+        plan.append((field_name, field, getters, handler, source))
+    return tuple(plan)
+
+
+def _missing_source(obj):
+    raise AttributeError
+
+
 class SerializerMeta(type):
     def __new__(mcs, name, bases, attrs):
         serializer_attrs = attrs.copy()
@@ -68,6 +109,8 @@ class SerializerMeta(type):
             if isinstance(field, Field):
                 attrs["serializer_attrs"].append((field_name, field))
 
+        attrs["serializer_plan"] = build_plan(attrs["serializer_attrs"])
+
         new = super(SerializerMeta, mcs).__new__(mcs, name, bases, attrs)
         return new
 
@@ -109,43 +152,91 @@ class Serializer(metaclass=SerializerMeta):
         else:
             return obj_extractor
 
+    def _serialize_field(self, obj, field_name, field):
+        try:
+            if isinstance(field, SerializerField):
+                if field.serializer is not self:
+                    field = field.bind(self)
+                return field.serialize(field_value=obj)
+            extractor = self._get_extractor(obj)
+            return field.serialize(field_value=extractor(obj, field_name))
+        except AttributeError:
+            return field.serialize()
+
+    def _bind_plan(self):
+        """
+        Binds serializer plan to the instance: method sources are looked up
+        once, fields requiring generic code get `_serialize_field` handler.
+        SerializerField is bound by copy, shared class level fields
+        are not changed, so serializers can be used by many threads
+        """
+        cls = type(self)
+        if cls._get_fields is Serializer._get_fields:
+            plan = cls.serializer_plan
+        else:
+            plan = build_plan(self._get_fields())
+        generic = cls._get_extractor is not Serializer._get_extractor
+
+        bound = []
+        for field_name, field, getters, handler, source in plan:
+            if source is not None:
+                if not callable(source):
+                    source = getattr(self, source, _missing_source)
+                bound.append((field_name, field, None, source))
+            elif handler is not None and not generic:
+                bound.append((field_name, field, getters, handler))
+            else:
+                if isinstance(field, SerializerField):
+                    field = field.bind(self)
+                handler = functools.partial(
+                    self._serialize_field, field_name=field_name, field=field
+                )
+                bound.append((field_name, field, None, handler))
+        return bound
+
     def _serialize_obj(self, obj):
-        serialized = {}
+        plan = self.__dict__.get("_bound_plan")
+        if plan is None:
+            plan = self._bound_plan = self._bind_plan()
 
-        fields = self._get_fields()
-        extractor = self._get_extractor(obj)
+        if isinstance(obj, dict):
+            index, lookup_error = 1, KeyError
+        else:
+            index, lookup_error = 0, AttributeError
 
-        for field_name, field in fields:
+        serialized = {}
+        for field_name, field, getters, handler in plan:
             try:
-                if isinstance(field, SerializerField):
-                    field.serializer = self
-                    serialized_field_value = field.serialize(field_value=obj)
-                else:
-                    obj_field_value = extractor(obj, field_name)
-                    serialized_field_value = field.serialize(
-                        field_value=obj_field_value
-                    )
+                if getters is None:
+                    serialized[field_name] = handler(obj)
+                    continue
+                try:
+                    value = getters[index](obj)
+                except lookup_error:
+                    value = getattr(self, field_name)(obj)
+                serialized[field_name] = handler(value)
             except AttributeError:
-                serialized_field_value = field.serialize()
-            serialized[field_name] = serialized_field_value
+                serialized[field_name] = field.serialize()
 
         return serialized
 
+    def _serialize_many(self, objs):
+        serialize_obj = self._serialize_obj
+        return [serialize_obj(obj_item) for obj_item in objs]
+
     def serialize(self):
         if self.obj is None:
             return None
 
         if self.multiple:
             if self.dict_format:
-                result = {}
-                for obj_item in self.obj:
-                    result[getattr(obj_item, self.dict_key)] = self._serialize_obj(
-                        obj_item
-                    )
+                objs = list(self.obj)
+                result = {
+                    getattr(obj_item, self.dict_key): serialized
+                    for obj_item, serialized in zip(objs, self._serialize_many(objs))
+                }
             else:
-                result = []
-                for obj_item in self.obj:
-                    result.append(self._serialize_obj(obj_item))
+                result = self._serialize_many(self.obj)
         else:
             if self.dict_format:
                 result = {
@@ -230,7 +321,18 @@ class ModelSerializer(Serializer, metaclass=ModelSerializerMeta):
 
 
 class MultiSerializer(Serializer):
+    """
+    Serializes every object by serializer class returned
+    from `get_serializer_class`.
+
+    If `grouped` is set, multiple objects are partitioned by serializer class
+    and every group is serialized by one serializer instance
+    built with `get_group_serializer_kwargs`, `prefetch_group` is called
+    for every group before. Order of objects is preserved.
+    """
+
     serializers = {}
+    grouped = False
 
     def get_serializer_class(self, obj, **kwargs):
         raise NotImplementedError
@@ -238,6 +340,38 @@ class MultiSerializer(Serializer):
     def get_serializer_kwargs(self, obj, **kwargs):
         return {"obj": obj}
 
+    def get_group_serializer_kwargs(self, serializer_class, objs, **kwargs):
+        return {"obj": objs, "multiple": True}
+
+    def prefetch_group(self, serializer_class, objs):
+        """
+        Called once for every group of objects in grouped mode.
+        Override to load related data of the group, e.g. by
+        `django.db.models.prefetch_related_objects`
+        """
+        pass
+
     def _serialize_obj(self, obj):
         serializer_class = self.get_serializer_class(obj)
         return serializer_class(**self.get_serializer_kwargs(obj)).serialize()
+
+    def _serialize_many(self, objs):
+        if not self.grouped:
+            return super()._serialize_many(objs)
+
+        objs = list(objs)
+        groups = {}
+        for index, obj_item in enumerate(objs):
+            serializer_class = self.get_serializer_class(obj_item)
+            groups.setdefault(serializer_class, []).append(index)
+
+        result = [None] * len(objs)
+        for serializer_class, indexes in groups.items():
+            group = [objs[index] for index in indexes]
+            self.prefetch_group(serializer_class, group)
+            serializer = serializer_class(
+                **self.get_group_serializer_kwargs(serializer_class, group)
+            )
+            for index, serialized in zip(indexes, serializer.serialize()):
+                result[index] = serialized
+        return result
@@ -1,3 +1,10 @@
+import copy
+import datetime
+
+import django
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
 from django_serializer.exceptions import SerializerFieldException
 
 
@@ -38,18 +45,63 @@ class CharField(Field):
         return str(value) if value is not None else None
 
 
-class DateField(Field):
+def to_timestamp(value) -> int:
+    """
+    Seconds since the Unix epoch, the same as
+    `django.utils.dateformat.format(value, "U")` without formatter pass.
+    Naive datetimes and dates are in the current time zone,
+    dates are taken at midnight.
+    """
+    if isinstance(value, datetime.datetime):
+        if django.VERSION < (4, 0):
+            # "U" format drops microseconds before Django 4.0
+            value = value.replace(microsecond=0)
+        return int(value.timestamp())
+    if isinstance(value, datetime.date):
+        return int(datetime.datetime.combine(value, datetime.time.min).timestamp())
+    from django.utils.dateformat import format
+
+    return int(format(value, "U"))
+
+
+class TimestampField(Field):
+    """
+    Serializes value to timestamp, `str` or `int` depending on
+    `timestamp_type` argument or SERIALIZER_TIMESTAMP_TYPE setting,
+    the setting is read on serialization
+    """
+
+    def __init__(self, *args, timestamp_type=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if timestamp_type is not None:
+            self._check_timestamp_type(timestamp_type)
+        self.timestamp_type = timestamp_type
+
+    @staticmethod
+    def _check_timestamp_type(timestamp_type):
+        if timestamp_type not in (str, int):
+            raise ImproperlyConfigured("timestamp type should be str or int")
+        return timestamp_type
+
     def serialization_handler(self, value):
-        from django.utils.dateformat import format
+        if value is None:
+            return None
+        timestamp_type = self.timestamp_type
+        if timestamp_type is None:
+            timestamp_type = self._check_timestamp_type(
+                getattr(settings, "SERIALIZER_TIMESTAMP_TYPE", str)
+            )
+        if timestamp_type is int:
+            return to_timestamp(value)
+        return str(to_timestamp(value))
 
-        return format(value, "U") if value is not None else None
 
+class DateField(TimestampField):
+    pass
 
-class DateTimeField(Field):
-    def serialization_handler(self, value):
-        from django.utils.dateformat import format
 
-        return format(value, "U") if value is not None else None
+class DateTimeField(TimestampField):
+    pass
 
 
 class TimeField(Field):
@@ -104,6 +156,16 @@ class SerializerField(Field):
         self.serializer = None
         super().__init__(**kwargs)
 
+    def bind(self, serializer):
+        """
+        Returns copy of the field bound to serializer instance.
+        Field declared on serializer class is shared between
+        threads and is never bound itself.
+        """
+        field = copy.copy(self)
+        field.serializer = serializer
+        return field
+
     def serialization_handler(self, obj):
         if callable(self.source):
             return self.source(obj)
@@ -0,0 +1,327 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from django.core.cache import caches
+from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.http import HttpResponse
+
+from django_serializer.v2.settings import settings
+
+__all__ = ("LocalCache", "SerializerCache", "CachedResponse", "ResponseCache")
+
+
+class LocalCache:
+    """
+    Thread safe in-process LRU cache with entries expiring after `timeout`
+
+    :param size: max number of entries
+    :param timeout: entry lifetime in seconds
+    """
+
+    def __init__(self, size: int, timeout: float):
+        self.size = size
+        self.timeout = timeout
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.timeout, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class SerializerCache:
+    """
+    Cache of serialized model instances keyed by
+    (serializer class, model, pk, version).
+
+    In-process LocalCache is checked first, misses are loaded from django
+    cache backend by a single `get_many`. Entries are deleted on post_save
+    and post_delete of the model. Other processes may serve local entries
+    until SERIALIZER_CACHE_LOCAL_TIMEOUT expires.
+
+    :param serializer_class: serializer class
+    :param model: serialized model
+    :param timeout: django cache timeout
+    :param version: django cache version, change it with serializer fields
+    """
+
+    def __init__(
+        self,
+        serializer_class: Type,
+        model: Type[models.Model],
+        timeout: Optional[int] = 300,
+        version: int = 1,
+    ):
+        self.model = model
+        self.timeout = timeout
+        self.version = version
+        self.prefix = (
+            f"django_serializer:{serializer_class.__module__}."
+            f"{serializer_class.__qualname__}:{model._meta.label_lower}"
+        )
+        self.local = LocalCache(
+            settings.SERIALIZER_CACHE_LOCAL_SIZE,
+            settings.SERIALIZER_CACHE_LOCAL_TIMEOUT,
+        )
+
+    @property
+    def backend(self):
+        return caches[settings.SERIALIZER_CACHE_ALIAS]
+
+    def make_key(self, pk) -> str:
+        return f"{self.prefix}:{pk}"
+
+    def connect(self):
+        """
+        Connects model signals invalidating cache
+        """
+        for signal in (post_save, post_delete):
+            dispatch_uid = f"{self.prefix}:{signal is post_save}"
+            # replace receiver of the same serializer class defined again
+            signal.disconnect(sender=self.model, dispatch_uid=dispatch_uid)
+            signal.connect(
+                self._invalidate_receiver,
+                sender=self.model,
+                weak=False,
+                dispatch_uid=dispatch_uid,
+            )
+
+    def _invalidate_receiver(self, sender, instance, **kwargs):
+        self.invalidate(instance.pk)
+
+    def invalidate(self, pk):
+        key = self.make_key(pk)
+        self.local.delete(key)
+        self.backend.delete(key, version=self.version)
+
+    def clear(self):
+        """
+        Clears in-process cache only
+        """
+        self.local.clear()
+
+    def dump(self, objs: List, dump: Callable[[List], List]) -> List:
+        """
+        Serializes objects using cached data where possible
+
+        :param objs: objects to serialize
+        :param dump: function serializing list of objects
+        :return: list of serialized objects in the same order
+        """
+        result = [None] * len(objs)
+        pending: Dict[str, List[int]] = {}
+        uncached = []
+        for index, obj in enumerate(objs):
+            if not isinstance(obj, self.model) or obj.pk is None:
+                uncached.append(index)
+                continue
+            key = self.make_key(obj.pk)
+            data = self.local.get(key)
+            if data is None:
+                pending.setdefault(key, []).append(index)
+            else:
+                result[index] = data
+
+        if pending:
+            found = self.backend.get_many(list(pending), version=self.version)
+            for key, data in found.items():
+                self.local.set(key, data)
+                for index in pending.pop(key):
+                    result[index] = data
+
+        missed = {index: key for key, indexes in pending.items() for index in indexes}
+        indexes = sorted(missed) + uncached
+        if not indexes:
+            return result
+
+        to_cache = {}
+        for index, data in zip(indexes, dump([objs[i] for i in indexes])):
+            result[index] = data
+            key = missed.get(index)
+            if key is not None:
+                to_cache[key] = data
+                self.local.set(key, data)
+        if to_cache:
+            self.backend.set_many(to_cache, timeout=self.timeout, version=self.version)
+        return result
+
+
+class CachedResponse(NamedTuple):
+    """
+    Rendered response stored by ResponseCache
+    """
+
+    generation: Optional[str]
+    expires: float
+    status: int
+    headers: List[Tuple[str, str]]
+    content: bytes
+
+    def is_fresh(self, generation: Optional[str]) -> bool:
+        return self.generation == generation and self.expires > time.time()
+
+    def to_response(self) -> HttpResponse:
+        response = HttpResponse(self.content, status=self.status)
+        for header, value in self.headers:
+            response[header] = value
+        return response
+
+
+class ResponseCache:
+    """
+    Cache of rendered view responses in django cache backend.
+
+    Entries are invalidated by changing generation of the view on post_save
+    and post_delete of `models`, entry of other generation is stale.
+    Stale and expired entries are kept for `stale_timeout` seconds,
+    one request revalidates such entry while others are served stale one.
+
+    :param view_class: cached view class
+    :param timeout: seconds entry is fresh
+    :param stale_timeout: seconds entry is served stale after invalidation
+    :param models: models invalidating cache
+    """
+
+    skip_headers = {"set-cookie", "server-timing"}
+
+    def __init__(
+        self,
+        view_class: Type,
+        timeout: int = 60,
+        stale_timeout: int = 0,
+        models: Collection[Type[models.Model]] = (),
+    ):
+        self.timeout = timeout
+        self.stale_timeout = stale_timeout
+        self.models = models
+        self.prefix = (
+            f"django_serializer:view:{view_class.__module__}."
+            f"{view_class.__qualname__}"
+        )
+        self.generation_key = f"{self.prefix}:generation"
+
+    @property
+    def backend(self):
+        return caches[settings.SERIALIZER_CACHE_ALIAS]
+
+    def make_key(self, digest: str) -> str:
+        return f"{self.prefix}:{digest}"
+
+    def connect(self):
+        """
+        Connects model signals invalidating cache
+        """
+        for model in self.models:
+            for signal in (post_save, post_delete):
+                dispatch_uid = f"{self.prefix}:{signal is post_save}"
+                signal.disconnect(sender=model, dispatch_uid=dispatch_uid)
+                signal.connect(
+                    self._invalidate_receiver,
+                    sender=model,
+                    weak=False,
+                    dispatch_uid=dispatch_uid,
+                )
+
+    def _invalidate_receiver(self, sender, **kwargs):
+        self.invalidate()
+
+    def invalidate(self):
+        self.backend.set(self.generation_key, uuid.uuid4().hex, timeout=None)
+
+    def get(self, key: str) -> Tuple[Optional[CachedResponse], Optional[str]]:
+        """
+        :return: cached entry or None, current generation
+        """
+        found = self.backend.get_many([key, self.generation_key])
+        return found.get(key), found.get(self.generation_key)
+
+    async def aget(self, key: str) -> Tuple[Optional[CachedResponse], Optional[str]]:
+        found = await self.backend.aget_many([key, self.generation_key])
+        return found.get(key), found.get(self.generation_key)
+
+    def is_cacheable(self, response: HttpResponse) -> bool:
+        return (
+            response.status_code == 200
+            and not response.streaming
+            and not response.cookies
+        )
+
+    def _entry(self, response: HttpResponse, generation: Optional[str]):
+        headers = [
+            (header, value)
+            for header, value in response.items()
+            if header.lower() not in self.skip_headers
+        ]
+        return CachedResponse(
+            generation,
+            time.time() + self.timeout,
+            response.status_code,
+            headers,
+            response.content,
+        )
+
+    def set(self, key: str, response: HttpResponse, generation: Optional[str]):
+        """
+        :param key: entry key
+        :param response: rendered response
+        :param generation: generation read before response was built
+        """
+        entry = self._entry(response, generation)
+        self.backend.set(key, entry, timeout=self.timeout + self.stale_timeout)
+
+    async def aset(self, key: str, response: HttpResponse, generation: Optional[str]):
+        entry = self._entry(response, generation)
+        await self.backend.aset(key, entry, timeout=self.timeout + self.stale_timeout)
+
+    def lock(self, key: str) -> bool:
+        """
+        :return: True if caller should revalidate entry
+        """
+        return self.backend.add(f"{key}:lock", 1, timeout=self.timeout)
+
+    async def alock(self, key: str) -> bool:
+        return await self.backend.aadd(f"{key}:lock", 1, timeout=self.timeout)
+
+    def unlock(self, key: str):
+        self.backend.delete(f"{key}:lock")
+
+    async def aunlock(self, key: str):
+        await self.backend.adelete(f"{key}:lock")
@@ -0,0 +1,182 @@
+import datetime
+import functools
+import operator
+import types
+from typing import Callable, Dict, List, Optional, Tuple
+
+from marshmallow import Schema, fields as mmfields
+from marshmallow.utils import ensure_text_type, missing
+
+__all__ = ("compile_dump", "compile_columns", "ordered_dump_fields")
+
+# Expressions inlining `Field._serialize` of well-known marshmallow fields.
+# `{v}` is the local holding attribute value, `{f}` is the field fallback.
+_INLINE_INT = "{v} if {v} is None else _int({v})"
+_INLINE_FLOAT = "{v} if {v} is None else _float({v})"
+_INLINE_STR = "{v} if {v} is None or {v}.__class__ is _str else _text({v})"
+_INLINE_BOOL = "{v} if {v} is None or {v} is True or {v} is False else {f}({v})"
+_INLINE_DATETIME = "{v} if {v} is None else {v}.isoformat()"
+_INLINE_DATE = "{v} if {v} is None else _date_isoformat({v})"
+
+_ISO_FORMATS = ("iso", "iso8601")
+
+_GLOBALS = {
+    "_int": int,
+    "_float": float,
+    "_str": str,
+    "_text": ensure_text_type,
+    "_date_isoformat": datetime.date.isoformat,
+    "_missing": missing,
+    "_attrgetter": operator.attrgetter,
+}
+
+
+def _inline_expression(field: mmfields.Field) -> Optional[str]:
+    field_class = type(field)
+    if field_class is mmfields.Integer and not field.as_string:
+        return _INLINE_INT
+    if field_class is mmfields.Float and not field.as_string:
+        return _INLINE_FLOAT
+    if field_class is mmfields.String:
+        return _INLINE_STR
+    if field_class is mmfields.Boolean:
+        return _INLINE_BOOL
+    if field_class is mmfields.DateTime and field.format in _ISO_FORMATS:
+        return _INLINE_DATETIME
+    if field_class is mmfields.Date and field.format in _ISO_FORMATS:
+        return _INLINE_DATE
+    return None
+
+
+def _exec(lines: List[str], name: str):
+    namespace = {}
+    exec(compile("\n".join(lines), f"<compiled {name}>", "exec"), namespace)
+    return namespace[name].__code__
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_dump_code(plan: Tuple[Tuple[str, str, Optional[str]], ...]):
+    """
+    Generates code of the dump function.
+    Plan depends only on serializer class and `only`/`exclude`,
+    so the code is compiled once and shared between instances.
+
+    :param plan: tuples of (attribute name, data key, inline expression)
+    :return: code object of `_dump(obj)` function
+    """
+    lines = [
+        "def _dump(obj):",
+        "    if not isinstance(obj, _model):",
+        "        return _generic(obj)",
+        "    ret = _dict()",
+    ]
+    for index, (attr_name, key, expression) in enumerate(plan):
+        if expression is None:
+            lines.append(f"    _v = _f{index}(obj)")
+            lines.append("    if _v is not _missing:")
+            lines.append(f"        ret[{key!r}] = _v")
+        else:
+            expression = expression.format(v="_v", f=f"_f{index}")
+            lines.append(f"    _v = obj.{attr_name}")
+            lines.append(f"    ret[{key!r}] = {expression}")
+    lines.append("    return ret")
+    return _exec(lines, "_dump")
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_columns_code(plan: Tuple[Tuple[str, str, Optional[str]], ...]):
+    """
+    Generates code of the function converting list of objects column by column.
+
+    :param plan: same as for `_compile_dump_code`
+    :return: code object of `_columns(objs)` function
+    """
+    lines = [
+        "def _columns(objs):",
+        "    ret = _dict()",
+    ]
+    for index, (attr_name, key, expression) in enumerate(plan):
+        if expression is None:
+            lines.append(f"    _c = map(_f{index}, objs)")
+            lines.append(
+                f"    ret[{key!r}] = [None if _v is _missing else _v for _v in _c]"
+            )
+        else:
+            expression = expression.format(v="_v", f=f"_f{index}")
+            lines.append(f"    _c = map(_attrgetter({attr_name!r}), objs)")
+            lines.append(f"    ret[{key!r}] = [{expression} for _v in _c]")
+    lines.append("    return ret")
+    return _exec(lines, "_columns")
+
+
+def ordered_dump_fields(schema: Schema) -> List[Tuple[str, mmfields.Field]]:
+    """
+    Dump fields in declaration order, `dump_fields` of not ordered
+    schema are unordered before marshmallow 3.15
+    """
+    return [
+        (name, schema.dump_fields[name])
+        for name in schema.declared_fields
+        if name in schema.dump_fields
+    ]
+
+
+def _build_plan(schema: Schema, model, dump_fields) -> Tuple[tuple, Dict]:
+    model_attnames = {f.attname for f in model._meta.fields}
+    custom_accessor = type(schema).get_attribute is not Schema.get_attribute
+
+    plan = []
+    namespace = dict(_GLOBALS, _model=model, _dict=schema.dict_class)
+    for index, (attr_name, field) in enumerate(dump_fields):
+        key = field.data_key if field.data_key is not None else attr_name
+        expression = None
+        if (
+            not custom_accessor
+            and field.attribute is None
+            and attr_name in model_attnames
+        ):
+            expression = _inline_expression(field)
+
+        if expression is None:
+            namespace[f"_f{index}"] = functools.partial(
+                field.serialize, attr_name, accessor=schema.get_attribute
+            )
+        else:
+            namespace[f"_f{index}"] = functools.partial(
+                field._serialize, attr=attr_name, obj=None
+            )
+        plan.append((attr_name, key, expression))
+    return tuple(plan), namespace
+
+
+def compile_dump(schema: Schema, model, generic: Callable) -> Callable:
+    """
+    Builds function serializing one object exactly as `Schema.dump` does.
+
+    Model fields of well-known marshmallow types are read directly
+    from instance attributes and converted inline, other fields
+    fall back to `Field.serialize`.
+    Objects which are not instances of `model` are passed to `generic`.
+
+    :param schema: serializer instance
+    :param model: model class from SMeta
+    :param generic: function serializing single object of any type
+    :return: dump function
+    """
+    plan, namespace = _build_plan(schema, model, schema.dump_fields.items())
+    namespace["_generic"] = generic
+    return types.FunctionType(_compile_dump_code(plan), namespace)
+
+
+def compile_columns(schema: Schema, model) -> Callable:
+    """
+    Builds function serializing list of `model` instances into columns,
+    dictionary of data key -> list of values in declaration order.
+    Values are the same as `Schema.dump` produces, missing values are None.
+
+    :param schema: serializer instance
+    :param model: model class from SMeta
+    :return: columns function
+    """
+    plan, namespace = _build_plan(schema, model, ordered_dump_fields(schema))
+    return types.FunctionType(_compile_columns_code(plan), namespace)
@@ -1,4 +1,4 @@
 from .base import ApiViewException
 from .conf import IncorrectMetaException, IncorrectSettingsException
 from .http import *
-from .parser import ParseException
+from .parser import ParseException, BodyTooLargeException, NestingTooDeepException
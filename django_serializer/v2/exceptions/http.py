@@ -6,9 +6,11 @@ __all__ = (
     "BadRequestError",
     "InternalServerError",
     "HttpFormError",
+    "HttpBulkFormError",
     "NotFoundError",
     "AuthRequiredError",
     "ForbiddenError",
+    "PayloadTooLargeError",
 )
 
 
@@ -59,6 +61,13 @@ class NotFoundError(HttpError):
         super().__init__(http_code=404, alias="not_found", description="Not Found")
 
 
+class PayloadTooLargeError(HttpError):
+    def __init__(self):
+        super().__init__(
+            http_code=413, alias="payload_too_large", description="Payload too large"
+        )
+
+
 class InternalServerError(HttpError):
     def __init__(self):
         super().__init__(
@@ -71,15 +80,39 @@ class HttpFormError(BadRequestError):
         self.form = form
         super().__init__()
 
-        self.field_problems = {}
-        for field, error in self.form.errors.items():
+        self.field_problems = self.get_field_problems(form)
+
+    @staticmethod
+    def get_field_problems(form) -> dict:
+        field_problems = {}
+        for field, error in form.errors.items():
             problems = []
             for data_item in error.data:
                 for message in data_item.messages:
                     problems.append(message)
-            self.field_problems[field] = problems
+            field_problems[field] = problems
+        return field_problems
 
     def get_dict(self):
         d = super().get_dict()
         d["field_problems"] = self.field_problems
         return d
+
+
+class HttpBulkFormError(HttpFormError):
+    """
+    Errors of many forms validated at once
+
+    :param forms: forms of request items, field_problems are keyed
+        by index of invalid item
+    """
+
+    def __init__(self, forms):
+        self.forms = forms
+        BadRequestError.__init__(self)
+
+        self.field_problems = {
+            index: self.get_field_problems(form)
+            for index, form in enumerate(forms)
+            if form.errors
+        }
@@ -3,3 +3,11 @@ from .base import ApiViewException
 
 class ParseException(ApiViewException):
     pass
+
+
+class BodyTooLargeException(ParseException):
+    pass
+
+
+class NestingTooDeepException(ParseException):
+    pass
@@ -0,0 +1,97 @@
+import json
+from json import JSONDecodeError
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from django_serializer.v2.exceptions import ParseException
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = (
+    "JsonBackend",
+    "StdJsonBackend",
+    "OrjsonBackend",
+    "std_backend",
+    "fast_backend",
+)
+
+
+class JsonBackend:
+    """
+    Base class for json encoding and decoding libraries
+    """
+
+    def dumps(self, data, primitive: bool = False) -> bytes:
+        """
+        Implemented in subclasses
+
+        :param data: data to encode
+        :param primitive: data contains only dicts, lists, strings, numbers,
+            booleans and None, encoder hook for other types is not used
+        :return: utf-8 encoded json
+        """
+        raise NotImplementedError
+
+    def loads(self, data: bytes):
+        """
+        Implemented in subclasses. If you cannot decode data raise ParseException
+
+        :param data: utf-8 encoded json
+        :return: decoded data
+        """
+        raise NotImplementedError
+
+
+class StdJsonBackend(JsonBackend):
+    """
+    Standard json library, not primitive data is encoded by DjangoJSONEncoder
+    """
+
+    def dumps(self, data, primitive: bool = False) -> bytes:
+        if primitive:
+            return json.dumps(data).encode()
+        return json.dumps(data, cls=DjangoJSONEncoder).encode()
+
+    def loads(self, data: bytes):
+        try:
+            return json.loads(data)
+        except (JSONDecodeError, UnicodeDecodeError, RecursionError):
+            raise ParseException
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    orjson library, requires `orjson` package.
+
+    Output is compact and not ascii escaped. Not primitive data is encoded
+    by DjangoJSONEncoder, datetimes are passed to it to keep their format.
+    """
+
+    _default = DjangoJSONEncoder().default
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonBackend requires orjson package")
+
+    def dumps(self, data, primitive: bool = False) -> bytes:
+        if primitive:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        return orjson.dumps(
+            data,
+            default=self._default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+
+    def loads(self, data: bytes):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            raise ParseException
+
+
+std_backend = StdJsonBackend()
+# orjson if installed, standard json library otherwise
+fast_backend = std_backend if orjson is None else OrjsonBackend()
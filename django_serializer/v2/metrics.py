@@ -0,0 +1,155 @@
+import functools
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+from typing import Dict, Optional
+
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+__all__ = (
+    "StageTiming",
+    "StageTimer",
+    "BaseMetricsSink",
+    "LoggingMetricsSink",
+    "get_metrics_sink",
+)
+
+
+class StageTiming:
+    """
+    Duration and SQL queries of a single view stage
+
+    :param name: stage name
+    """
+
+    __slots__ = ("name", "duration", "queries", "sql_duration")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.duration = 0.0
+        self.queries = 0
+        self.sql_duration = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "duration": self.duration,
+            "queries": self.queries,
+            "sql_duration": self.sql_duration,
+        }
+
+
+class StageTimer:
+    """
+    Measures view stages. Durations are in seconds.
+
+    SQL queries are counted by `connection.execute_wrapper` while
+    `capture_sql` is active. Connections are thread local,
+    so queries made by async ORM in other threads are not captured.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, StageTiming] = {}
+        self._current: Optional[StageTiming] = None
+
+    @contextmanager
+    def stage(self, name: str):
+        timing = self.stages.get(name)
+        if timing is None:
+            timing = self.stages[name] = StageTiming(name)
+        previous, self._current = self._current, timing
+        start = time.perf_counter()
+        try:
+            yield timing
+        finally:
+            timing.duration += time.perf_counter() - start
+            self._current = previous
+
+    def _execute_wrapper(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            timing = self._current
+            if timing is not None:
+                timing.queries += 1
+                timing.sql_duration += time.perf_counter() - start
+
+    @contextmanager
+    def capture_sql(self):
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(self._execute_wrapper))
+            yield
+
+    @property
+    def total(self) -> float:
+        return sum(timing.duration for timing in self.stages.values())
+
+    def as_dict(self) -> Dict[str, dict]:
+        return {name: timing.as_dict() for name, timing in self.stages.items()}
+
+    def server_timing(self) -> str:
+        """
+        Value of `Server-Timing` header, durations in milliseconds.
+        Stages with queries have extra `<stage>.sql` metric.
+        """
+        metrics = []
+        for name, timing in self.stages.items():
+            metrics.append(f"{name};dur={timing.duration * 1000:.3f}")
+            if timing.queries:
+                metrics.append(
+                    f"{name}.sql;dur={timing.sql_duration * 1000:.3f};"
+                    f'desc="{timing.queries} queries"'
+                )
+        return ", ".join(metrics)
+
+
+class BaseMetricsSink:
+    """
+    Receives stage timings of every request, see SERIALIZER_METRICS_SINK
+    """
+
+    def send(
+        self,
+        view,
+        request: HttpRequest,
+        response: Optional[HttpResponse],
+        timer: StageTimer,
+    ):
+        """
+        Implemented in subclasses
+
+        :param view: ApiView instance
+        :param request: HttpRequest
+        :param response: HttpResponse, None if it is not rendered
+        :param timer: StageTimer with measured stages
+        """
+        raise NotImplementedError
+
+
+class LoggingMetricsSink(BaseMetricsSink):
+    """
+    Logs stage timings to `django_serializer.metrics` logger
+    """
+
+    logger = logging.getLogger("django_serializer.metrics")
+
+    def send(self, view, request, response, timer):
+        stages = " ".join(
+            f"{name}={timing.duration * 1000:.3f}ms/{timing.queries}q"
+            for name, timing in timer.stages.items()
+        )
+        self.logger.info(
+            f"{view.__class__.__name__} {request.path} "
+            f"total={timer.total * 1000:.3f}ms {stages}",
+            extra={"view": view.__class__.__name__, "timings": timer.as_dict()},
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def get_metrics_sink(sink_class: type) -> BaseMetricsSink:
+    """
+    Sink instance shared by all requests
+    """
+    return sink_class()
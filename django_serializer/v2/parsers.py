@@ -1,7 +1,62 @@
+import codecs
 import json
+import re
 from json import JSONDecodeError
+from typing import BinaryIO, Iterator, Optional
 
-from django_serializer.v2.exceptions import ParseException
+from django_serializer.v2.exceptions import (
+    BodyTooLargeException,
+    NestingTooDeepException,
+    ParseException,
+)
+from django_serializer.v2.json_backends import JsonBackend, fast_backend, std_backend
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_ITEM_END = re.compile(r"[ \t\n\r,\]]")
+# longest token which may be cut by the end of the text, surrogate pair escape
+_INCOMPLETE_TOKEN = len("\\ud83d\\ude00")
+
+
+def read_chunks(
+    stream: BinaryIO, max_size: Optional[int] = None, chunk_size: int = 64 * 1024
+) -> Iterator[bytes]:
+    """
+    Reads stream by chunks
+
+    :param stream: file-like object, e.g. HttpRequest
+    :param max_size: max number of bytes, None for unlimited
+    :param chunk_size: number of bytes read at once
+    :raise BodyTooLargeException: as soon as stream exceeds max_size
+    """
+    size = 0
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        size += len(chunk)
+        if max_size is not None and size > max_size:
+            raise BodyTooLargeException
+        yield chunk
+
+
+def check_depth(value, max_depth: int):
+    """
+    Checks nesting of dicts and lists, scalar value has depth 0
+
+    :raise NestingTooDeepException: if value is nested deeper than max_depth
+    """
+    stack = [(value, 1)]
+    while stack:
+        value, depth = stack.pop()
+        if isinstance(value, dict):
+            children = value.values()
+        elif isinstance(value, list):
+            children = value
+        else:
+            continue
+        if depth > max_depth:
+            raise NestingTooDeepException
+        stack.extend((child, depth + 1) for child in children)
 
 
 class BaseParser:
@@ -9,9 +64,12 @@ class BaseParser:
     Base class for any parser.
 
     Can be extended to use custom parsing logic.
-    Do it to use custom json parsing library such as orjson or ultrajson
+    Do it to use custom json parsing library such as orjson or ultrajson.
+    Instance is shared by all requests of a view, do not keep request state in it
     """
 
+    chunk_size: int = 64 * 1024
+
     def parse(self, data: bytes):
         """
         Implemented in subclass. If you cannot parse data raise ParseException
@@ -21,14 +79,174 @@ class BaseParser:
         """
         raise NotImplementedError
 
+    def parse_stream(
+        self,
+        stream: BinaryIO,
+        max_size: Optional[int] = None,
+        max_depth: Optional[int] = None,
+    ):
+        """
+        Parses file-like stream, e.g. HttpRequest.
+        Default implementation reads whole stream and calls parse
+
+        :param stream: file-like object
+        :param max_size: max number of bytes, None for unlimited
+        :param max_depth: max nesting of parsed value, None for unlimited
+        :return: parsed value
+        """
+        data = b"".join(read_chunks(stream, max_size, self.chunk_size))
+        value = self.parse(data)
+        if max_depth is not None:
+            check_depth(value, max_depth)
+        return value
+
+    def iter_stream(
+        self,
+        stream: BinaryIO,
+        max_size: Optional[int] = None,
+        max_depth: Optional[int] = None,
+    ) -> Iterator:
+        """
+        Iterates items of top level list of file-like stream.
+        Default implementation parses whole stream
+
+        :param stream: file-like object
+        :param max_size: max number of bytes, None for unlimited
+        :param max_depth: max nesting of parsed list, None for unlimited
+        :return: iterator of list items
+        """
+        value = self.parse_stream(stream, max_size, max_depth)
+        if not isinstance(value, list):
+            raise ParseException
+        return iter(value)
+
+
+class _TextBuffer:
+    """
+    Text decoded from chunks of bytes, consumed text is dropped on fill
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: int = 0) -> bool:
+        """
+        Reads at least one chunk, more until not consumed text
+        is longer than `size`
+
+        :return: False if stream is over
+        """
+        if self.eof:
+            return False
+        parts = [self.text[self.pos :]]
+        length = len(parts[0])
+        while True:
+            chunk = next(self._chunks, None)
+            self.eof = chunk is None
+            try:
+                text = self._decoder.decode(chunk or b"", self.eof)
+            except UnicodeDecodeError:
+                raise ParseException
+            parts.append(text)
+            length += len(text)
+            if self.eof or length > size:
+                break
+        self.text = "".join(parts)
+        self.pos = 0
+        return True
+
+    def peek(self) -> Optional[str]:
+        """
+        :return: next non whitespace char, None if stream is over
+        """
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return None
+
 
 class JsonParser(BaseParser):
     """
-    Parses using standard json library.
+    Parses by `backend`, standard json library by default.
+
+    `iter_stream` decodes top level array item by item by standard
+    json library, so only current chunk of the body and decoded items
+    are kept in memory.
     """
 
+    backend: JsonBackend = std_backend
+
     def parse(self, data: bytes):
-        try:
-            return json.loads(data)
-        except JSONDecodeError:
+        return self.backend.loads(data)
+
+    def iter_stream(self, stream, max_size=None, max_depth=None) -> Iterator:
+        buffer = _TextBuffer(read_chunks(stream, max_size, self.chunk_size))
+        decoder = json.JSONDecoder()
+        if buffer.peek() != "[":
+            raise ParseException
+        if max_depth is not None and max_depth < 1:
+            raise NestingTooDeepException
+        buffer.pos += 1
+        if buffer.peek() == "]":
+            buffer.pos += 1
+        else:
+            while True:
+                yield self._decode_item(buffer, decoder, max_depth)
+                char = buffer.peek()
+                buffer.pos += 1
+                if char == "]":
+                    break
+                if char != ",":
+                    raise ParseException
+        if buffer.peek() is not None:
             raise ParseException
+
+    @staticmethod
+    def _decode_item(buffer: _TextBuffer, decoder, max_depth: Optional[int]):
+        """
+        Item is decoded again from its start when it continues in next chunks,
+        buffered text is at least doubled before every retry,
+        so large items are decoded in linear time
+        """
+        while True:
+            if buffer.peek() is None:
+                raise ParseException
+            # not consumed text is doubled by the next fill
+            size = 2 * (len(buffer.text) - buffer.pos)
+            try:
+                item, end = decoder.raw_decode(buffer.text, buffer.pos)
+            except JSONDecodeError as e:
+                # only the last token may be cut by the end of text,
+                # unterminated string is reported at its start
+                cut = len(buffer.text) - e.pos <= _INCOMPLETE_TOKEN
+                if not (cut or e.msg.startswith("Unterminated string")):
+                    raise ParseException
+                if not buffer.fill(size):
+                    raise ParseException
+                continue
+            except RecursionError:
+                if not buffer.fill(size):
+                    raise ParseException
+                continue
+            # value not followed by separator may be incomplete,
+            # e.g. a number split by chunks after the decimal point
+            if not _ITEM_END.match(buffer.text, end) and buffer.fill(size):
+                continue
+            buffer.pos = end
+            if max_depth is not None:
+                check_depth(item, max_depth - 1)
+            return item
+
+
+class FastJsonParser(JsonParser):
+    """
+    JsonParser using orjson if it is installed
+    """
+
+    backend = fast_backend
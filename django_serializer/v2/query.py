@@ -0,0 +1,354 @@
+from typing import Collection, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import ForeignObjectRel, Prefetch, QuerySet
+from marshmallow import Schema, class_registry, fields as mmfields
+from marshmallow.exceptions import RegistryError
+
+from django_serializer.v2.serializer_fields import BatchedNested
+
+__all__ = (
+    "QueryPlan",
+    "plan_queryset",
+    "get_dump_fields",
+    "BatchLoader",
+    "afetch",
+)
+
+
+def _nested_schema(
+    field: mmfields.Field, parent: Type[Schema]
+) -> Tuple[Optional[Type[Schema]], Optional[Set[str]]]:
+    """
+    Resolves schema class dumped by Nested (or List of Nested) field
+
+    :return: schema class and names of its dumped fields, if limited by `only`
+    """
+    if isinstance(field, mmfields.List):
+        field = field.inner
+    if not isinstance(field, mmfields.Nested):
+        return None, None
+
+    nested = field.nested
+    if callable(nested) and not isinstance(nested, type):
+        nested = nested()
+    if isinstance(nested, str):
+        if nested == "self":
+            nested = parent
+        else:
+            try:
+                nested = class_registry.get_class(nested)
+            except RegistryError:
+                return None, None
+    if isinstance(nested, Schema):
+        nested = type(nested)
+    if not (isinstance(nested, type) and issubclass(nested, Schema)):
+        return None, None
+
+    only = None
+    if field.only is not None:
+        only = {name.split(".", 1)[0] for name in field.only}
+    return nested, only
+
+
+def _get_field(model: Type[models.Model], name: str):
+    """
+    Finds model field by name, attname or reverse relation accessor name
+    """
+    try:
+        field = model._meta.get_field(name)
+        if not isinstance(field, ForeignObjectRel):
+            return field
+    except FieldDoesNotExist:
+        pass
+    # reverse relations are looked up by query name, but accessed by accessor
+    for related_object in model._meta.related_objects:
+        if related_object.get_accessor_name() == name:
+            return related_object
+    return None
+
+
+def get_dump_fields(
+    schema_class: Type[Schema],
+    only: Optional[Collection[str]] = None,
+    exclude: Collection[str] = (),
+) -> Iterable[Tuple[str, mmfields.Field]]:
+    """
+    Declared fields dumped by schema class
+
+    :param schema_class: schema class
+    :param only: names of fields to dump
+    :param exclude: names of fields to skip
+    :return: iterable of (name, field)
+    """
+    opts = schema_class.opts
+    for name, field in schema_class._declared_fields.items():
+        if field.load_only or name in opts.load_only or name in opts.exclude:
+            continue
+        if opts.fields and name not in opts.fields:
+            continue
+        if (only is not None and name not in only) or name in exclude:
+            continue
+        yield name, field
+
+
+class QueryPlan:
+    """
+    Describes queryset optimizations required to dump it with serializer.
+
+    Serializer fields are matched with model fields by name or `attribute`.
+    Dotted attributes and Nested fields crossing to-one relations
+    become select_related, crossing to-many relations become Prefetch
+    with own plan. Columns are collected for only(), any field which
+    can not be matched requires all model columns, as well as fields.Method
+    and fields.Function, which read object regardless of their name.
+
+    :param serializer_class: serializer used to dump queryset items
+    :param model: queryset model
+    :param only: names of serializer fields to dump
+    :param exclude: names of serializer fields to skip
+    :param _stack: nesting of schemas, internal use only
+    """
+
+    def __init__(
+        self,
+        serializer_class: Optional[Type[Schema]],
+        model: Type[models.Model],
+        only: Optional[Collection[str]] = None,
+        exclude: Collection[str] = (),
+        _stack: Optional[List] = None,
+    ):
+        self.model = model
+        self.select_related: Set[str] = set()
+        self.prefetch_related: Dict[str, QueryPlan] = {}
+        self._models: Dict[str, Type[models.Model]] = {"": model}
+        self._columns: Set[str] = set()
+        self._all_columns: Set[str] = set()
+        self._stack: List[Tuple[Type[Schema], Type[models.Model]]] = (
+            [] if _stack is None else _stack
+        )
+        if serializer_class is not None:
+            self._walk_schema(serializer_class, only, model, "", exclude)
+
+    @property
+    def columns(self) -> Optional[Set[str]]:
+        """
+        Columns for only(), None if all columns are required
+        """
+        if set(self._models) == self._all_columns:
+            return None
+        columns = set(self._columns)
+        for prefix in self._all_columns:
+            model = self._models[prefix]
+            columns.update(prefix + f.attname for f in model._meta.concrete_fields)
+        return columns
+
+    def _walk_schema(
+        self,
+        schema_class: Type[Schema],
+        only: Optional[Collection[str]],
+        model: Type[models.Model],
+        prefix: str,
+        exclude: Collection[str] = (),
+    ):
+        if (schema_class, model) in self._stack:
+            # recursive nesting can not be planned
+            self._all_columns.add(prefix)
+            return
+        self._stack.append((schema_class, model))
+        for name, field in get_dump_fields(schema_class, only, exclude):
+            if isinstance(field, BatchedNested):
+                # loaded by BatchLoader on dump
+                self._columns.add(prefix + field.model_field.attname)
+                continue
+            if isinstance(field, mmfields.Constant):
+                continue
+            if not field._CHECK_ATTRIBUTE:
+                # Method and Function are not bound to attribute
+                self._all_columns.add(prefix)
+                continue
+            nested = _nested_schema(field, schema_class)
+            path = (field.attribute or name).split(".")
+            if not self._walk_path(path, nested, model, prefix):
+                self._all_columns.add(prefix)
+        self._stack.pop()
+
+    def _walk_path(
+        self,
+        path: List[str],
+        nested: Tuple[Optional[Type[Schema]], Optional[Set[str]]],
+        model: Type[models.Model],
+        prefix: str,
+    ) -> bool:
+        for index, name in enumerate(path):
+            model_field = _get_field(model, name)
+            if model_field is None:
+                return False
+
+            if (
+                not model_field.is_relation
+                or model_field.concrete
+                and name == model_field.attname != model_field.name
+            ):
+                # plain column or foreign key attname
+                self._columns.add(prefix + model_field.attname)
+                return True
+            if model_field.related_model is None:
+                return False
+
+            rest = path[index + 1 :]
+            related_model = model_field.related_model
+            if model_field.many_to_many or model_field.one_to_many:
+                self._plan_prefetch(model_field, rest, nested, prefix + name)
+                return True
+
+            if model_field.concrete:
+                self._columns.add(prefix + name)
+            self.select_related.add(prefix + name)
+            model, prefix = related_model, f"{prefix}{name}__"
+            self._models[prefix] = model
+
+        schema_class, only = nested
+        if schema_class is None:
+            self._all_columns.add(prefix)
+        else:
+            self._walk_schema(schema_class, only, model, prefix)
+        return True
+
+    def _plan_prefetch(self, model_field, path: List[str], nested, lookup: str):
+        related_model = model_field.related_model
+        plan = QueryPlan(None, related_model, _stack=self._stack)
+        if path:
+            if not plan._walk_path(path, nested, related_model, ""):
+                plan._all_columns.add("")
+        elif nested[0] is not None:
+            plan._walk_schema(nested[0], nested[1], related_model, "")
+        else:
+            plan._all_columns.add("")
+        if model_field.one_to_many:
+            # prefetch joins objects by remote foreign key
+            plan._columns.add(model_field.field.attname)
+        self.prefetch_related[lookup] = plan
+
+    def apply(
+        self, qs: QuerySet, prune_columns: bool = True, relations: bool = True
+    ) -> QuerySet:
+        """
+        Applies plan to the queryset
+
+        :param qs: queryset of plan model
+        :param prune_columns: use only() with collected columns
+        :param relations: use select_related and prefetch_related
+        :return: new queryset
+        """
+        if relations and self.select_related:
+            qs = qs.select_related(*sorted(self.select_related))
+        if relations:
+            for lookup, plan in self.prefetch_related.items():
+                related_qs = plan.apply(
+                    plan.model._default_manager.all(), prune_columns=prune_columns
+                )
+                qs = qs.prefetch_related(Prefetch(lookup, queryset=related_qs))
+        columns = self.columns if prune_columns else None
+        if columns and not relations:
+            columns = {c for c in columns if "__" not in c}
+        if columns:
+            qs = qs.only(*sorted(columns))
+        return qs
+
+
+def plan_queryset(
+    qs: QuerySet,
+    serializer_class: Optional[Type[Schema]],
+    prune_columns: bool = True,
+    plan_relations: bool = True,
+    only: Optional[Collection[str]] = None,
+    exclude: Collection[str] = (),
+    columns: Collection[str] = (),
+) -> QuerySet:
+    """
+    Optimizes queryset to be dumped by serializer, see QueryPlan
+
+    :param qs: queryset
+    :param serializer_class: serializer used to dump queryset items
+    :param prune_columns: load only columns read by serializer
+    :param plan_relations: add select_related and prefetch_related
+    :param only: names of serializer fields to dump
+    :param exclude: names of serializer fields to skip
+    :param columns: model columns loaded in addition to serialized ones
+    :return: new queryset
+    """
+    if not isinstance(serializer_class, type) or not (prune_columns or plan_relations):
+        return qs
+    plan = QueryPlan(serializer_class, qs.model, only=only, exclude=exclude)
+    plan._columns.update(columns)
+    return plan.apply(qs, prune_columns=prune_columns, relations=plan_relations)
+
+
+class BatchLoader:
+    """
+    DataLoader-style resolver of foreign keys.
+
+    Foreign key values of many objects are collected by `add`,
+    `load` fetches them with one in_bulk per related model and target field.
+    Relations already cached on objects (e.g. by select_related)
+    are not loaded again.
+    """
+
+    def __init__(self):
+        self._pending: Dict[Tuple[Type[models.Model], str], Set] = {}
+        self._loaded: Dict[Tuple[Type[models.Model], str], Dict] = {}
+
+    @staticmethod
+    def _key(model_field) -> Tuple[Type[models.Model], str]:
+        return model_field.related_model, model_field.target_field.name
+
+    def add(self, model_field, obj: models.Model):
+        """
+        :param model_field: ForeignKey or OneToOneField of obj model
+        :param obj: model instance
+        """
+        value = getattr(obj, model_field.attname)
+        if value is None:
+            return
+        key = self._key(model_field)
+        if model_field.is_cached(obj):
+            instance = model_field.get_cached_value(obj)
+            if instance is not None:
+                self._loaded.setdefault(key, {})[value] = instance
+                return
+        self._pending.setdefault(key, set()).add(value)
+
+    def load(self):
+        for (model, field_name), values in self._pending.items():
+            loaded = self._loaded.setdefault((model, field_name), {})
+            values = values.difference(loaded)
+            if values:
+                loaded.update(
+                    model._base_manager.in_bulk(values, field_name=field_name)
+                )
+        self._pending.clear()
+
+    def get(self, model_field, value) -> Optional[models.Model]:
+        """
+        :return: loaded related instance, None if not found
+        """
+        return self._loaded.get(self._key(model_field), {}).get(value)
+
+
+async def afetch(value):
+    """
+    Evaluates querysets by async iteration, also inside dicts, lists and tuples.
+    Other values are returned as is.
+
+    :param value: queryset or container with querysets
+    :return: value with querysets replaced by lists of objects
+    """
+    if isinstance(value, QuerySet):
+        return [item async for item in value]
+    if isinstance(value, dict):
+        return {key: await afetch(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)([await afetch(item) for item in value])
+    return value
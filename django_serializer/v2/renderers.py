@@ -1,13 +1,53 @@
-from django.http import HttpResponse, JsonResponse
+import gzip
+import zlib
+from typing import AsyncIterable, Iterable, Optional
 
-__all__ = ("BaseRenderer", "JsonRenderer")
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+
+from django_serializer.v2.json_backends import JsonBackend, fast_backend, std_backend
+
+__all__ = (
+    "BaseRenderer",
+    "JsonRenderer",
+    "FastJsonRenderer",
+    "PrimitiveJsonRenderer",
+    "GzipRendererMixin",
+    "GzipJsonRenderer",
+)
+
+
+def accepts_encoding(request: HttpRequest, encoding: str) -> bool:
+    """
+    Checks request Accept-Encoding allows encoding, `q=0` forbids it
+
+    :param request: HttpRequest
+    :param encoding: content coding, e.g. gzip
+    """
+    accepted = {}
+    for item in request.headers.get("Accept-Encoding", "").split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    quality = accepted.get(encoding, accepted.get("*", 0.0))
+    return quality > 0
 
 
 class BaseRenderer:
     """
-    Base class for any renderer
+    Base class for any renderer.
+    Instance is shared by all requests of a view, do not keep request state in it
     """
 
+    # content type of rendered responses, also used for HEAD responses
+    content_type: Optional[str] = None
+
     def render(self, data: dict) -> HttpResponse:
         """
         Implemented in subclasses
@@ -17,11 +57,210 @@ class BaseRenderer:
         """
         raise NotImplementedError
 
+    def render_chunks(self, data: dict, key: str = "data") -> HttpResponse:
+        """
+        Implemented in subclasses supporting rendering by chunks
+
+        :param data: input dictionary. `data[key]` is iterable of lists
+            which are rendered as a single list
+        :param key: key of rendered list
+        :return: HttpResponse instance to answer to HttpRequest
+        """
+        raise NotImplementedError
+
+    def render_stream(self, data: dict, key: str = "data") -> StreamingHttpResponse:
+        """
+        Implemented in subclasses supporting streaming
+
+        :param data: input dictionary. `data[key]` is iterable of lists
+            which are rendered as a single list
+        :param key: key of streamed list
+        :return: StreamingHttpResponse instance to answer to HttpRequest
+        """
+        raise NotImplementedError
+
+    def render_astream(self, data: dict, key: str = "data") -> StreamingHttpResponse:
+        """
+        Implemented in subclasses supporting asynchronous streaming
+
+        :param data: input dictionary. `data[key]` is async iterable of lists
+            which are rendered as a single list
+        :param key: key of streamed list
+        :return: StreamingHttpResponse instance to answer to HttpRequest
+        """
+        raise NotImplementedError
+
+    def encode(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        """
+        Applies content coding negotiated with request to rendered response.
+        Default implementation returns response as is
+
+        :param request: HttpRequest
+        :param response: HttpResponse returned by render methods or error handler
+        :return: HttpResponse instance to answer to HttpRequest
+        """
+        return response
+
 
 class JsonRenderer(BaseRenderer):
     """
-    Renders dict to JsonResponse
+    Renders dict to json response by `backend`, standard json library by default.
+
+    If `primitive` is set, data must contain only dicts, lists, strings,
+    numbers, booleans and None, as returned by serializers.
     """
 
+    content_type: Optional[str] = "application/json"
+    backend: JsonBackend = std_backend
+    primitive: bool = False
+
     def render(self, data: dict) -> HttpResponse:
-        return JsonResponse(data=data)
+        return HttpResponse(self._encode(data), content_type=self.content_type)
+
+    def render_chunks(self, data: dict, key: str = "data") -> HttpResponse:
+        """
+        Joins encoded chunks once, chunks are released
+        as soon as they are encoded
+        """
+        content = b"".join(self._stream_content(data, key))
+        return HttpResponse(content, content_type=self.content_type)
+
+    def render_stream(self, data: dict, key: str = "data") -> StreamingHttpResponse:
+        return StreamingHttpResponse(
+            self._stream_content(data, key), content_type=self.content_type
+        )
+
+    def render_astream(self, data: dict, key: str = "data") -> StreamingHttpResponse:
+        return StreamingHttpResponse(
+            self._astream_content(data, key), content_type=self.content_type
+        )
+
+    def _encode(self, data) -> bytes:
+        return self.backend.dumps(data, self.primitive)
+
+    def _stream_head(self, data: dict, key: str) -> bytes:
+        head = self._encode(data)[:-1]
+        if data:
+            head += b", "
+        return head + self._encode(key) + b": ["
+
+    def _encode_chunk(self, chunk: list, separator: str) -> bytes:
+        return separator.encode() + self._encode(chunk)[1:-1]
+
+    def _stream_content(self, data: dict, key: str) -> Iterable[bytes]:
+        data = dict(data)
+        chunks = data.pop(key)
+        yield self._stream_head(data, key)
+
+        separator = ""
+        for chunk in chunks:
+            if chunk:
+                yield self._encode_chunk(chunk, separator)
+                separator = ", "
+        yield b"]}"
+
+    async def _astream_content(self, data: dict, key: str) -> AsyncIterable[bytes]:
+        data = dict(data)
+        chunks = data.pop(key)
+        yield self._stream_head(data, key)
+
+        separator = ""
+        async for chunk in chunks:
+            if chunk:
+                yield self._encode_chunk(chunk, separator)
+                separator = ", "
+        yield b"]}"
+
+
+class FastJsonRenderer(JsonRenderer):
+    """
+    JsonRenderer using orjson if it is installed
+    """
+
+    backend = fast_backend
+
+
+class PrimitiveJsonRenderer(FastJsonRenderer):
+    """
+    FastJsonRenderer without encoder hook for not primitive data.
+    Views must return serialized data, e.g. by Meta.serializer
+    """
+
+    primitive = True
+
+
+class GzipRendererMixin:
+    """
+    Compresses rendered responses by gzip if request Accept-Encoding allows it.
+
+    Bodies smaller than `compress_min_size` bytes are sent as is,
+    streamed bodies are compressed by chunks and flushed after each of them.
+    Subclass to change `compress_min_size` and `compress_level`.
+    """
+
+    compress_min_size: int = 1024
+    compress_level: int = 6
+
+    def _compressor(self):
+        # wbits=31 writes gzip header and trailer
+        return zlib.compressobj(self.compress_level, zlib.DEFLATED, 31)
+
+    def _compress_stream(self, content: Iterable[bytes]) -> Iterable[bytes]:
+        compressor = self._compressor()
+        for chunk in content:
+            data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            if data:
+                yield data
+        yield compressor.flush()
+
+    async def _acompress_stream(
+        self, content: AsyncIterable[bytes]
+    ) -> AsyncIterable[bytes]:
+        compressor = self._compressor()
+        async for chunk in content:
+            data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            if data:
+                yield data
+        yield compressor.flush()
+
+    def encode(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        response = super().encode(request, response)
+        if response.status_code in (204, 304) or response.has_header(
+            "Content-Encoding"
+        ):
+            return response
+        if not response.streaming and len(response.content) < self.compress_min_size:
+            return response
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if not accepts_encoding(request, "gzip"):
+            return response
+
+        if response.streaming:
+            # StreamingHttpResponse.is_async is available since Django 4.2
+            if getattr(response, "is_async", False):
+                content = self._acompress_stream(response.streaming_content)
+            else:
+                content = self._compress_stream(response.streaming_content)
+            response.streaming_content = content
+            del response["Content-Length"]
+        else:
+            compressed = gzip.compress(
+                response.content, compresslevel=self.compress_level, mtime=0
+            )
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response["Content-Length"] = str(len(compressed))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            # compressed body is not byte equal to uncompressed one
+            response["ETag"] = f"W/{etag}"
+        response["Content-Encoding"] = "gzip"
+        return response
+
+
+class GzipJsonRenderer(GzipRendererMixin, JsonRenderer):
+    """
+    JsonRenderer compressing responses by gzip, see GzipRendererMixin
+    """
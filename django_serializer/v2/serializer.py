@@ -1,23 +1,64 @@
-from typing import Type, Set
+import functools
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Type, Set
 
 from django.db import models
-from marshmallow import Schema
+from marshmallow import Schema, fields as mmfields
+from marshmallow.decorators import POST_DUMP, PRE_DUMP
 from marshmallow.schema import SchemaMeta
 
+from django_serializer.v2.cache import SerializerCache
+from django_serializer.v2.compiler import (
+    compile_columns,
+    compile_dump,
+    ordered_dump_fields,
+)
 from django_serializer.v2.exceptions import (
     IncorrectMetaException,
 )
+from django_serializer.v2.query import BatchLoader
+from django_serializer.v2.serializer_fields import BatchedNested
 from django_serializer.v2.settings import settings
 
 __all__ = (
     "Serializer",
     "ModelSerializer",
     "ModelSerializerMeta",
+    "SerializerPool",
+    "serializer_pool",
 )
 
 
 class Serializer(Schema):
-    pass
+    def _has_dump_hooks(self) -> bool:
+        for tag, hooks in self._hooks.items():
+            # hooks are keyed by (tag, many) in older marshmallow versions
+            if isinstance(tag, tuple):
+                tag = tag[0]
+            if hooks and tag in (PRE_DUMP, POST_DUMP):
+                return True
+        return False
+
+    def _dump_keys(self) -> List[str]:
+        return [
+            name if field.data_key is None else field.data_key
+            for name, field in ordered_dump_fields(self)
+        ]
+
+    def dump_columns(self, obj: Iterable) -> dict:
+        """
+        Serializes collection of objects column by column
+
+        :param obj: collection of objects
+        :return: {"columns": [keys], "data": {key: [values]}},
+            missing values are None
+        """
+        rows = self.dump(obj, many=True)
+        columns = self._dump_keys()
+        return {
+            "columns": columns,
+            "data": {column: [row.get(column) for row in rows] for column in columns},
+        }
 
 
 class ModelSerializerMeta(SchemaMeta):
@@ -35,6 +76,65 @@ class ModelSerializerMeta(SchemaMeta):
                 raise IncorrectMetaException(name, errors)
             return set(meta_fields)
 
+    @staticmethod
+    def check_options(name: str, meta: Type):
+        errors = []
+        for option, types in (
+            ("compiled", bool),
+            ("cache", bool),
+            ("cache_timeout", int),
+            ("cache_version", int),
+        ):
+            value = getattr(meta, option, None)
+            if value is not None and not isinstance(value, types):
+                errors.append(f"`{option}` has incorrect type")
+        if errors:
+            raise IncorrectMetaException(name, errors)
+
+    @staticmethod
+    def check_cached_fields(name: str, serializer_class, generated: Set[str]):
+        """
+        Cached data is shared by all requests and invalidated by signals
+        of the model only, so every field has to be generated from the model.
+        E.g. fields.Method may depend on request and Nested on other models.
+        """
+        declared = sorted(set(serializer_class._declared_fields) - generated)
+        if declared:
+            raise IncorrectMetaException(
+                name,
+                [
+                    f"`cache` can not be used with not model field `{f}`"
+                    for f in declared
+                ],
+            )
+
+    @staticmethod
+    def check_expand(name: str, meta: Type, model: Type[models.Model]) -> Dict:
+        expand = getattr(meta, "expand", None)
+        if not expand:
+            return {}
+        if not isinstance(expand, dict):
+            raise IncorrectMetaException(name, ["`expand` has incorrect type"])
+        if getattr(meta, "cache", False):
+            raise IncorrectMetaException(
+                name, ["`expand` and `cache` can not be simultaneously"]
+            )
+        errors = []
+        model_fields = {}
+        for field_name in expand:
+            model_field = next(
+                (f for f in model._meta.fields if f.name == field_name), None
+            )
+            if model_field is None or not (
+                model_field.many_to_one or model_field.one_to_one
+            ):
+                errors.append(f"`{field_name}` is not foreign key of model")
+            else:
+                model_fields[field_name] = model_field
+        if errors:
+            raise IncorrectMetaException(name, errors)
+        return model_fields
+
     def __new__(mcs, name, bases, attrs, *args, **kwargs):
         if name == "ModelSerializer":
             # noinspection PyArgumentList
@@ -64,6 +164,8 @@ class ModelSerializerMeta(SchemaMeta):
         model_fields_set = {f.attname for f in model._meta.fields}
         model_fields = model._meta.fields
 
+        mcs.check_options(name, meta)
+
         meta_fields = mcs.check_fields(name, "fields", meta, model_fields_set)
         meta_exclude = mcs.check_fields(name, "exclude", meta, model_fields_set)
         if meta_fields and meta_exclude:
@@ -72,6 +174,7 @@ class ModelSerializerMeta(SchemaMeta):
             )
 
         errors = []
+        generated = set()
         for model_field in model_fields:
             model_field_class = model_field.__class__
             if meta_fields and model_field.attname not in meta_fields:
@@ -85,6 +188,7 @@ class ModelSerializerMeta(SchemaMeta):
                     description=model_field.verbose_name
                 )
                 attrs[model_field.attname] = field_class_instance
+                generated.add(model_field.attname)
             except KeyError:
                 errors.append(
                     f"`{model_field.attname}` has unknown type "
@@ -94,8 +198,228 @@ class ModelSerializerMeta(SchemaMeta):
         if errors:
             raise IncorrectMetaException(name, errors)
 
-        return super(ModelSerializerMeta, mcs).__new__(mcs, name, bases, attrs)
+        for field_name, model_field in mcs.check_expand(name, meta, model).items():
+            attrs[field_name] = BatchedNested(
+                meta.expand[field_name],
+                model_field=model_field,
+                dump_only=True,
+                allow_none=model_field.null,
+                metadata=dict(description=model_field.verbose_name),
+            )
+
+        new = super(ModelSerializerMeta, mcs).__new__(mcs, name, bases, attrs)
+        new._serializer_cache = None
+        if getattr(meta, "cache", False):
+            mcs.check_cached_fields(name, new, generated)
+            new._serializer_cache = SerializerCache(
+                new,
+                model,
+                timeout=getattr(meta, "cache_timeout", 300),
+                version=getattr(meta, "cache_version", 1),
+            )
+            new._serializer_cache.connect()
+        return new
 
 
 class ModelSerializer(Serializer, metaclass=ModelSerializerMeta):
-    pass
+    """
+    Serializer with fields generated from SMeta.model.
+
+    SMeta options:
+
+    * model - django model class, required
+    * fields - model attnames to serialize
+    * exclude - model attnames to skip
+    * compiled - use dump function specialized for the class,
+      defaults to SERIALIZER_COMPILED_DUMP setting
+    * cache - cache serialized instances, see SerializerCache.
+      Can be used with fields generated from the model only
+    * cache_timeout - django cache timeout, 300 by default
+    * cache_version - django cache version, 1 by default
+    * expand - dict of foreign key name -> serializer class or name,
+      related objects are dumped nested. They are loaded by one in_bulk
+      per related model for all dumped objects, see BatchLoader.
+      Can not be used with cache
+    """
+
+    _serializer_cache: Optional[SerializerCache] = None
+
+    def _get_compiled_dump(self) -> Optional[Callable]:
+        if not hasattr(self, "_compiled_dump"):
+            compiled = getattr(self.SMeta, "compiled", None)
+            if compiled is None:
+                compiled = settings.SERIALIZER_COMPILED_DUMP
+            self._compiled_dump = None
+            if compiled:
+                generic = functools.partial(super()._serialize, many=False)
+                self._compiled_dump = compile_dump(self, self.SMeta.model, generic)
+        return self._compiled_dump
+
+    def dump_columns(self, obj: Iterable) -> dict:
+        """
+        Converts model instances column by column without building
+        intermediate rows. Falls back to Serializer.dump_columns if there are
+        dump hooks or objects which are not instances of SMeta.model.
+        """
+        model = self.SMeta.model
+        obj = list(obj)
+        if self._has_dump_hooks() or not all(isinstance(item, model) for item in obj):
+            return super().dump_columns(obj)
+        if not hasattr(self, "_compiled_columns"):
+            self._compiled_columns = compile_columns(self, model)
+        expanded = self._expand(obj)
+        try:
+            data = self._compiled_columns(obj)
+        finally:
+            for field in expanded:
+                field.clear()
+        return {"columns": self._dump_keys(), "data": data}
+
+    def _use_cache(self) -> bool:
+        # cached data contains all fields without post processing
+        return (
+            self._serializer_cache is not None
+            and self.only is None
+            and self.exclude == set(self.opts.exclude)
+            and not self._has_dump_hooks()
+        )
+
+    def _serialize_many(self, obj: List) -> List:
+        return self._serialize_objects(obj, many=True)
+
+    def _expand(self, objs: List) -> List[BatchedNested]:
+        """
+        Loads and dumps related objects of expanded foreign keys
+
+        :param objs: dumped objects
+        :return: expanded fields
+        """
+        expanded = [
+            field
+            for field in self.dump_fields.values()
+            if isinstance(field, BatchedNested)
+        ]
+        if not expanded:
+            return expanded
+        model = self.SMeta.model
+        objs = [obj for obj in objs if isinstance(obj, model)]
+        loader = BatchLoader()
+        for field in expanded:
+            for obj in objs:
+                loader.add(field.model_field, obj)
+        loader.load()
+        for field in expanded:
+            field.expand(loader, objs)
+        return expanded
+
+    def _serialize_objects(self, obj, *, many: bool = False):
+        # Schema._serialize calls self._serialize for every item of many
+        dump = self._get_compiled_dump() or super()._serialize
+        if obj is None:
+            return dump(obj)
+        if many:
+            obj = list(obj)
+        expanded = self._expand(obj if many else [obj])
+        try:
+            if many:
+                return [dump(item) for item in obj]
+            return dump(obj)
+        finally:
+            for field in expanded:
+                field.clear()
+
+    def _serialize(self, obj, *, many: bool = False):
+        if obj is None or not self._use_cache():
+            return self._serialize_objects(obj, many=many)
+        cache = self._serializer_cache
+        if many:
+            return cache.dump(list(obj), self._serialize_many)
+        return cache.dump([obj], self._serialize_many)[0]
+
+
+def _built_nested_schemas(schema: Schema) -> Iterable[Schema]:
+    """
+    Schemas of Nested fields built by marshmallow on first dump,
+    they keep a copy of parent context taken at that moment
+    """
+    stack = list(schema.fields.values())
+    while stack:
+        field = stack.pop()
+        if isinstance(field, mmfields.Nested):
+            if field._schema:
+                yield field._schema
+                stack.extend(field._schema.fields.values())
+        elif isinstance(field, mmfields.List):
+            stack.append(field.inner)
+        elif isinstance(field, mmfields.Tuple):
+            stack.extend(field.tuple_fields)
+        elif isinstance(field, mmfields.Mapping) and field.value_field:
+            stack.append(field.value_field)
+
+
+class SerializerPool:
+    """
+    Keeps constructed serializer instances to be reused between requests.
+
+    Serializer taken by `acquire` is used by a single thread until `release`.
+    Context of the serializer and of its built nested schemas is replaced
+    by `acquire` and cleared by `release`. Every (serializer class, many, only, exclude) keeps up to `size`
+    free instances, up to `variants` of such keys are kept.
+
+    :param size: max free instances per key
+    :param variants: max number of keys
+    """
+
+    def __init__(self, size: int = 32, variants: int = 256):
+        self.size = size
+        self.variants = variants
+        self._free: Dict[tuple, deque] = {}
+
+    def acquire(
+        self,
+        serializer_class: Type[Serializer],
+        many: bool,
+        context: dict,
+        only: Optional[Sequence[str]] = None,
+        exclude: Sequence[str] = (),
+    ) -> Serializer:
+        only = tuple(only) if only is not None else None
+        exclude = tuple(exclude)
+        key = (serializer_class, many, only, exclude)
+        free = self._free.get(key)
+        if free is None:
+            if len(self._free) >= self.variants:
+                try:
+                    self._free.pop(next(iter(self._free)), None)
+                except (StopIteration, RuntimeError):
+                    # changed by another thread
+                    pass
+            free = self._free.setdefault(key, deque(maxlen=self.size))
+        try:
+            serializer = free.pop()
+        except IndexError:
+            serializer = serializer_class(many=many, only=only, exclude=exclude)
+            serializer._pool_key = key
+        serializer.context.update(context)
+        for nested in _built_nested_schemas(serializer):
+            if nested.context is not serializer.context:
+                nested.context.clear()
+                nested.context.update(context)
+        return serializer
+
+    def release(self, serializer: Serializer):
+        """
+        Returns serializer to the pool, ignores not pooled serializers
+        """
+        key = getattr(serializer, "_pool_key", None)
+        if key is None:
+            return
+        serializer.context.clear()
+        for nested in _built_nested_schemas(serializer):
+            nested.context.clear()
+        free = self._free.get(key)
+        if free is not None:
+            free.append(serializer)
+
+
+serializer_pool = SerializerPool()
@@ -1,8 +1,9 @@
 import typing
 
+from django.db.models.manager import BaseManager
 from marshmallow import fields
 
-__all__ = ("FileField",)
+__all__ = ("FileField", "RelatedNested", "BatchedNested")
 
 
 class FileField(fields.Str):
@@ -13,3 +14,66 @@ class FileField(fields.Str):
 
     def _deserialize(self, value, attr, data, **kwargs) -> typing.Any:
         raise NotImplementedError
+
+
+class RelatedNested(fields.Nested):
+    """
+    Nested field accepting related managers, e.g. reverse foreign key
+    or many to many relation. Manager is dumped as `manager.all()`,
+    so prefetched objects are used.
+    """
+
+    def _serialize(self, nested_obj, attr, obj, **kwargs):
+        if isinstance(nested_obj, BaseManager):
+            nested_obj = nested_obj.all()
+        return super()._serialize(nested_obj, attr, obj, **kwargs)
+
+
+class BatchedNested(fields.Nested):
+    """
+    Nested field of foreign key expanded by ModelSerializer, see SMeta.expand.
+
+    Related objects of all dumped objects are loaded by BatchLoader
+    and dumped at once by `expand`, `serialize` then only looks up
+    the result by foreign key value. Objects not passed to `expand`
+    are dumped from the relation as by fields.Nested.
+
+    :param nested: serializer class, instance or name
+    :param model_field: ForeignKey or OneToOneField of the model
+    """
+
+    def __init__(self, nested, model_field, **kwargs):
+        super().__init__(nested, **kwargs)
+        self.model_field = model_field
+        self._expanded: typing.Optional[dict] = None
+
+    def expand(self, loader, objs: typing.Iterable):
+        """
+        Dumps related objects loaded by BatchLoader
+
+        :param loader: BatchLoader with loaded foreign keys of the field
+        :param objs: model instances
+        """
+        related = {}
+        attname = self.model_field.attname
+        for obj in objs:
+            value = getattr(obj, attname)
+            if value not in related:
+                instance = loader.get(self.model_field, value)
+                if instance is not None:
+                    related[value] = instance
+        data = self.schema.dump(list(related.values()), many=True)
+        self._expanded = dict(zip(related, data))
+
+    def clear(self):
+        self._expanded = None
+
+    def serialize(self, attr, obj, accessor=None, **kwargs):
+        if self._expanded is not None:
+            value = getattr(obj, self.model_field.attname, None)
+            if value is None:
+                return None
+            data = self._expanded.get(value)
+            if data is not None:
+                return data
+        return super().serialize(attr, obj, accessor, **kwargs)
@@ -16,9 +16,21 @@ class ApiSettings:
 
     SERIALIZER_DEFAULT_PARSER_CLASS: JsonParser
     SERIALIZER_DEFAULT_RENDERER_CLASS: JsonRenderer
+    SERIALIZER_COMPILED_DUMP: bool
+    SERIALIZER_CACHE_ALIAS: str
+    SERIALIZER_CACHE_LOCAL_SIZE: int
+    SERIALIZER_CACHE_LOCAL_TIMEOUT: float
+    SERIALIZER_METRICS_SINK: type
+    SERIALIZER_SERVER_TIMING: bool
     DEFAULTS = {
         "SERIALIZER_DEFAULT_PARSER_CLASS": JsonParser,
         "SERIALIZER_DEFAULT_RENDERER_CLASS": JsonRenderer,
+        "SERIALIZER_COMPILED_DUMP": False,
+        "SERIALIZER_CACHE_ALIAS": "default",
+        "SERIALIZER_CACHE_LOCAL_SIZE": 1024,
+        "SERIALIZER_CACHE_LOCAL_TIMEOUT": 5,
+        "SERIALIZER_METRICS_SINK": None,
+        "SERIALIZER_SERVER_TIMING": False,
         "SERIALIZER_FIELD_MAPPING": {
             models.AutoField: mmfields.Int,
             models.BigAutoField: mmfields.Int,
@@ -10,6 +10,7 @@ from django.utils.regex_helper import normalize
 from django_serializer.v2.swagger import utils
 from django_serializer.v2.exceptions import HttpError, HttpFormError
 from django_serializer.v2.views import ApiView
+from django_serializer.v2.views.base import SparseFieldsForm
 
 
 class Swagger:
@@ -70,20 +71,21 @@ class Swagger:
             "content": {"application/json": {"schema": schema}},
         }
 
-    def _generate_request_body(self, schema):
-        return {
-            "content": {
-                "application/json": {
-                    "schema": self.ma_spec.converter.schema2jsonschema(schema)
-                }
-            }
-        }
+    def _generate_request_body(self, schema, many=False):
+        json_schema = self.ma_spec.converter.schema2jsonschema(schema)
+        if many:
+            json_schema = {"type": "array", "items": json_schema}
+        return {"content": {"application/json": {"schema": json_schema}}}
 
     def _resolve_forms(self, meta):
         query_schema = utils.merge_schemas(
             utils.form2schema(getattr(meta, "query_form", None)),
             utils.form2schema(getattr(getattr(meta, "paginator", None), "form", None)),
         )
+        if getattr(meta, "sparse_fields", False):
+            query_schema = utils.merge_schemas(
+                query_schema, utils.form2schema(SparseFieldsForm)
+            )
         body_schema = utils.merge_schemas(
             utils.form2schema(getattr(meta, "body_form", None)),
             utils.form2schema(getattr(meta, "model_form", None)),
@@ -99,7 +101,13 @@ class Swagger:
                 }
             )
         if body_schema is not None:
-            parameters.update({"requestBody": self._generate_request_body(body_schema)})
+            parameters.update(
+                {
+                    "requestBody": self._generate_request_body(
+                        body_schema, many=getattr(meta, "many", False)
+                    )
+                }
+            )
         return parameters
 
     def _generate_operations(self, meta):
@@ -1,10 +1,15 @@
-from .base import ApiView
+from .base import ApiView, AsyncApiView
 from .generics import (
     CreateApiView,
     GetApiView,
     UpdateApiView,
     DeleteApiView,
     ListApiView,
+    AsyncCreateApiView,
+    AsyncGetApiView,
+    AsyncUpdateApiView,
+    AsyncDeleteApiView,
+    AsyncListApiView,
 )
 from .meta import HttpMethod
 
@@ -16,4 +21,10 @@ __all__ = (
     "UpdateApiView",
     "DeleteApiView",
     "ListApiView",
+    "AsyncApiView",
+    "AsyncCreateApiView",
+    "AsyncGetApiView",
+    "AsyncUpdateApiView",
+    "AsyncDeleteApiView",
+    "AsyncListApiView",
 )
@@ -1,24 +1,111 @@
+import datetime
+import hashlib
+import inspect
 import logging
-from typing import Mapping, Type
+from contextlib import contextmanager, nullcontext
+from itertools import islice
+from typing import Iterator, Mapping, Optional, Sequence, Tuple, Type
 
+import django
+from asgiref.sync import sync_to_async
+from django import forms
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Model, QuerySet, prefetch_related_objects
 from django.forms import BaseForm
 from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
 from django.views import View
 
 from django_serializer.v2.exceptions import (
     BadRequestError,
+    BodyTooLargeException,
     HttpError,
     HttpFormError,
     HttpNotImplementedError,
     InternalServerError,
+    NestingTooDeepException,
     ParseException,
+    PayloadTooLargeError,
 )
+from django_serializer.v2.cache import CachedResponse
+from django_serializer.v2.metrics import BaseMetricsSink, StageTimer, get_metrics_sink
+from django_serializer.v2.query import afetch, get_dump_fields
 from django_serializer.v2.renderers import BaseRenderer
-from django_serializer.v2.serializer import Serializer
-from django_serializer.v2.views.meta import ApiViewMeta
+from django_serializer.v2.serializer import Serializer, serializer_pool
+from django_serializer.v2.settings import settings as api_settings
+from django_serializer.v2.views.meta import ApiViewMeta, DispatchPlan
 
-__all__ = ("ApiView",)
+__all__ = ("ApiView", "AsyncApiView", "SparseFieldsForm")
+
+
+@contextmanager
+def _parse_errors():
+    try:
+        yield
+    except BodyTooLargeException:
+        raise PayloadTooLargeError
+    except NestingTooDeepException:
+        raise BadRequestError("body json is too deep")
+    except ParseException:
+        raise BadRequestError("body json is invalid")
+
+
+def _cache_key_value(value):
+    """
+    Stable representation of cleaned value for cache key,
+    `repr` of model instances and querysets depends on `__str__`
+    and evaluation, and may differ for equal values
+    """
+    if isinstance(value, Model):
+        return value.pk
+    if isinstance(value, QuerySet):
+        return sorted(obj.pk for obj in value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return sorted((k, _cache_key_value(v)) for k, v in value.items())
+    if isinstance(value, (set, frozenset)):
+        return sorted(_cache_key_value(v) for v in value)
+    if isinstance(value, (list, tuple)):
+        return [_cache_key_value(v) for v in value]
+    return value
+
+
+class SparseFieldsForm(forms.Form):
+    """
+    Validates `fields` and `exclude` query parameters,
+    comma separated names of serializer fields.
+    Cleaned values are tuples of names in serializer order,
+    `fields` is None if not passed.
+
+    :param field_names: names of fields dumped by serializer
+    """
+
+    fields = forms.CharField(required=False)
+    exclude = forms.CharField(required=False)
+
+    def __init__(self, *args, field_names: Sequence[str] = (), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.field_names = tuple(field_names)
+
+    def _clean_names(self, name: str) -> Optional[tuple]:
+        value = self.cleaned_data.get(name)
+        if not value:
+            return None
+        names = {item.strip() for item in value.split(",")} - {""}
+        unknown = names.difference(self.field_names)
+        if unknown:
+            raise forms.ValidationError(f"unknown fields: {', '.join(sorted(unknown))}")
+        return tuple(n for n in self.field_names if n in names)
+
+    def clean_fields(self):
+        return self._clean_names("fields")
+
+    def clean_exclude(self):
+        return self._clean_names("exclude") or ()
 
 
 class ApiView(View, metaclass=ApiViewMeta, checkmeta=False):
@@ -30,11 +117,11 @@ class ApiView(View, metaclass=ApiViewMeta, checkmeta=False):
 
     Meta = ApiViewMeta.Meta
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._logger = logging.getLogger(
-            f"django_serializer.views.{self.__class__.__name__}"
-        )
+    _timer: Optional[StageTimer] = None
+    _validator_headers: dict = {}
+    # key of serialized data in response made by _generic_response
+    _data_key: str = "data"
+    _dispatch_plan: DispatchPlan
 
     @property
     def logger(self) -> logging.Logger:
@@ -45,7 +132,12 @@ class ApiView(View, metaclass=ApiViewMeta, checkmeta=False):
         :return: logger
         :rtype: logging.Logger
         """
-        return self._logger
+        return self._dispatch_plan.logger
+
+    @property
+    def _logger(self) -> logging.Logger:
+        # kept for views using logger attribute of previous versions
+        return self.logger
 
     @property
     def request_query(self) -> Mapping:
@@ -64,20 +156,75 @@ class ApiView(View, metaclass=ApiViewMeta, checkmeta=False):
         """
         return getattr(self, "_request_body", None)
 
+    @property
+    def request_fields(self) -> Optional[Mapping]:
+        """
+        Property to access sparse fieldset, `fields` and `exclude`
+        parameters cleaned by SparseFieldsForm. Set if Meta.sparse_fields is on
+
+        :return: dict
+        """
+        return getattr(self, "_request_fields", None)
+
     def get_parser(self):
-        return self.Meta.body_parser()
+        """
+        Default implementation returns parser instance shared by requests
+        """
+        return self._dispatch_plan.parser
+
+    def get_body_limits(self) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Default implementation returns Meta.body_max_size
+        (DATA_UPLOAD_MAX_MEMORY_SIZE if not set) and Meta.body_max_depth
+
+        :return: max body size in bytes and max nesting of parsed body,
+            None for unlimited
+        """
+        max_size = self.Meta.body_max_size
+        if max_size is None:
+            max_size = settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+        return max_size, self.Meta.body_max_depth
+
+    def _check_body_size(self, request: HttpRequest, max_size: Optional[int]):
+        try:
+            content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            content_length = 0
+        if max_size is not None and content_length > max_size:
+            raise PayloadTooLargeError
 
     def get_request_json(self, request: HttpRequest):
+        """
+        Parses request body stream by parser, see BaseParser.parse_stream.
+        Body is not read into `request.body`, it is not available after
+
+        :param request: HttpRequest
+        :return: parsed body, None if it is not json
+        """
         if hasattr(self, "_request_json"):
             return getattr(self, "_request_json")
         if "application/json" in request.content_type:
-            try:
-                parser = self.get_parser()
-                payload = parser.parse(request.body)
-                setattr(self, "_request_json", payload)
-                return payload
-            except ParseException:
-                raise BadRequestError("body json is invalid")
+            max_size, max_depth = self.get_body_limits()
+            self._check_body_size(request, max_size)
+            with _parse_errors():
+                payload = self.get_parser().parse_stream(request, max_size, max_depth)
+            setattr(self, "_request_json", payload)
+            return payload
+
+    def iter_request_json(self, request: HttpRequest) -> Iterator:
+        """
+        Iterates items of json array body decoded incrementally by parser,
+        see BaseParser.iter_stream. Errors are raised during iteration
+
+        :param request: HttpRequest
+        :return: iterator of array items
+        """
+        if "application/json" not in request.content_type:
+            raise BadRequestError("body json is invalid")
+        max_size, max_depth = self.get_body_limits()
+        self._check_body_size(request, max_size)
+        with _parse_errors():
+            yield from self.get_parser().iter_stream(request, max_size, max_depth)
 
     @staticmethod
     def _form_pipeline(form_class: Type[BaseForm], data: Mapping):
@@ -89,10 +236,25 @@ class ApiView(View, metaclass=ApiViewMeta, checkmeta=False):
                 raise HttpFormError(form)
 
     def _query_form(self, request: HttpRequest):
-        self._request_query = self._form_pipeline(self.Meta.query_form, request.GET)
+        self._request_query = self._form_pipeline(
+            self._dispatch_plan.query_form, request.GET
+        )
+
+    def _sparse_fields_form(self, request: HttpRequest):
+        if not self._dispatch_plan.sparse_fields:
+            return
+        serializer_class = self.get_serializer_class()
+        if serializer_class:
+            form = SparseFieldsForm(
+                request.GET,
+                field_names=[name for name, _ in get_dump_fields(serializer_class)],
+            )
+            if not form.is_valid():
+                raise HttpFormError(form)
+            self._request_fields = form.cleaned_data
 
     def _body_form(self, request: HttpRequest):
-        body_form = self.Meta.body_form
+        body_form = self._dispatch_plan.body_form
         if body_form:
             payload = self.get_request_json(request)
             self._request_body = self._form_pipeline(body_form, payload)
@@ -103,7 +265,7 @@ class ApiView(View, metaclass=ApiViewMeta, checkmeta=False):
         :param request: HttpRequest
         :return: None
         """
-        if request.method.lower() != self.Meta.method.value:
+        if request.method not in self._dispatch_plan.methods:
             raise HttpNotImplementedError
 
     def _check_section_permission(self, request: HttpRequest):
@@ -115,11 +277,53 @@ class ApiView(View, metaclass=ApiViewMeta, checkmeta=False):
         """
         pass
 
+    def get_metrics_sink(self) -> Optional[BaseMetricsSink]:
+        """
+        Default implementation returns shared instance
+        of SERIALIZER_METRICS_SINK class
+
+        :return: sink receiving stage timings, None to disable
+        """
+        sink_class = api_settings.SERIALIZER_METRICS_SINK
+        if sink_class:
+            return get_metrics_sink(sink_class)
+
+    def get_stage_timer(self) -> Optional[StageTimer]:
+        """
+        Stages are timed if metrics sink is set
+        or SERIALIZER_SERVER_TIMING is enabled
+
+        :return: timer of request stages, None to disable timing
+        """
+        if api_settings.SERIALIZER_SERVER_TIMING or self.get_metrics_sink():
+            return StageTimer()
+
+    def _stage(self, name: str):
+        if self._timer is None:
+            return nullcontext()
+        return self._timer.stage(name)
+
+    def _send_timings(self, request: HttpRequest, response: HttpResponse):
+        timer = self._timer
+        if api_settings.SERIALIZER_SERVER_TIMING:
+            response["Server-Timing"] = timer.server_timing()
+        sink = self.get_metrics_sink()
+        if sink is not None:
+            try:
+                sink.send(self, request, response, timer)
+            except Exception:
+                self.logger.exception("Metrics sink failed")
+
     def perform_request_pipelines(self, request: HttpRequest):
-        self._check_request_method(request)
-        self._check_section_permission(request)
-        self._query_form(request)
-        self._body_form(request)
+        with self._stage("method"):
+            self._check_request_method(request)
+        with self._stage("permission"):
+            self._check_section_permission(request)
+        with self._stage("query_form"):
+            self._query_form(request)
+            self._sparse_fields_form(request)
+        with self._stage("body_form"):
+            self._body_form(request)
 
     def get_serializer_class(self) -> Type[Serializer]:
         """
@@ -133,43 +337,148 @@ class ApiView(View, metaclass=ApiViewMeta, checkmeta=False):
         """
         return self.Meta.serializer
 
-    def get_serializer_kwargs(self) -> dict:
+    def get_serializer_context(self) -> dict:
         """
         Default implementation adds request to the serializer context
 
-        Override this to add extra context or kwargs for the serializer
+        Override this to add extra context for the serializer
+
+        :return: serializer context
+        :rtype: dict
+        """
+        return {"request": self.request}
+
+    def get_serializer_kwargs(self) -> dict:
+        """
+        Default implementation adds context, many
+        and only/exclude of requested sparse fieldset
+
+        Override this to add extra kwargs for the serializer.
+        Serializer is not reused if this method is overridden.
 
         :return: dictionary passed to serializer as kwargs
         :rtype: dict
         """
-        return {"context": {"request": self.request}, "many": self.Meta.serializer_many}
+        kwargs = {
+            "context": self.get_serializer_context(),
+            "many": self._dispatch_plan.serializer_many,
+        }
+        if self.request_fields:
+            kwargs["only"] = self.request_fields["fields"]
+            kwargs["exclude"] = self.request_fields["exclude"]
+        return kwargs
 
     def get_serializer(self) -> Serializer:
         """
-        Instantiates serializer
+        Instantiates serializer or takes it from serializer_pool
+        if Meta.reuse_serializer is set
 
         :return: serializer object
         :rtype: Serializer
         """
         serializer_class = self.get_serializer_class()
         if serializer_class:
+            plan = self._dispatch_plan
+            if plan.pool_serializer:
+                request_fields = self.request_fields or {}
+                return serializer_pool.acquire(
+                    serializer_class,
+                    plan.serializer_many,
+                    self.get_serializer_context(),
+                    only=request_fields.get("fields"),
+                    exclude=request_fields.get("exclude", ()),
+                )
             serializer_kwargs = self.get_serializer_kwargs()
             return serializer_class(**serializer_kwargs)
 
+    def is_columnar(self, request: HttpRequest) -> bool:
+        """
+        Columnar output of serializer_many views is allowed by Meta.columnar
+        and requested by `?format=columnar` query parameter
+
+        :param request: HttpRequest
+        :return: serialize response by Serializer.dump_columns
+        """
+        return (
+            self._dispatch_plan.columnar
+            and self._dispatch_plan.serializer_many
+            and request.GET.get("format") == "columnar"
+        )
+
+    def is_chunked(self, request: HttpRequest, response) -> bool:
+        """
+        serializer_many response is serialized and rendered by chunks
+        if Meta.render_chunk_size is set and columnar output is not requested
+
+        :param request: HttpRequest
+        :param response: object returned from execute stage
+        """
+        return bool(
+            self.Meta.render_chunk_size
+            and self._dispatch_plan.serializer_many
+            and isinstance(response, (list, tuple, QuerySet))
+            and not self.is_columnar(request)
+        )
+
+    def _chunk_pipeline(self, objs, chunk_size: int) -> Iterator[list]:
+        """
+        Serializes objects by chunks, querysets are iterated by `iterator`.
+        prefetch_related lookups are made for every chunk,
+        iterator() ignores them before Django 4.1
+        """
+        serializer = self.get_serializer()
+        lookups = ()
+        if isinstance(objs, QuerySet):
+            lookups = objs._prefetch_related_lookups
+            items = objs.prefetch_related(None).iterator(chunk_size=chunk_size)
+        else:
+            items = iter(objs)
+        try:
+            while True:
+                chunk = list(islice(items, chunk_size))
+                if not chunk:
+                    break
+                if lookups:
+                    prefetch_related_objects(chunk, *lookups)
+                yield serializer.dump(chunk) if serializer else chunk
+        finally:
+            if serializer:
+                serializer_pool.release(serializer)
+
+    def _render_chunks(self, request: HttpRequest, response) -> HttpResponse:
+        chunks = self._chunk_pipeline(response, self.Meta.render_chunk_size)
+        with self._stage("envelope"):
+            response = self._generic_response(chunks)
+        with self._stage("render"):
+            renderer = self.get_renderer(request)
+            return renderer.render_chunks(response, key=self._data_key)
+
     def _serializer_pipeline(self, response):
         serializer = self.get_serializer()
         if serializer:
-            return serializer.dump(response)
+            try:
+                if self.is_columnar(self.request):
+                    return serializer.dump_columns(response)
+                return serializer.dump(response)
+            finally:
+                serializer_pool.release(serializer)
         return response
 
     def _generic_response(self, response):
-        return {"status": "ok", "data": response}
+        return {"status": "ok", self._data_key: response}
 
     def get_renderer_class(self, request) -> Type[BaseRenderer]:
         return self.Meta.renderer
 
     def get_renderer(self, request) -> BaseRenderer:
-        return self.get_renderer_class(request)()
+        """
+        Default implementation returns renderer instance shared by requests,
+        a new one if get_renderer_class is overridden
+        """
+        renderer = self._dispatch_plan.renderer
+        if renderer is None:
+            renderer = self.get_renderer_class(request)()
+        return renderer
 
     def render_response(self, request: HttpRequest, response) -> HttpResponse:
         """
@@ -183,12 +492,101 @@ class ApiView(View, metaclass=ApiViewMeta, checkmeta=False):
         renderer = self.get_renderer(request)
         return renderer.render(response)
 
+    def encode_response(self, request: HttpRequest, response) -> HttpResponse:
+        """
+        Applies content coding negotiated by renderer, e.g. compression.
+        Called for every response after response cache, see BaseRenderer.encode
+
+        :param request: HttpRequest passed from dispatch
+        :param response: HttpResponse
+        :return: HttpResponse returned to user
+        """
+        with self._stage("encode"):
+            return self.get_renderer(request).encode(request, response)
+
     def perform_response_pipelines(self, request: HttpRequest, response):
-        response = self._serializer_pipeline(response)
-        response = self._generic_response(response)
-        response = self.render_response(request, response)
+        """
+        Serializes, wraps and renders response.
+
+        Chunked response (see is_chunked) is serialized and rendered
+        by chunks, only one chunk of serialized objects is kept in memory.
+        Its serialization is timed as render stage.
+        """
+        if self.is_chunked(request, response):
+            return self._render_chunks(request, response)
+        with self._stage("serializer"):
+            response = self._serializer_pipeline(response)
+        with self._stage("envelope"):
+            response = self._generic_response(response)
+        with self._stage("render"):
+            response = self.render_response(request, response)
+        return response
+
+    def get_validators(
+        self, request: HttpRequest, response
+    ) -> Tuple[Optional[str], Optional[datetime.datetime]]:
+        """
+        Validators of GET and HEAD requests, called after execute stage.
+        View answers `304 Not Modified` without serialization
+        if request `If-None-Match` or `If-Modified-Since` matches them.
+
+        Default implementation has no validators
+
+        :param request: HttpRequest
+        :param response: object returned from execute stage
+        :return: ETag and last modification time, None if unknown
+        """
+        return None, None
+
+    def _conditional_response(
+        self, request: HttpRequest, validators: tuple
+    ) -> Optional[HttpResponse]:
+        etag, last_modified = validators
+        headers = {}
+        timestamp = None
+        if etag:
+            headers["ETag"] = quote_etag(etag)
+        if last_modified:
+            if timezone.is_naive(last_modified):
+                last_modified = timezone.make_aware(last_modified)
+            timestamp = int(last_modified.timestamp())
+            headers["Last-Modified"] = http_date(timestamp)
+        self._validator_headers = headers
+
+        response = None
+        if headers:
+            response = get_conditional_response(
+                request, etag=headers.get("ETag"), last_modified=timestamp
+            )
+        if response is None and request.method == "HEAD":
+            renderer = self.get_renderer(request)
+            response = HttpResponse(content_type=renderer.content_type)
+        if response is not None:
+            self._set_validator_headers(response)
         return response
 
+    def _set_validator_headers(self, response: HttpResponse) -> HttpResponse:
+        for header, value in self._validator_headers.items():
+            response[header] = value
+        return response
+
+    def perform_conditional_pipeline(
+        self, request: HttpRequest, response
+    ) -> Optional[HttpResponse]:
+        """
+        Answers GET and HEAD requests before serialization, see get_validators.
+        HEAD request is answered by response with validators and without body
+
+        :param request: HttpRequest
+        :param response: object returned from execute stage
+        :return: HttpResponse to return instead of rendered one, None to continue
+        """
+        if request.method not in ("GET", "HEAD"):
+            return None
+        with self._stage("conditional"):
+            validators = self.get_validators(request, response)
+            return self._conditional_response(request, validators)
+
     def handle_http_error(self, request: HttpRequest, e: HttpError) -> HttpResponse:
         """
         HttpError handler. Can be overriden if needed.
@@ -202,18 +600,122 @@ class ApiView(View, metaclass=ApiViewMeta, checkmeta=False):
         response.status_code = e.http_code
         return response
 
-    def dispatch(self, request: HttpRequest, *args, **kwargs):
+    def get_cache_key(self, request: HttpRequest) -> str:
+        """
+        Key of cached response, see Meta.cache.
+
+        Default implementation is built from view class, URL arguments,
+        cleaned query and sparse fieldset, other GET parameters
+        (e.g. pagination) and vary options of Meta
+
+        :param request: HttpRequest
+        :return: django cache key
+        """
+        plan = self._dispatch_plan
+        cleaned = set(plan.query_form.base_fields) if plan.query_form else set()
+        if self.request_fields is not None:
+            cleaned.update(self.request_fields)
+        parts = [
+            self.args,
+            sorted(self.kwargs.items()),
+            _cache_key_value(self.request_query or {}),
+            _cache_key_value(self.request_fields or {}),
+            sorted((k, v) for k, v in request.GET.lists() if k not in cleaned),
+        ]
+        if self.Meta.cache_vary_on_user:
+            user = getattr(request, "user", None)
+            parts.append(user.pk if user and user.is_authenticated else None)
+        for header in self.Meta.cache_vary_on_headers:
+            parts.append(request.headers.get(header))
+        digest = hashlib.md5(repr(parts).encode()).hexdigest()
+        return plan.cache.make_key(digest)
+
+    def _cached_response(self, request: HttpRequest, entry: CachedResponse):
+        response = entry.to_response()
+        last_modified = response.get("Last-Modified")
+        if last_modified:
+            last_modified = parse_http_date_safe(last_modified)
+        return get_conditional_response(
+            request,
+            etag=response.get("ETag"),
+            last_modified=last_modified,
+            response=response,
+        )
+
+    def _patch_vary_headers(self, response: HttpResponse) -> HttpResponse:
+        if self.Meta.cache_vary_on_headers:
+            patch_vary_headers(response, self.Meta.cache_vary_on_headers)
+        return response
+
+    def _execute_pipeline(self, request: HttpRequest, *args, **kwargs):
+        with self._stage("execute"):
+            response = self.execute(request, *args, **kwargs)
+        conditional = self.perform_conditional_pipeline(request, response)
+        if conditional is not None:
+            return conditional
+        response = self.perform_response_pipelines(request, response)
+        return self._set_validator_headers(response)
+
+    def _cache_pipeline(self, request: HttpRequest, *args, **kwargs):
+        cache = self._dispatch_plan.cache
+        with self._stage("cache"):
+            key = self.get_cache_key(request)
+            entry, generation = cache.get(key)
+            if entry is not None and (
+                entry.is_fresh(generation)
+                or cache.stale_timeout
+                and not cache.lock(key)
+            ):
+                # fresh or revalidated by other request
+                return self._patch_vary_headers(self._cached_response(request, entry))
+        try:
+            response = self._execute_pipeline(request, *args, **kwargs)
+        except HttpError:
+            raise
+        except Exception:
+            if entry is None or not cache.stale_timeout:
+                raise
+            self.logger.exception(f"Serving stale response on {request.path}")
+            return self._patch_vary_headers(self._cached_response(request, entry))
+        finally:
+            if entry is not None and cache.stale_timeout:
+                cache.unlock(key)
+        if cache.is_cacheable(response):
+            with self._stage("cache"):
+                cache.set(key, response, generation)
+        return self._patch_vary_headers(response)
+
+    def _dispatch(self, request: HttpRequest, *args, **kwargs):
         try:
             self.perform_request_pipelines(request)
-            response = self.execute(request, *args, **kwargs)
-            return self.perform_response_pipelines(request, response)
+            if self._dispatch_plan.cache is not None and request.method == "GET":
+                return self._cache_pipeline(request, *args, **kwargs)
+            return self._execute_pipeline(request, *args, **kwargs)
         except HttpError as e:
-            return self.handle_http_error(request, e)
+            with self._stage("render"):
+                return self.handle_http_error(request, e)
         except Exception as e:
             if settings.DEBUG:
                 raise e
             self.logger.exception(f"Unhandled exception on {self.request.path}")
-            return self.handle_http_error(request, InternalServerError())
+            with self._stage("render"):
+                return self.handle_http_error(request, InternalServerError())
+
+    def dispatch(self, request: HttpRequest, *args, **kwargs):
+        """
+        Runs request pipelines, execute and response pipelines.
+        Every stage is timed if `get_stage_timer` returns timer,
+        timings are sent to metrics sink and Server-Timing header.
+        """
+        self._timer = self.get_stage_timer()
+        if self._timer is None:
+            response = self._dispatch(request, *args, **kwargs)
+            return self.encode_response(request, response)
+        with self._timer.capture_sql():
+            response = self._dispatch(request, *args, **kwargs)
+        response = self.encode_response(request, response)
+        self._send_timings(request, response)
+        return response
 
     dispatch.csrf_exempt = True
 
@@ -228,3 +730,148 @@ class ApiView(View, metaclass=ApiViewMeta, checkmeta=False):
         :rtype: dict
         """
         raise NotImplementedError
+
+
+class AsyncApiView(ApiView, checkmeta=False):
+    """
+    Base class for views served natively under ASGI, requires Django 4.2+.
+
+    `execute` may be a coroutine function. Querysets returned from it
+    are evaluated by async iteration, then they are serialized in a thread,
+    as serializers may make queries of their own (e.g. SMeta.expand).
+    Overridden sync
+    `_check_section_permission` runs in a thread, override
+    `_acheck_section_permission` to check permissions asynchronously.
+    Meta.cache_vary_on_user reads `request.user`, it has to be loaded
+    before the view when authentication makes queries.
+    """
+
+    view_is_async = True
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        if django.VERSION < (4, 2):
+            raise ImproperlyConfigured(f"{cls.__name__} requires Django 4.2+")
+        return super().as_view(**initkwargs)
+
+    async def _acheck_section_permission(self, request: HttpRequest):
+        if type(self)._check_section_permission is not (
+            ApiView._check_section_permission
+        ):
+            await sync_to_async(self._check_section_permission)(request)
+
+    async def aperform_request_pipelines(self, request: HttpRequest):
+        with self._stage("method"):
+            self._check_request_method(request)
+        with self._stage("permission"):
+            await self._acheck_section_permission(request)
+        with self._stage("query_form"):
+            self._query_form(request)
+            self._sparse_fields_form(request)
+        with self._stage("body_form"):
+            self._body_form(request)
+
+    async def aget_validators(
+        self, request: HttpRequest, response
+    ) -> Tuple[Optional[str], Optional[datetime.datetime]]:
+        """
+        Async version of get_validators.
+        Default implementation runs overridden get_validators in a thread
+        """
+        if type(self).get_validators is ApiView.get_validators:
+            return None, None
+        return await sync_to_async(self.get_validators)(request, response)
+
+    async def aperform_conditional_pipeline(
+        self, request: HttpRequest, response
+    ) -> Optional[HttpResponse]:
+        if request.method not in ("GET", "HEAD"):
+            return None
+        with self._stage("conditional"):
+            validators = await self.aget_validators(request, response)
+            return self._conditional_response(request, validators)
+
+    async def _aserializer_pipeline(self, response):
+        response = await afetch(response)
+        return await sync_to_async(self._serializer_pipeline)(response)
+
+    async def aperform_response_pipelines(self, request: HttpRequest, response):
+        if self.is_chunked(request, response):
+            with self._stage("serializer"):
+                response = await afetch(response)
+            return await sync_to_async(self._render_chunks)(request, response)
+        with self._stage("serializer"):
+            response = await self._aserializer_pipeline(response)
+        with self._stage("envelope"):
+            response = self._generic_response(response)
+        with self._stage("render"):
+            response = self.render_response(request, response)
+        return response
+
+    async def _aexecute_pipeline(self, request: HttpRequest, *args, **kwargs):
+        with self._stage("execute"):
+            response = self.execute(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+        conditional = await self.aperform_conditional_pipeline(request, response)
+        if conditional is not None:
+            return conditional
+        response = await self.aperform_response_pipelines(request, response)
+        return self._set_validator_headers(response)
+
+    async def _acache_pipeline(self, request: HttpRequest, *args, **kwargs):
+        cache = self._dispatch_plan.cache
+        with self._stage("cache"):
+            key = self.get_cache_key(request)
+            entry, generation = await cache.aget(key)
+            if entry is not None and (
+                entry.is_fresh(generation)
+                or cache.stale_timeout
+                and not await cache.alock(key)
+            ):
+                return self._patch_vary_headers(self._cached_response(request, entry))
+        try:
+            response = await self._aexecute_pipeline(request, *args, **kwargs)
+        except HttpError:
+            raise
+        except Exception:
+            if entry is None or not cache.stale_timeout:
+                raise
+            self.logger.exception(f"Serving stale response on {request.path}")
+            return self._patch_vary_headers(self._cached_response(request, entry))
+        finally:
+            if entry is not None and cache.stale_timeout:
+                await cache.aunlock(key)
+        if cache.is_cacheable(response):
+            with self._stage("cache"):
+                await cache.aset(key, response, generation)
+        return self._patch_vary_headers(response)
+
+    async def _adispatch(self, request: HttpRequest, *args, **kwargs):
+        try:
+            await self.aperform_request_pipelines(request)
+            if self._dispatch_plan.cache is not None and request.method == "GET":
+                return await self._acache_pipeline(request, *args, **kwargs)
+            return await self._aexecute_pipeline(request, *args, **kwargs)
+        except HttpError as e:
+            with self._stage("render"):
+                return self.handle_http_error(request, e)
+        except Exception as e:
+            if settings.DEBUG:
+                raise e
+            self.logger.exception(f"Unhandled exception on {self.request.path}")
+            with self._stage("render"):
+                return self.handle_http_error(request, InternalServerError())
+
+    async def dispatch(self, request: HttpRequest, *args, **kwargs):
+        self._timer = self.get_stage_timer()
+        if self._timer is None:
+            response = await self._adispatch(request, *args, **kwargs)
+            return self.encode_response(request, response)
+        with self._timer.capture_sql():
+            response = await self._adispatch(request, *args, **kwargs)
+        response = self.encode_response(request, response)
+        self._send_timings(request, response)
+        return response
+
+    dispatch.csrf_exempt = True
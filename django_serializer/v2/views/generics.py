@@ -1,16 +1,34 @@
-from typing import Type, Optional
+import datetime
+from functools import lru_cache
+from typing import AsyncIterator, Collection, Iterator, Optional, Tuple, Type
 
+from asgiref.sync import sync_to_async
 from django import forms
-from django.db.models import Model, QuerySet
+from django.db.models import (
+    DO_NOTHING,
+    Count,
+    Max,
+    Model,
+    QuerySet,
+    prefetch_related_objects,
+)
+from django.db.models.deletion import get_candidate_relations_to_delete
 
-from django_serializer.v2.exceptions import HttpFormError, ForbiddenError
-from django_serializer.v2.serializer import Serializer
-from django_serializer.v2.views import ApiView
-from django_serializer.v2.views.meta import ApiViewMeta, HttpMethod
+from django_serializer.v2.exceptions import (
+    ForbiddenError,
+    HttpBulkFormError,
+    NotFoundError,
+)
+from django_serializer.v2.serializer import Serializer, serializer_pool
+from django_serializer.v2.views import ApiView, AsyncApiView
+from django_serializer.v2.views.meta import ApiViewMeta, DispatchPlan, HttpMethod
 from django_serializer.v2.views.mixins import (
+    AsyncObjectMixin,
+    BulkFormMixin,
     FormMixin,
     ObjectMixin,
     CheckPermissionsMixin,
+    QuerySetPlanMixin,
 )
 from django_serializer.v2.views.paginator import BasePaginator
 
@@ -20,11 +38,34 @@ __all__ = (
     "UpdateApiView",
     "DeleteApiView",
     "ListApiView",
+    "AsyncCreateApiView",
+    "AsyncGetApiView",
+    "AsyncUpdateApiView",
+    "AsyncDeleteApiView",
+    "AsyncListApiView",
 )
 
 
-class CreateApiViewMeta(ApiViewMeta):
+class BulkApiViewMeta(ApiViewMeta):
+    """
+    Meta.many makes view accept json array of items, response is
+    serialized with many=True. Meta.body_form validates every item
+    instead of request body.
+    """
+
     class Meta(ApiViewMeta.Meta):
+        many: bool = False
+
+    @staticmethod
+    def build_dispatch_plan(cls) -> DispatchPlan:
+        plan = ApiViewMeta.build_dispatch_plan(cls)
+        if getattr(cls.Meta, "many", False):
+            plan = plan._replace(serializer_many=True, body_form=None)
+        return plan
+
+
+class CreateApiViewMeta(BulkApiViewMeta):
+    class Meta(BulkApiViewMeta.Meta):
         method: HttpMethod = HttpMethod.POST
         model_form: Type[forms.ModelForm] = None
         serializer: Type[Serializer] = None
@@ -32,24 +73,34 @@ class CreateApiViewMeta(ApiViewMeta):
 
 class CreateApiView(
     CheckPermissionsMixin,
+    BulkFormMixin,
     FormMixin,
     ApiView,
     metaclass=CreateApiViewMeta,
     checkmeta=False,
 ):
+    """
+    Creates object by Meta.model_form.
+
+    Meta.many accepts json array of objects, they are validated together
+    (see BulkFormMixin) and created by one bulk_create, invalid items are
+    reported by index in field_problems. Created objects are serialized
+    with many=True.
+    """
+
     Meta = CreateApiViewMeta.Meta
 
     def has_permissions(self) -> bool:
         return True
 
+    def perform_create(self):
+        if self.Meta.many:
+            return self.save_bulk_forms()
+        return self.save_form()
+
     def execute(self, request, *args, **kwargs):
         self.check_permissions()
-        form = self.get_form()
-        if form.is_valid():
-            instance = form.save()
-        else:
-            raise HttpFormError(form)
-        return instance
+        return self.perform_create()
 
 
 class GetApiForm(forms.Form):
@@ -63,21 +114,45 @@ class GetApiViewMeta(ApiViewMeta):
         query_form: Type[forms.Form] = GetApiForm
         object_key: str = "id"
         serializer: Type[Serializer] = None
+        prune_columns: bool = True
+        plan_relations: bool = True
+        last_modified_field: Optional[str] = None
 
 
 class GetApiView(
     CheckPermissionsMixin,
     ObjectMixin,
+    QuerySetPlanMixin,
     ApiView,
     metaclass=GetApiViewMeta,
     checkmeta=False,
 ):
     Meta = GetApiViewMeta.Meta
 
+    def get_plan_columns(self) -> Collection[str]:
+        field = self.Meta.last_modified_field
+        return (field,) if field else ()
+
+    def get_validators(
+        self, request, response
+    ) -> Tuple[Optional[str], Optional[datetime.datetime]]:
+        """
+        Object is validated by Meta.last_modified_field datetime,
+        e.g. `auto_now` field updated on every save
+        """
+        field = self.Meta.last_modified_field
+        if not field or not isinstance(response, Model):
+            return None, None
+        last_modified = getattr(response, field)
+        if last_modified is None:
+            return None, None
+        return f'W/"{response.pk}-{last_modified.timestamp()}"', last_modified
+
     def get_object(self):
         m: Type[Model] = self.Meta.model
         key: str = self.Meta.object_key
-        return m.objects.get(**{key: self.request_query[key]})
+        qs = self.plan_queryset(m.objects.all())
+        return qs.get(**{key: self.request_query[key]})
 
     def has_permissions(self, obj: Model) -> bool:
         return True
@@ -88,8 +163,8 @@ class GetApiView(
         return obj
 
 
-class UpdateApiViewMeta(ApiViewMeta):
-    class Meta(ApiViewMeta.Meta):
+class UpdateApiViewMeta(BulkApiViewMeta):
+    class Meta(BulkApiViewMeta.Meta):
         method: HttpMethod = HttpMethod.POST
         body_form: Type[forms.BaseForm] = GetApiForm
         model: Type[Model] = None
@@ -99,31 +174,102 @@ class UpdateApiViewMeta(ApiViewMeta):
 
 
 class UpdateApiView(
-    ObjectMixin, FormMixin, ApiView, metaclass=UpdateApiViewMeta, checkmeta=False
+    ObjectMixin,
+    BulkFormMixin,
+    FormMixin,
+    ApiView,
+    metaclass=UpdateApiViewMeta,
+    checkmeta=False,
 ):
+    """
+    Updates object by Meta.model_form, only changed fields are saved.
+
+    Meta.many accepts json array of objects with Meta.object_key and
+    changed fields. Objects are loaded by one in_bulk, every object
+    is checked by has_permissions and changed fields are written
+    by bulk_update, see BulkFormMixin.update_bulk_forms.
+    """
+
     Meta = UpdateApiViewMeta.Meta
 
     def has_permissions(self, obj: Model) -> bool:
         return True
 
+    def get_bulk_objects(self, keys: Collection) -> dict:
+        """
+        :param keys: values of Meta.object_key
+        :return: objects by key
+        """
+        m: Type[Model] = self.Meta.model
+        return m.objects.in_bulk(keys, field_name=self.Meta.object_key)
+
+    def update_objects(self):
+        """
+        Every item is validated by Meta.body_form, missing and duplicate
+        objects are reported by index in field_problems
+        """
+        key: str = self.Meta.object_key
+        items = list(self.iter_bulk_items())
+        key_forms = [self.Meta.body_form(data=item) for item in items]
+        keys = [form.cleaned_data[key] for form in key_forms if form.is_valid()]
+        objects = self.get_bulk_objects(keys) if keys else {}
+        seen = set()
+        for form in key_forms:
+            if form.errors:
+                continue
+            value = form.cleaned_data[key]
+            if value not in objects:
+                form.add_error(key, NotFoundError().description)
+            elif value in seen:
+                form.add_error(key, "Duplicate object")
+            seen.add(value)
+        if any(form.errors for form in key_forms):
+            raise HttpBulkFormError(key_forms)
+        if not all(self.has_permissions(objects[value]) for value in keys):
+            raise ForbiddenError
+
+        bulk_forms = [
+            self.get_bulk_form(item, instance=objects[value])
+            for item, value in zip(items, keys)
+        ]
+        return self.update_bulk_forms(bulk_forms)
+
     def execute(self, request, *args, **kwargs):
+        if self.Meta.many:
+            return self.update_objects()
         obj = self._get_object()
         if not self.has_permissions(obj):
             raise ForbiddenError
-        form = self.get_form()
-        if form.is_valid():
-            instance = form.save()
-        else:
-            raise HttpFormError(form)
-        return instance
+        return self.save_form()
 
 
-class DeleteApiViewMeta(ApiViewMeta):
-    class Meta(ApiViewMeta.Meta):
+# private QuerySet API, Meta.fast_delete falls back to delete() without it
+_raw_delete = getattr(QuerySet, "_raw_delete", None)
+
+
+@lru_cache(maxsize=None)
+def _can_raw_delete(model: Type[Model]) -> bool:
+    """
+    Rows of model can be deleted without collecting parents
+    and related objects
+    """
+    opts = model._meta
+    if opts.parents:
+        return False
+    if any(hasattr(f, "bulk_related_objects") for f in opts.private_fields):
+        return False
+    return all(
+        rel.on_delete is DO_NOTHING for rel in get_candidate_relations_to_delete(opts)
+    )
+
+
+class DeleteApiViewMeta(BulkApiViewMeta):
+    class Meta(BulkApiViewMeta.Meta):
         method: HttpMethod = HttpMethod.POST
         body_form: Type[forms.BaseForm] = GetApiForm
         model: Type[Model] = None
         object_key: str = "id"
+        fast_delete: bool = False
 
 
 class DeleteApiView(
@@ -133,12 +279,93 @@ class DeleteApiView(
     metaclass=DeleteApiViewMeta,
     checkmeta=False,
 ):
+    """
+    Deletes object by Meta.object_key.
+
+    Meta.many accepts json array of keys (or objects with the key),
+    permissions are checked by has_permissions of objects loaded by one
+    in_bulk or by get_permitted_queryset, objects are deleted by one
+    QuerySet.delete().
+    Meta.fast_delete deletes them by one DELETE query without signals
+    if no related objects have to be collected.
+    """
+
     Meta = DeleteApiViewMeta.Meta
 
     def has_permissions(self, obj: Model) -> bool:
         return True
 
+    def get_bulk_queryset(self) -> QuerySet:
+        m: Type[Model] = self.Meta.model
+        return m.objects.all()
+
+    def get_permitted_queryset(self, qs: QuerySet) -> Optional[QuerySet]:
+        """
+        Override to check permissions of bulk delete by queryset filter
+        instead of has_permissions of every object,
+        e.g. `qs.filter(owner=self.request.user)`
+
+        :param qs: queryset of requested objects
+        :return: queryset of objects allowed to delete,
+            None to check has_permissions
+        """
+        return None
+
+    def _check_bulk_permissions(self, qs: QuerySet, keys: set) -> Tuple[set, QuerySet]:
+        """
+        :return: found keys and queryset of objects to delete
+        """
+        key: str = self.Meta.object_key
+        permitted_qs = self.get_permitted_queryset(qs)
+        if permitted_qs is None:
+            objects = qs.in_bulk(keys, field_name=key)
+            if not all(self.has_permissions(obj) for obj in objects.values()):
+                raise ForbiddenError
+            return set(objects), qs
+        permitted_qs = permitted_qs.filter(**{f"{key}__in": keys})
+        permitted = set(permitted_qs.values_list(key, flat=True))
+        missing = keys - permitted
+        if missing and qs.filter(**{f"{key}__in": missing}).exists():
+            raise ForbiddenError
+        # permissions are checked again by the delete query
+        return permitted, permitted_qs
+
+    def delete_objects(self):
+        """
+        Items are keys or objects with Meta.object_key, every item
+        is validated by Meta.body_form, missing objects are reported
+        by index in field_problems
+        """
+        key: str = self.Meta.object_key
+        key_forms = [
+            self.Meta.body_form(data=item if isinstance(item, dict) else {key: item})
+            for item in self.iter_request_json(self.request)
+        ]
+        if not all(form.is_valid() for form in key_forms):
+            raise HttpBulkFormError(key_forms)
+
+        keys = {form.cleaned_data[key] for form in key_forms}
+        qs = self.get_bulk_queryset().filter(**{f"{key}__in": keys})
+        found = set()
+        if keys:
+            found, qs = self._check_bulk_permissions(qs, keys)
+        for form in key_forms:
+            if form.cleaned_data[key] not in found:
+                form.add_error(key, NotFoundError().description)
+        if any(form.errors for form in key_forms):
+            raise HttpBulkFormError(key_forms)
+
+        if not keys:
+            return {}
+        if self.Meta.fast_delete and _raw_delete and _can_raw_delete(qs.model):
+            _raw_delete(qs, qs.db)
+        else:
+            qs.delete()
+        return {}
+
     def execute(self, request, *args, **kwargs):
+        if self.Meta.many:
+            return self.delete_objects()
         obj = self._get_object()
         self.check_permissions(obj=obj)
         obj.delete()
@@ -153,10 +380,19 @@ class ListApiViewMeta(ApiViewMeta):
         serializer_many: bool = True
         paginator: Optional[Type[BasePaginator]] = None
         ordering: tuple = ("id",)
+        prune_columns: bool = True
+        plan_relations: bool = True
+        stream: bool = False
+        stream_chunk_size: int = 1000
+        last_modified_field: Optional[str] = None
 
 
 class ListApiView(
-    CheckPermissionsMixin, ApiView, metaclass=ListApiViewMeta, checkmeta=False
+    CheckPermissionsMixin,
+    QuerySetPlanMixin,
+    ApiView,
+    metaclass=ListApiViewMeta,
+    checkmeta=False,
 ):
     Meta = ListApiViewMeta.Meta
 
@@ -164,7 +400,38 @@ class ListApiView(
         return True
 
     def get_queryset(self):
-        return self.Meta.model.objects.all().order_by(*self.Meta.ordering)
+        qs = self.Meta.model.objects.all().order_by(*self.Meta.ordering)
+        return self.plan_queryset(qs)
+
+    def get_validator_queryset(self) -> QuerySet:
+        """
+        Queryset validating the list, default is view queryset before pagination
+        """
+        return self.get_queryset().order_by()
+
+    def _validator_aggregates(self) -> dict:
+        return {
+            "last_modified": Max(self.Meta.last_modified_field),
+            "count": Count("pk"),
+        }
+
+    @staticmethod
+    def _list_validators(aggregated: dict) -> tuple:
+        count, last_modified = aggregated["count"], aggregated["last_modified"]
+        stamp = last_modified.timestamp() if last_modified else ""
+        return f'W/"{count}-{stamp}"', last_modified
+
+    def get_validators(
+        self, request, response
+    ) -> Tuple[Optional[str], Optional[datetime.datetime]]:
+        """
+        List is validated by `MAX(Meta.last_modified_field), COUNT(*)`
+        of validator queryset, queried once before serialization
+        """
+        if not self.Meta.last_modified_field:
+            return None, None
+        qs = self.get_validator_queryset()
+        return self._list_validators(qs.aggregate(**self._validator_aggregates()))
 
     def build_response(self, qs, qs_after_paginator=None):
         if qs_after_paginator is None:
@@ -188,3 +455,200 @@ class ListApiView(
             paginator.validate_form()
             qs_after_paginator = paginator.paginate(qs)
         return self.build_response(qs=qs, qs_after_paginator=qs_after_paginator)
+
+    def is_streamed(self, request, response) -> bool:
+        """
+        Queryset response is streamed if Meta.stream is set
+        and columnar output is not requested
+        """
+        return (
+            self.Meta.stream
+            and self.Meta.serializer_many
+            and isinstance(response, QuerySet)
+            and not self.is_columnar(request)
+        )
+
+    def _stream_pipeline(self, qs: QuerySet) -> Iterator[list]:
+        return self._chunk_pipeline(qs, self.Meta.stream_chunk_size)
+
+    def perform_response_pipelines(self, request, response):
+        """
+        Renders queryset as StreamingHttpResponse if Meta.stream is set.
+
+        Queryset is iterated by chunks of Meta.stream_chunk_size, every chunk
+        is serialized and rendered separately while response is sent.
+        Errors raised during streaming can not be rendered as error response.
+        Serialization of streamed chunks is not timed.
+        """
+        if not self.is_streamed(request, response):
+            return super().perform_response_pipelines(request, response)
+
+        stream = self._stream_pipeline(response)
+        with self._stage("envelope"):
+            response = self._generic_response(stream)
+        with self._stage("render"):
+            renderer = self.get_renderer(request)
+            return renderer.render_stream(response, key=self._data_key)
+
+
+class AsyncCreateApiView(
+    AsyncApiView, CreateApiView, metaclass=CreateApiViewMeta, checkmeta=False
+):
+    """
+    Async CreateApiView. Model form has no async API,
+    it is validated and saved in a thread.
+    """
+
+    Meta = CreateApiViewMeta.Meta
+
+    async def execute(self, request, *args, **kwargs):
+        self.check_permissions()
+        return await sync_to_async(self.perform_create)()
+
+
+class AsyncGetApiView(
+    AsyncApiView,
+    AsyncObjectMixin,
+    GetApiView,
+    metaclass=GetApiViewMeta,
+    checkmeta=False,
+):
+    """
+    Async GetApiView, object is loaded by `aget`
+    """
+
+    Meta = GetApiViewMeta.Meta
+
+    async def aget_object(self):
+        m: Type[Model] = self.Meta.model
+        key: str = self.Meta.object_key
+        qs = self.plan_queryset(m.objects.all())
+        return await qs.aget(**{key: self.request_query[key]})
+
+    async def execute(self, request, *args, **kwargs):
+        obj = await self._aget_object()
+        self.check_permissions(obj=obj)
+        return obj
+
+
+class AsyncUpdateApiView(
+    AsyncApiView,
+    AsyncObjectMixin,
+    UpdateApiView,
+    metaclass=UpdateApiViewMeta,
+    checkmeta=False,
+):
+    """
+    Async UpdateApiView, object is loaded by `aget`.
+    Model form has no async API, it is validated and saved in a thread.
+    """
+
+    Meta = UpdateApiViewMeta.Meta
+
+    async def execute(self, request, *args, **kwargs):
+        if self.Meta.many:
+            return await sync_to_async(self.update_objects)()
+        obj = await self._aget_object()
+        if not self.has_permissions(obj):
+            raise ForbiddenError
+        return await sync_to_async(self.save_form)()
+
+
+class AsyncDeleteApiView(
+    AsyncApiView,
+    AsyncObjectMixin,
+    DeleteApiView,
+    metaclass=DeleteApiViewMeta,
+    checkmeta=False,
+):
+    """
+    Async DeleteApiView, object is loaded by `aget` and deleted by `adelete`
+    """
+
+    Meta = DeleteApiViewMeta.Meta
+
+    async def execute(self, request, *args, **kwargs):
+        if self.Meta.many:
+            return await sync_to_async(self.delete_objects)()
+        obj = await self._aget_object()
+        self.check_permissions(obj=obj)
+        await obj.adelete()
+        return {}
+
+
+class AsyncListApiView(
+    AsyncApiView, ListApiView, metaclass=ListApiViewMeta, checkmeta=False
+):
+    """
+    Async ListApiView. Paginators are applied by `apaginate`,
+    querysets returned from `abuild_response` are evaluated by async iteration.
+    Streamed querysets are iterated by `aiterator`.
+    """
+
+    Meta = ListApiViewMeta.Meta
+
+    async def aget_validators(self, request, response):
+        if not self.Meta.last_modified_field:
+            return None, None
+        qs = self.get_validator_queryset()
+        aggregated = await qs.aaggregate(**self._validator_aggregates())
+        return self._list_validators(aggregated)
+
+    async def abuild_response(self, qs, qs_after_paginator=None):
+        """
+        Override to build response by async ORM, e.g. count by `acount`.
+        Default implementation calls `build_response`
+        """
+        return self.build_response(qs=qs, qs_after_paginator=qs_after_paginator)
+
+    async def execute(self, request, *args, **kwargs):
+        self.check_permissions()
+        qs = self.get_queryset()
+        qs_after_paginator = None
+        paginator = self.get_paginator(qs)
+        if paginator:
+            paginator.validate_form()
+            qs_after_paginator = await paginator.apaginate(qs)
+        return await self.abuild_response(qs=qs, qs_after_paginator=qs_after_paginator)
+
+    async def _astream_pipeline(self, qs: QuerySet) -> AsyncIterator[list]:
+        chunk_size = self.Meta.stream_chunk_size
+        serializer = self.get_serializer()
+        # aiterator() does not support prefetch_related,
+        # lookups are made for every chunk like in _chunk_pipeline
+        lookups = qs._prefetch_related_lookups
+        items = qs.prefetch_related(None).aiterator(chunk_size=chunk_size)
+
+        @sync_to_async
+        def process(chunk):
+            if lookups:
+                prefetch_related_objects(chunk, *lookups)
+            return serializer.dump(chunk) if serializer else chunk
+
+        try:
+            chunk = []
+            async for item in items:
+                chunk.append(item)
+                if len(chunk) == chunk_size:
+                    yield await process(chunk)
+                    chunk = []
+            if chunk:
+                yield await process(chunk)
+        finally:
+            if serializer:
+                serializer_pool.release(serializer)
+
+    async def aperform_response_pipelines(self, request, response):
+        """
+        Renders queryset as StreamingHttpResponse with async iterator
+        if Meta.stream is set, see ListApiView.perform_response_pipelines
+        """
+        if not self.is_streamed(request, response):
+            return await super().aperform_response_pipelines(request, response)
+
+        stream = self._astream_pipeline(response)
+        with self._stage("envelope"):
+            response = self._generic_response(stream)
+        with self._stage("render"):
+            renderer = self.get_renderer(request)
+            return renderer.render_astream(response, key=self._data_key)
@@ -1,11 +1,14 @@
 import copy
 import enum
 import inspect
+import logging
 import sys
-from typing import Optional, List, Type, Union
+from typing import FrozenSet, NamedTuple, Optional, List, Type, Union
 
+from django.db.models import Model
 from django.forms import BaseForm
 
+from django_serializer.v2.cache import ResponseCache
 from django_serializer.v2.exceptions import IncorrectMetaException, HttpError
 from django_serializer.v2.parsers import BaseParser
 from django_serializer.v2.renderers import BaseRenderer
@@ -24,6 +27,25 @@ class HttpMethod(enum.Enum):
     TRACE = "trace"
 
 
+class DispatchPlan(NamedTuple):
+    """
+    Per class state used by ApiView.dispatch, resolved once by ApiViewMeta.
+    Parser and renderer instances are shared between requests.
+    """
+
+    logger: logging.Logger
+    methods: FrozenSet[str]
+    parser: Optional[BaseParser]
+    renderer: Optional[BaseRenderer]
+    query_form: Optional[Type[BaseForm]]
+    body_form: Optional[Type[BaseForm]]
+    serializer_many: bool
+    pool_serializer: bool
+    columnar: bool
+    sparse_fields: bool
+    cache: Optional[ResponseCache]
+
+
 class ApiViewMeta(type):
     class Meta:
         method: HttpMethod = None
@@ -35,8 +57,20 @@ class ApiViewMeta(type):
         body_parser: Optional[
             Type[BaseParser]
         ] = settings.SERIALIZER_DEFAULT_PARSER_CLASS
+        body_max_size: Optional[int] = None
+        body_max_depth: Optional[int] = 64
         serializer: Optional[Type[Serializer]] = None
         serializer_many: bool = False
+        render_chunk_size: Optional[int] = None
+        reuse_serializer: bool = False
+        columnar: bool = False
+        sparse_fields: bool = False
+        cache: bool = False
+        cache_timeout: int = 60
+        cache_stale_timeout: int = 0
+        cache_vary_on_user: bool = False
+        cache_vary_on_headers: tuple = ()
+        cache_models: tuple = ()
         errors: List[Type[HttpError]] = []
         renderer: Type[BaseRenderer] = settings.SERIALIZER_DEFAULT_RENDERER_CLASS
 
@@ -56,12 +90,57 @@ class ApiViewMeta(type):
             mj, mn = sys.version_info[:2]
             if mj >= 3 and mn >= 7:
                 mcs.check_meta(meta, errors)
+            mcs.check_cache_permissions(cls, meta, errors)
             if errors:
                 raise IncorrectMetaException(name, errors)
             attrs["Meta"] = meta
 
+        cls._dispatch_plan = mcs.build_dispatch_plan(cls)
         return cls
 
+    @staticmethod
+    def build_dispatch_plan(cls) -> DispatchPlan:
+        # root is the base view class, its methods are not overridden
+        root = next(c for c in reversed(cls.__mro__) if isinstance(c, ApiViewMeta))
+
+        def overridden(name: str) -> bool:
+            return getattr(cls, name) is not getattr(root, name)
+
+        meta = cls.Meta
+        method = getattr(meta, "method", None)
+        methods = {method.value.upper()} if method else set()
+        if method is HttpMethod.GET:
+            methods.add("HEAD")
+        parser_class = getattr(meta, "body_parser", None)
+        renderer_class = getattr(meta, "renderer", None)
+        if overridden("get_renderer_class"):
+            renderer_class = None
+        cache = None
+        if getattr(meta, "cache", False):
+            cache = ResponseCache(
+                cls,
+                timeout=meta.cache_timeout,
+                stale_timeout=meta.cache_stale_timeout,
+                models=meta.cache_models,
+            )
+            cache.connect()
+        return DispatchPlan(
+            logger=logging.getLogger(f"django_serializer.views.{cls.__name__}"),
+            methods=frozenset(methods),
+            parser=parser_class() if parser_class else None,
+            renderer=renderer_class() if renderer_class else None,
+            query_form=getattr(meta, "query_form", None),
+            body_form=getattr(meta, "body_form", None),
+            serializer_many=getattr(meta, "serializer_many", False),
+            pool_serializer=(
+                getattr(meta, "reuse_serializer", False)
+                and not overridden("get_serializer_kwargs")
+            ),
+            columnar=getattr(meta, "columnar", False),
+            sparse_fields=getattr(meta, "sparse_fields", False),
+            cache=cache,
+        )
+
     @staticmethod
     def find_base_options(bases):
         for b in reversed(bases):
@@ -118,8 +197,41 @@ class ApiViewMeta(type):
                         "should be subtype of HttpError"
                     )
 
+        if getattr(meta, "cache", False):
+            if getattr(meta, "method", None) is not HttpMethod.GET:
+                errors.append("`cache` is allowed with `HttpMethod.GET` only")
+        cache_models = getattr(meta, "cache_models", ())
+        if cache_models:
+            try:
+                if any(not issubclass(item, Model) for item in cache_models):
+                    raise TypeError
+            except TypeError:
+                errors.append(
+                    "`cache_models` item has incorrect type, "
+                    "should be subclass of Model"
+                )
+
         return errors
 
+    @staticmethod
+    def check_cache_permissions(cls, meta: Type, errors: List):
+        """
+        Cached response is served without execute, so permissions
+        checked by overridden has_permissions have to be cached per user
+        """
+        if not getattr(meta, "cache", False):
+            return
+        if getattr(meta, "cache_vary_on_user", False):
+            return
+        for name in ("has_permissions", "check_permissions"):
+            owner = next((c for c in cls.__mro__ if name in vars(c)), None)
+            if owner is not None and not owner.__module__.startswith(
+                "django_serializer."
+            ):
+                errors.append(
+                    f"`cache` requires `cache_vary_on_user` with overridden `{name}`"
+                )
+
     @classmethod
     def check_meta(mcs, meta: Type, errors: List):
         from typing import _GenericAlias
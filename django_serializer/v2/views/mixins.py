@@ -1,14 +1,26 @@
-from typing import Type
+from functools import lru_cache, partial
+from typing import Collection, Dict, Iterator, List, Optional, Sequence, Tuple, Type
 
-from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import Model
+from django import forms
+from django.core.exceptions import (
+    NON_FIELD_ERRORS,
+    ObjectDoesNotExist,
+    ValidationError,
+)
+from django.db import connection, connections, router, transaction
+from django.db.models import Model, Q, QuerySet
+from django.db.models.signals import post_save
 from django.http import HttpRequest
 
 from django_serializer.v2.exceptions import (
     NotFoundError,
     AuthRequiredError,
+    BadRequestError,
     ForbiddenError,
+    HttpBulkFormError,
+    HttpFormError,
 )
+from django_serializer.v2.query import plan_queryset
 
 
 class FormMixin:
@@ -30,6 +42,351 @@ class FormMixin:
         form_class = self.get_form_class()
         return form_class(**self.get_form_kwargs())
 
+    def save_form(self):
+        form = self.get_form()
+        if form.is_valid():
+            return form.save()
+        raise HttpFormError(form)
+
+
+def _resolve_choice(field: forms.ModelChoiceField, objects: dict, key_field, value):
+    """
+    ModelChoiceField.to_python taking objects loaded in bulk
+    """
+    if value in field.empty_values:
+        return None
+    try:
+        obj = objects.get(key_field.to_python(value))
+    except (ValidationError, TypeError):
+        obj = None
+    if obj is None:
+        raise ValidationError(
+            field.error_messages["invalid_choice"],
+            code="invalid_choice",
+            params={"value": value},
+        )
+    return obj
+
+
+def _prefetch_choices(bulk_forms: Sequence[forms.BaseForm]):
+    """
+    Loads objects of every ModelChoiceField of all forms by one in_bulk
+    """
+    choice_fields: Dict[str, forms.ModelChoiceField] = {}
+    for form in bulk_forms:
+        for name, field in form.fields.items():
+            if (
+                isinstance(field, forms.ModelChoiceField)
+                and not isinstance(field, forms.ModelMultipleChoiceField)
+                and not field.disabled
+            ):
+                choice_fields.setdefault(name, field)
+
+    for name, field in choice_fields.items():
+        key = field.to_field_name or "pk"
+        model = field.queryset.model
+        key_field = model._meta.pk if key == "pk" else model._meta.get_field(key)
+        name_forms = [form for form in bulk_forms if name in form.fields]
+        values = set()
+        for form in name_forms:
+            value = form[name].data
+            try:
+                if value not in field.empty_values:
+                    values.add(key_field.to_python(value))
+            except (ValidationError, TypeError):
+                # reported as invalid choice by the field
+                continue
+        objects = field.queryset.in_bulk(values, field_name=key) if values else {}
+        for form in name_forms:
+            form_field = form.fields[name]
+            form_field.to_python = partial(
+                _resolve_choice, form_field, objects, key_field
+            )
+            if isinstance(form, _BulkModelForm):
+                form.prefetched_fields.add(name)
+
+
+class _BulkModelForm:
+    """
+    Model form validated by BulkFormMixin. Unique checks of all forms
+    are made by _validate_unique, relations loaded by _prefetch_choices
+    are not checked again by model validation.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prefetched_fields = set()
+        self._post_cleaning = False
+
+    def _post_clean(self):
+        self._post_cleaning = True
+        try:
+            super()._post_clean()
+        finally:
+            self._post_cleaning = False
+
+    def _get_validation_exclusions(self):
+        # list before Django 4.1
+        exclude = set(super()._get_validation_exclusions())
+        if self._post_cleaning:
+            exclude.update(self.prefetched_fields)
+        return exclude
+
+    def validate_unique(self):
+        pass
+
+
+@lru_cache(maxsize=None)
+def _bulk_form_class(form_class: Type[forms.BaseForm]) -> Type[forms.BaseForm]:
+    if not issubclass(form_class, forms.BaseModelForm):
+        return form_class
+    return type(form_class.__name__, (_BulkModelForm, form_class), {})
+
+
+def _unique_values(instance: Model, unique_check: Tuple[str, ...]) -> Optional[tuple]:
+    """
+    Values checked by Model._perform_unique_checks, None if check is skipped
+    """
+    values = []
+    for name in unique_check:
+        field = instance._meta.get_field(name)
+        value = getattr(instance, field.attname)
+        if value is None or (
+            value == "" and connection.features.interprets_empty_strings_as_nulls
+        ):
+            return None
+        if field.primary_key and not instance._state.adding:
+            return None
+        values.append(value)
+    return tuple(values)
+
+
+def _validate_unique(bulk_forms: Sequence[forms.ModelForm]):
+    """
+    ModelForm.validate_unique of all forms by one query per unique check.
+    Items of the same request are checked against each other as well.
+    """
+    checks: Dict[tuple, List[Tuple[forms.ModelForm, tuple]]] = {}
+    for form in bulk_forms:
+        if not getattr(form, "_validate_unique", False):
+            continue
+        instance = form.instance
+        unique_checks, date_checks = instance._get_unique_checks(
+            exclude=set(form._get_validation_exclusions())
+        )
+        for model_class, unique_check in unique_checks:
+            values = _unique_values(instance, unique_check)
+            if values is not None:
+                checks.setdefault((model_class, unique_check), []).append(
+                    (form, values)
+                )
+        if date_checks:
+            errors = instance._perform_date_checks(date_checks)
+            if errors:
+                form._update_errors(ValidationError(errors))
+
+    for (model_class, unique_check), items in checks.items():
+        if len(unique_check) == 1:
+            lookup = Q(**{f"{unique_check[0]}__in": {v for _, (v,) in items}})
+        else:
+            lookup = Q()
+            for _, values in items:
+                lookup |= Q(**dict(zip(unique_check, values)))
+        existing: Dict[tuple, set] = {}
+        qs = model_class._default_manager.filter(lookup)
+        for pk, *values in qs.values_list("pk", *unique_check):
+            existing.setdefault(tuple(values), set()).add(pk)
+
+        key = unique_check[0] if len(unique_check) == 1 else NON_FIELD_ERRORS
+        for form, values in items:
+            instance = form.instance
+            pks = existing.setdefault(values, set())
+            own_pk = None
+            if not instance._state.adding:
+                own_pk = instance._get_pk_val(model_class._meta)
+            if pks - {own_pk}:
+                message = instance.unique_error_message(model_class, unique_check)
+                form._update_errors(ValidationError({key: [message]}))
+            else:
+                # the next item with the same values is a duplicate
+                pks.add(form if own_pk is None else own_pk)
+
+
+def _field_values(instance: Model) -> dict:
+    return {
+        f.attname: getattr(instance, f.attname) for f in instance._meta.concrete_fields
+    }
+
+
+def _changed_fields(instance: Model, values: dict) -> list:
+    """
+    Concrete fields changed since values were taken by _field_values.
+    `auto_now` fields are added to any changes.
+
+    :return: model fields
+    """
+    changed = [
+        f
+        for f in instance._meta.concrete_fields
+        if not f.primary_key and getattr(instance, f.attname) != values[f.attname]
+    ]
+    if changed:
+        changed.extend(
+            f
+            for f in instance._meta.concrete_fields
+            if getattr(f, "auto_now", False) and f not in changed
+        )
+    return changed
+
+
+def _send_post_save_on_commit(
+    model: Type[Model],
+    objs: Sequence[Model],
+    using: str,
+    created: bool,
+    update_fields: Optional[Collection[str]] = None,
+):
+    """
+    Sends post_save of objects written by bulk queries after commit,
+    so serializer and response caches of the model are invalidated
+    """
+
+    def send():
+        for obj in objs:
+            post_save.send(
+                sender=model,
+                instance=obj,
+                created=created,
+                update_fields=update_fields,
+                raw=False,
+                using=using,
+            )
+
+    if objs:
+        transaction.on_commit(send, using=using)
+
+
+class BulkFormMixin:
+    """
+    Validates json array of objects by model form and saves them at once.
+
+    Choices of ModelChoiceField of all items are loaded by one `in_bulk`
+    per field, unique checks are made by one query per check.
+    """
+
+    def iter_bulk_items(self) -> Iterator[dict]:
+        """
+        :raise BadRequestError: if item is not json object
+        :return: iterator of request items
+        """
+        for item in self.iter_request_json(self.request):
+            if not isinstance(item, dict):
+                raise BadRequestError("body item is not an object")
+            yield item
+
+    def get_bulk_form_kwargs(self, data: dict) -> dict:
+        """
+        Override this to add extra kwargs for the form of every item
+
+        :param data: request item
+        """
+        return {"data": data}
+
+    def get_bulk_form(
+        self, data: dict, instance: Optional[Model] = None
+    ) -> forms.BaseForm:
+        """
+        Form of request item. Form of existing instance has only fields
+        present in data, other fields keep values of the instance.
+
+        :param data: request item
+        :param instance: updated object
+        """
+        kwargs = self.get_bulk_form_kwargs(data)
+        if instance is not None:
+            kwargs["instance"] = instance
+        form = _bulk_form_class(self.get_form_class())(**kwargs)
+        if instance is not None:
+            for name in set(form.fields).difference(data):
+                del form.fields[name]
+        return form
+
+    def get_bulk_forms(self) -> List[forms.BaseForm]:
+        return [self.get_bulk_form(item) for item in self.iter_bulk_items()]
+
+    def validate_bulk_forms(self, bulk_forms: Sequence[forms.BaseForm]) -> bool:
+        _prefetch_choices(bulk_forms)
+        for form in bulk_forms:
+            form.full_clean()
+        _validate_unique([f for f in bulk_forms if isinstance(f, _BulkModelForm)])
+        return all(form.is_valid() for form in bulk_forms)
+
+    def save_bulk_forms(self) -> List[Model]:
+        """
+        Creates objects of all items by one bulk_create in transaction.
+        bulk_create does not call save() and does not send pre_save,
+        post_save is sent for created objects after commit.
+        Databases which can not return
+        primary keys from bulk insert (e.g. SQLite before Django 4.0)
+        save objects one by one.
+
+        :raise HttpBulkFormError: if any item is invalid
+        :return: created objects
+        """
+        bulk_forms = self.get_bulk_forms()
+        if not self.validate_bulk_forms(bulk_forms):
+            raise HttpBulkFormError(bulk_forms)
+        model = self.get_form_class()._meta.model
+        objs = [form.save(commit=False) for form in bulk_forms]
+        using = router.db_for_write(model)
+        with transaction.atomic(using=using):
+            if connections[using].features.can_return_rows_from_bulk_insert:
+                model._default_manager.bulk_create(objs)
+                _send_post_save_on_commit(model, objs, using, created=True)
+            else:
+                for obj in objs:
+                    obj.save(force_insert=True, using=using)
+            for form in bulk_forms:
+                form.save_m2m()
+        return objs
+
+    def update_bulk_forms(self, bulk_forms: Sequence[forms.ModelForm]) -> List[Model]:
+        """
+        Saves objects of forms made by `get_bulk_form(data, instance)`.
+        Only changed fields are written by bulk_update in transaction,
+        one query per distinct set of changed fields.
+        bulk_update does not call save() and does not send pre_save,
+        post_save with `update_fields` is sent for updated objects
+        after commit.
+
+        :raise HttpBulkFormError: if any item is invalid
+        :return: updated objects
+        """
+        values = [_field_values(form.instance) for form in bulk_forms]
+        if not self.validate_bulk_forms(bulk_forms):
+            raise HttpBulkFormError(bulk_forms)
+        model = self.get_form_class()._meta.model
+        updates: Dict[tuple, List[Model]] = {}
+        for form, instance_values in zip(bulk_forms, values):
+            obj = form.save(commit=False)
+            fields = _changed_fields(obj, instance_values)
+            for field in fields:
+                if getattr(field, "auto_now", False):
+                    field.pre_save(obj, add=False)
+            if fields:
+                key = tuple(field.name for field in fields)
+                updates.setdefault(key, []).append(obj)
+        using = router.db_for_write(model)
+        with transaction.atomic(using=using):
+            for fields, objs in updates.items():
+                model._default_manager.bulk_update(objs, fields)
+                _send_post_save_on_commit(
+                    model, objs, using, created=False, update_fields=frozenset(fields)
+                )
+            for form in bulk_forms:
+                form.save_m2m()
+        return [form.instance for form in bulk_forms]
+
 
 class ObjectMixin:
     def _get_object(self):
@@ -52,6 +409,44 @@ class ObjectMixin:
         kwargs["instance"] = self._get_object()
         return kwargs
 
+    def save_form(self):
+        """
+        Saves only fields of the object changed by the form by update_fields
+        """
+        obj = self._get_object()
+        values = _field_values(obj)
+        form = self.get_form()
+        if not form.is_valid():
+            raise HttpFormError(form)
+        obj = form.save(commit=False)
+        update_fields = [field.name for field in _changed_fields(obj, values)]
+        if update_fields:
+            obj.save(update_fields=update_fields)
+        form.save_m2m()
+        return obj
+
+
+class AsyncObjectMixin(ObjectMixin):
+    """
+    ObjectMixin loading object by async ORM, `_get_object` then
+    returns the loaded object
+    """
+
+    async def _aget_object(self):
+        if hasattr(self, "_object"):
+            return getattr(self, "_object")
+        try:
+            obj = await self.aget_object()
+            setattr(self, "_object", obj)
+            return obj
+        except ObjectDoesNotExist:
+            raise NotFoundError
+
+    async def aget_object(self):
+        m: Type[Model] = self.Meta.model
+        key: str = self.Meta.object_key
+        return await m.objects.aget(**{key: self.request_body[key]})
+
 
 class LoginRequiredMixin:
     """
@@ -72,3 +467,34 @@ class CheckPermissionsMixin:
     def check_permissions(self, **kwargs):
         if not self.has_permissions(**kwargs):
             raise ForbiddenError
+
+
+class QuerySetPlanMixin:
+    """
+    Optimizes view queryset using serializer declaration,
+    see django_serializer.v2.query.QueryPlan
+
+    Meta.prune_columns loads only columns read by serializer
+    Meta.plan_relations adds select_related and prefetch_related
+    Requested sparse fieldset (see Meta.sparse_fields) limits planned fields
+    """
+
+    def get_plan_columns(self) -> Collection[str]:
+        """
+        Override to load model columns not read by serializer
+
+        :return: names of model columns
+        """
+        return ()
+
+    def plan_queryset(self, qs: QuerySet) -> QuerySet:
+        request_fields = self.request_fields or {}
+        return plan_queryset(
+            qs,
+            self.get_serializer_class(),
+            prune_columns=self.Meta.prune_columns,
+            plan_relations=self.Meta.plan_relations,
+            only=request_fields.get("fields"),
+            exclude=request_fields.get("exclude", ()),
+            columns=self.get_plan_columns(),
+        )
@@ -45,12 +45,31 @@ class BasePaginator:
             self._queryset = qs
         return self._queryset
 
+    async def acount(self) -> int:
+        """
+        Counts queryset by async ORM, `total_count` then returns the result
+        """
+        if self._count is None:
+            queryset = self._get_queryset()
+            if isinstance(queryset, QuerySet):
+                self._count = await queryset.acount()
+            else:
+                self._count = len(queryset)
+        return self._count
+
     def validate_form(self):
         self.data = self.view._form_pipeline(self.form, self.view.request.GET)
 
     def paginate(self, qs: Optional[Union[Collection, QuerySet]] = None):
         raise NotImplementedError
 
+    async def apaginate(self, qs: Optional[Union[Collection, QuerySet]] = None):
+        """
+        Used by async views. Default implementation calls `paginate`,
+        which must not evaluate queryset
+        """
+        return self.paginate(qs)
+
 
 class FromIdPaginator(BasePaginator):
     class FromIdForm(forms.Form):
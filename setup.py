@@ -38,4 +38,7 @@ setup(
         "marshmallow>=3.14.0",
         "apispec>=5.1.1",
     ],
+    extras_require={
+        "orjson": ["orjson>=3.6"],
+    },
 )
@@ -0,0 +1,81 @@
+import datetime
+import decimal
+import json
+import uuid
+
+import pytest
+from django.core.serializers.json import DjangoJSONEncoder
+
+from django_serializer.v2.exceptions import ParseException
+from django_serializer.v2.json_backends import OrjsonBackend, StdJsonBackend
+from django_serializer.v2.renderers import (
+    FastJsonRenderer,
+    JsonRenderer,
+    PrimitiveJsonRenderer,
+)
+
+
+@pytest.fixture(params=["std", "orjson"])
+def backend(request):
+    if request.param == "std":
+        return StdJsonBackend()
+    pytest.importorskip("orjson")
+    return OrjsonBackend()
+
+
+class TestJsonBackend:
+    data = {
+        "date": datetime.datetime(2020, 1, 1, 12, 0, 0, 123456, datetime.timezone.utc),
+        "decimal": decimal.Decimal("1.10"),
+        "uuid": uuid.UUID(int=1),
+        "list": [1, 1.5, "\u00e9", None, True],
+        1: "int key",
+    }
+
+    def test_dumps(self, backend):
+        expected = json.loads(json.dumps(self.data, cls=DjangoJSONEncoder))
+        assert json.loads(backend.dumps(self.data)) == expected
+
+    def test_primitive(self, backend):
+        data = {"a": [1, 1.5, "\u00e9", None, True, {"b": "c"}]}
+        assert json.loads(backend.dumps(data, primitive=True)) == data
+        with pytest.raises(TypeError):
+            backend.dumps({"decimal": decimal.Decimal("1.10")}, primitive=True)
+
+    def test_loads(self, backend):
+        assert backend.loads(b'{"a": [1, "\\u00e9"]}') == {"a": [1, "\u00e9"]}
+        with pytest.raises(ParseException):
+            backend.loads(b"{")
+        with pytest.raises(ParseException):
+            backend.loads(b"\xff")
+
+
+@pytest.mark.parametrize(
+    "renderer_class", [JsonRenderer, FastJsonRenderer, PrimitiveJsonRenderer]
+)
+class TestJsonRenderers:
+    def test_render(self, renderer_class):
+        response = renderer_class().render({"status": "ok", "data": [{"a": 1}]})
+        assert response["Content-Type"] == "application/json"
+        assert json.loads(response.content) == {"status": "ok", "data": [{"a": 1}]}
+
+    def test_render_stream(self, renderer_class):
+        response = renderer_class().render_stream(
+            {"status": "ok", "data": iter([[{"a": 1}], [], [{"a": 2}, {"a": 3}]])}
+        )
+        content = b"".join(response.streaming_content)
+        assert json.loads(content) == {
+            "status": "ok",
+            "data": [{"a": 1}, {"a": 2}, {"a": 3}],
+        }
+
+    def test_render_chunks(self, renderer_class):
+        response = renderer_class().render_chunks(
+            {"status": "ok", "data": iter([[{"a": 1}], [], [{"a": 2}, {"a": 3}]])}
+        )
+        assert not response.streaming
+        assert response["Content-Type"] == "application/json"
+        assert json.loads(response.content) == {
+            "status": "ok",
+            "data": [{"a": 1}, {"a": 2}, {"a": 3}],
+        }
@@ -0,0 +1,220 @@
+import datetime
+import threading
+import types
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from django_serializer.exceptions import SerializerFieldException
+from django_serializer.serializer import fields
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    from django_serializer.serializer.base import MultiSerializer, Serializer
+
+    class T(Serializer):
+        a = fields.IntegerField()
+        b = fields.CharField(required=False, default="default")
+        created = fields.DateTimeField()
+        method = fields.SerializerField(source="get_method")
+        function = fields.SerializerField(source=lambda obj: "function")
+        missing = fields.SerializerField(source="get_missing", required=False)
+
+        def get_method(self, obj):
+            return f"method {self.prefix}"
+
+        def __init__(self, *args, prefix="", **kwargs):
+            super().__init__(*args, **kwargs)
+            self.prefix = prefix
+
+    class Required(Serializer):
+        a = fields.IntegerField()
+        missing = fields.SerializerField(source="get_missing")
+
+    class Upper(fields.CharField):
+        def serialize(self, **kwargs):
+            return super().serialize(**kwargs).upper()
+
+    class Custom(Serializer):
+        b = Upper()
+
+        def _get_fields(self):
+            return [(name, field) for name, field in self.serializer_attrs]
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class WaitingField(fields.SerializerField):
+        def serialization_handler(self, obj):
+            barrier.wait()
+            return super().serialization_handler(obj)
+
+    class Threaded(Serializer):
+        name = WaitingField(source="get_name")
+
+        def __init__(self, *args, name="", **kwargs):
+            super().__init__(*args, **kwargs)
+            self.name = name
+
+        def get_name(self, obj):
+            return self.name
+
+    class Counted(Serializer):
+        instances = 0
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            type(self).instances += 1
+
+    class IntSerializer(Counted):
+        value = fields.IntegerField()
+
+    class StrSerializer(Counted):
+        value = fields.CharField()
+
+    class Multi(MultiSerializer):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.prefetched = []
+
+        def get_serializer_class(self, obj, **kwargs):
+            return IntSerializer if isinstance(obj.value, int) else StrSerializer
+
+        def prefetch_group(self, serializer_class, objs):
+            self.prefetched.append((serializer_class, objs))
+
+    class GroupedMulti(Multi):
+        grouped = True
+
+
+class Obj:
+    a = "1"
+    b = "b"
+    created = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class TestLegacySerializer:
+    expected = {
+        "a": 1,
+        "b": "b",
+        "created": "1577836800",
+        "method": "method x",
+        "function": "function",
+        "missing": None,
+    }
+
+    def test_obj(self):
+        assert T(Obj(), prefix="x").serialize() == self.expected
+
+    def test_dict(self):
+        data = {"a": 1, "b": None, "created": None}
+        assert T(data, prefix="x").serialize() == dict(
+            self.expected, b=None, created=None
+        )
+
+    def test_multiple(self):
+        assert T([Obj(), Obj()], multiple=True, prefix="x").serialize() == [
+            self.expected,
+            self.expected,
+        ]
+        assert T(
+            [Obj()], multiple=True, dict_format=True, dict_key="a"
+        ).serialize() == {"1": dict(self.expected, method="method ")}
+
+    def test_required(self):
+        with pytest.raises(SerializerFieldException):
+            Required(Obj()).serialize()
+
+    def test_custom_field(self):
+        assert Custom(Obj()).serialize() == {"b": "B"}
+
+    def test_threads(self):
+        with ThreadPoolExecutor(2) as executor:
+            results = list(
+                executor.map(
+                    lambda name: Threaded(Obj(), name=name).serialize(),
+                    ["first", "second"],
+                )
+            )
+        assert results == [{"name": "first"}, {"name": "second"}]
+        assert Threaded.serializer_attrs[0][1].serializer is None
+
+
+class TestTimestamp:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            datetime.datetime(2020, 1, 1, 12, 30, 15, 999999),
+            datetime.datetime(1960, 1, 1, 0, 0, 0, 500000),
+            datetime.datetime(2020, 6, 1, tzinfo=datetime.timezone.utc),
+            datetime.datetime(
+                2020, 6, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=3))
+            ),
+            datetime.date(2020, 3, 29),
+        ],
+    )
+    @pytest.mark.parametrize("time_zone", ["UTC", "Europe/Moscow", "America/New_York"])
+    def test_same_as_dateformat(self, settings, value, time_zone):
+        from django.utils.dateformat import format
+
+        settings.TIME_ZONE = time_zone
+        assert fields.to_timestamp(value) == int(format(value, "U"))
+        assert fields.DateTimeField().serialize(field_value=value) == format(value, "U")
+
+    def test_int(self, settings):
+        value = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+        assert fields.DateField(timestamp_type=int).serialize(field_value=value) == (
+            1577836800
+        )
+        field = fields.DateTimeField()
+        settings.SERIALIZER_TIMESTAMP_TYPE = int
+        assert field.serialize(field_value=value) == 1577836800
+        assert field.serialize(field_value=None) is None
+
+    def test_incorrect_type(self, settings):
+        value = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+        with pytest.raises(ImproperlyConfigured):
+            fields.DateField(timestamp_type=float)
+        settings.SERIALIZER_TIMESTAMP_TYPE = float
+        field = fields.DateTimeField()
+        with pytest.raises(ImproperlyConfigured):
+            field.serialize(field_value=value)
+
+
+class TestMultiSerializer:
+    objs = [types.SimpleNamespace(id=i, value=i if i % 3 else str(i)) for i in range(7)]
+    expected = [
+        {"value": "0"},
+        {"value": 1},
+        {"value": 2},
+        {"value": "3"},
+        {"value": 4},
+        {"value": 5},
+        {"value": "6"},
+    ]
+
+    @pytest.fixture(autouse=True)
+    def reset_instances(self):
+        IntSerializer.instances = StrSerializer.instances = 0
+
+    def test_per_object(self):
+        serializer = Multi(self.objs, multiple=True)
+        assert serializer.serialize() == self.expected
+        assert IntSerializer.instances + StrSerializer.instances == 7
+        assert serializer.prefetched == []
+
+    def test_grouped(self):
+        serializer = GroupedMulti(iter(self.objs), multiple=True)
+        assert serializer.serialize() == self.expected
+        assert (IntSerializer.instances, StrSerializer.instances) == (1, 1)
+        assert serializer.prefetched == [
+            (StrSerializer, [self.objs[0], self.objs[3], self.objs[6]]),
+            (IntSerializer, [self.objs[i] for i in (1, 2, 4, 5)]),
+        ]
+
+    def test_grouped_dict_format(self):
+        serializer = GroupedMulti(self.objs, multiple=True, dict_format=True)
+        assert serializer.serialize() == {
+            obj.id: data for obj, data in zip(self.objs, self.expected)
+        }
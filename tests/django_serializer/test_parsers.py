@@ -0,0 +1,115 @@
+import io
+import json
+
+import pytest
+
+from django_serializer.v2.exceptions import (
+    BodyTooLargeException,
+    NestingTooDeepException,
+    ParseException,
+)
+from django_serializer.v2.parsers import BaseParser, FastJsonParser, JsonParser
+
+
+class SmallChunksParser(JsonParser):
+    chunk_size = 3
+
+
+class StdParser(BaseParser):
+    def parse(self, data: bytes):
+        return JsonParser().parse(data)
+
+
+class TestJsonParser:
+    @pytest.fixture(params=[JsonParser, SmallChunksParser, StdParser, FastJsonParser])
+    def parser(self, request):
+        return request.param()
+
+    @pytest.mark.parametrize(
+        "body, expected",
+        [
+            (b"[]", []),
+            (b" [ ] ", []),
+            (
+                b'[1, 22,333, 1.5e3, true, null, "x\\u00e9y"]',
+                [1, 22, 333, 1500.0, True, None, "x\u00e9y"],
+            ),
+            (
+                '["\u00e9", "\u65e5\u672c", {"a": [1, 2]}]'.encode(),
+                ["\u00e9", "\u65e5\u672c", {"a": [1, 2]}],
+            ),
+            ("\ufeff[1]".encode(), [1]),
+        ],
+    )
+    def test_iter_stream(self, parser, body, expected):
+        assert list(parser.iter_stream(io.BytesIO(body))) == expected
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 4, 5])
+    @pytest.mark.parametrize(
+        "body, expected",
+        [
+            (b"[1.5, 2.25]", [1.5, 2.25]),
+            (b"[12.5]", [12.5]),
+            (b"[-1e-3,10.25E2 ]", [-0.001, 1025.0]),
+        ],
+    )
+    def test_split_numbers(self, chunk_size, body, expected):
+        parser = JsonParser()
+        parser.chunk_size = chunk_size
+        assert list(parser.iter_stream(io.BytesIO(body))) == expected
+
+    @pytest.mark.parametrize(
+        "body", [b"", b"{}", b"[1,]", b"[1 2]", b"[1", b"[1] x", b'["abc', b"[\xff]"]
+    )
+    def test_invalid(self, parser, body):
+        with pytest.raises(ParseException):
+            list(parser.iter_stream(io.BytesIO(body)))
+
+    def test_large_item(self, monkeypatch):
+        calls = []
+        raw_decode = json.JSONDecoder.raw_decode
+
+        def counted(self, *args, **kwargs):
+            calls.append(args)
+            return raw_decode(self, *args, **kwargs)
+
+        monkeypatch.setattr(json.JSONDecoder, "raw_decode", counted)
+        item = {"a": ["x" * 100] * 10000}
+        body = json.dumps([1, item, 2]).encode()
+        assert list(SmallChunksParser().iter_stream(io.BytesIO(body))) == [1, item, 2]
+        # buffer is doubled before every retry
+        assert len(calls) < 40
+
+    def test_invalid_item_not_retried(self):
+        body = io.BytesIO(b'[{"a": 1 "b": 2}' + b" " * 1000 + b"]")
+        with pytest.raises(ParseException):
+            list(SmallChunksParser().iter_stream(body))
+        # error is not at the end of text, rest of body is not read
+        assert body.tell() < 100
+
+    def test_lazy(self):
+        items = SmallChunksParser().iter_stream(io.BytesIO(b"[1, 2, x"))
+        assert next(items) == 1
+        assert next(items) == 2
+        with pytest.raises(ParseException):
+            next(items)
+
+    def test_max_depth(self, parser):
+        body = b'[{"a": [1]}]'
+        assert list(parser.iter_stream(io.BytesIO(body), max_depth=3))
+        with pytest.raises(NestingTooDeepException):
+            list(parser.iter_stream(io.BytesIO(body), max_depth=2))
+        with pytest.raises(NestingTooDeepException):
+            parser.parse_stream(io.BytesIO(body), max_depth=2)
+
+    def test_max_size(self, parser):
+        body = b"[1, 2, 3, 4]"
+        assert parser.parse_stream(io.BytesIO(body), max_size=len(body)) == [1, 2, 3, 4]
+        with pytest.raises(BodyTooLargeException):
+            parser.parse_stream(io.BytesIO(body), max_size=len(body) - 1)
+        with pytest.raises(BodyTooLargeException):
+            list(parser.iter_stream(io.BytesIO(body), max_size=len(body) - 1))
+
+    def test_recursion(self):
+        with pytest.raises(ParseException):
+            JsonParser().parse(b"[" * 100000)
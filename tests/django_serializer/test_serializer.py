@@ -1,10 +1,17 @@
 import datetime
 
 import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from django_serializer.v2.exceptions import IncorrectMetaException
-from django_serializer.v2.serializer import Serializer, ModelSerializer
-from tests.tproj.app.models import SomeModel
+from django_serializer.v2.serializer import (
+    Serializer,
+    ModelSerializer,
+    SerializerPool,
+)
+from tests.tproj.app.models import ChildModel, ParentModel, SomeModel
 from marshmallow import fields
 
 
@@ -92,3 +99,316 @@ class TestModelSerializer:
 
         res = T().dump(model)
         assert res == {"f": 1.1, "i": 1, "id": None, "nullable": None}
+
+
+class TestCompiledModelSerializer:
+    @pytest.fixture
+    def models(self, freeze_t):
+        return [
+            SomeModel(id=1, i=1, f=1.1, nullable=None, created=datetime.datetime.now()),
+            SomeModel(id=2, i=2, f=2, nullable="n", created=None),
+        ]
+
+    @staticmethod
+    def _serializers(**smeta):
+        class Plain(ModelSerializer):
+            class SMeta:
+                model = SomeModel
+                locals().update(smeta)
+
+            extra = fields.Function(lambda obj: obj is not None)
+            renamed = fields.Int(attribute="i", data_key="other", dump_only=True)
+
+        class Compiled(Plain):
+            class SMeta(Plain.SMeta):
+                compiled = True
+
+        return Plain, Compiled
+
+    def test_incorrect_meta(self):
+        with pytest.raises(IncorrectMetaException):
+
+            class T(ModelSerializer):
+                class SMeta:
+                    model = SomeModel
+                    compiled = 1
+
+    @pytest.mark.parametrize("smeta", [{}, {"fields": ("id", "created")}])
+    def test_identical_output(self, models, smeta):
+        plain, compiled = self._serializers(**smeta)
+        expected = plain(many=True).dump(models)
+        result = compiled(many=True).dump(models)
+        assert result == expected
+        assert [list(item) for item in result] == [list(item) for item in expected]
+        assert compiled().dump(models[0]) == plain().dump(models[0])
+
+    def test_only(self, models):
+        plain, compiled = self._serializers()
+        expected = plain(only=("i", "renamed")).dump(models[0])
+        assert compiled(only=("i", "renamed")).dump(models[0]) == expected
+
+    def test_columns(self, models):
+        plain, compiled = self._serializers()
+        expected = plain().dump_columns(models)
+        assert compiled().dump_columns(models) == expected
+        assert expected == {
+            "columns": ["extra", "other", "id", "i", "f", "nullable", "created"],
+            "data": {
+                "extra": [True, True],
+                "other": [1, 2],
+                "id": [1, 2],
+                "i": [1, 2],
+                "f": [1.1, 2.0],
+                "nullable": [None, "n"],
+                "created": ["2020-02-28T16:00:00", None],
+            },
+        }
+
+    def test_not_model_fallback(self):
+        plain, compiled = self._serializers()
+        data = {"i": "1", "f": "1.5", "nullable": 1, "id": 3, "created": None}
+        assert compiled().dump(data) == plain().dump(data)
+
+
+class TestSerializerPool:
+    class T(Serializer):
+        a = fields.Int()
+        nested = fields.Function(lambda obj, context: context["value"])
+
+    def test_reuse(self):
+        pool = SerializerPool()
+        first = pool.acquire(self.T, False, {"value": 1})
+        second = pool.acquire(self.T, False, {"value": 2})
+        assert first is not second
+        assert first.dump({"a": "1"}) == {"a": 1, "nested": 1}
+        assert second.dump({"a": "1"}) == {"a": 1, "nested": 2}
+
+        pool.release(first)
+        assert first.context == {}
+        assert pool.acquire(self.T, False, {"value": 3}) is first
+        assert first.dump({"a": "1"}) == {"a": 1, "nested": 3}
+
+    def test_nested_context(self):
+        class Inner(Serializer):
+            who = fields.Function(lambda obj, context: context["who"])
+
+        class Outer(Serializer):
+            inner = fields.Nested(Inner())
+            who = fields.Function(lambda obj, context: context["who"])
+
+        pool = SerializerPool()
+        serializer = pool.acquire(Outer, False, {"who": "alice"})
+        assert serializer.dump({"inner": {}}) == {
+            "inner": {"who": "alice"},
+            "who": "alice",
+        }
+        pool.release(serializer)
+        assert serializer.fields["inner"].schema.context == {}
+
+        assert pool.acquire(Outer, False, {"who": "bob"}) is serializer
+        assert serializer.dump({"inner": {}}) == {"inner": {"who": "bob"}, "who": "bob"}
+
+    def test_many(self):
+        pool = SerializerPool()
+        serializer = pool.acquire(self.T, True, {"value": 1})
+        pool.release(serializer)
+        assert pool.acquire(self.T, False, {"value": 1}) is not serializer
+        assert pool.acquire(self.T, True, {"value": 1}) is serializer
+
+    def test_not_pooled(self):
+        pool = SerializerPool()
+        pool.release(self.T())
+        assert pool.acquire(self.T, False, {}).context == {}
+
+    def test_only_exclude(self):
+        pool = SerializerPool()
+        only = pool.acquire(self.T, False, {"value": 1}, only=["a"])
+        assert only.dump({"a": "1"}) == {"a": 1}
+        exclude = pool.acquire(self.T, False, {"value": 1}, exclude=["a"])
+        assert exclude.dump({"a": "1"}) == {"nested": 1}
+        pool.release(only)
+        pool.release(exclude)
+        assert pool.acquire(self.T, False, {}, only=("a",)) is only
+        assert pool.acquire(self.T, False, {}, exclude=("a",)) is exclude
+        assert pool.acquire(self.T, False, {}) not in (only, exclude)
+
+    def test_variants(self):
+        pool = SerializerPool(variants=2)
+        first = pool.acquire(self.T, False, {}, only=["a"])
+        pool.acquire(self.T, False, {}, only=["nested"])
+        pool.acquire(self.T, False, {})
+        pool.release(first)
+        assert len(pool._free) == 2
+        assert pool.acquire(self.T, False, {}, only=["a"]) is not first
+
+
+class TestModelSerializerCache:
+    @pytest.fixture
+    def serializer_class(self):
+        class T(ModelSerializer):
+            class SMeta:
+                model = SomeModel
+                fields = ("id", "i")
+                cache = True
+
+            def get_attribute(self, obj, attr, default):
+                if attr == "i":
+                    self.context["calls"] += 1
+                return super().get_attribute(obj, attr, default)
+
+        yield T
+        T._serializer_cache.clear()
+        cache.clear()
+
+    @pytest.fixture
+    def objs(self, db, freeze_t):
+        return [SomeModel.objects.create(i=i, f=i) for i in range(3)]
+
+    def test_incorrect_meta(self):
+        with pytest.raises(IncorrectMetaException):
+
+            class T(ModelSerializer):
+                class SMeta:
+                    model = SomeModel
+                    cache = True
+                    cache_version = "1"
+
+    def test_not_model_field(self):
+        with pytest.raises(IncorrectMetaException) as e:
+
+            class T(ModelSerializer):
+                class SMeta:
+                    model = SomeModel
+                    fields = ("id",)
+                    cache = True
+
+                is_owner = fields.Method("get_is_owner")
+
+        assert e.value.errors == [
+            "`cache` can not be used with not model field `is_owner`"
+        ]
+
+    def test_hits(self, serializer_class, objs):
+        context = {"calls": 0}
+        serializer = serializer_class(many=True, context=context)
+        expected = [{"id": o.id, "i": o.i} for o in objs]
+        assert serializer.dump(objs[:2]) == expected[:2]
+        assert context["calls"] == 2
+        assert serializer.dump(objs) == expected
+        assert context["calls"] == 3
+
+        serializer_class._serializer_cache.clear()
+        assert serializer.dump(objs) == expected
+        assert serializer_class(context=context).dump(objs[0]) == expected[0]
+        assert context["calls"] == 3
+
+    def test_invalidation(self, serializer_class, objs):
+        context = {"calls": 0}
+        serializer = serializer_class(context=context)
+        serializer.dump(objs[0])
+        objs[0].i = 10
+        objs[0].save()
+        assert serializer.dump(objs[0]) == {"id": objs[0].id, "i": 10}
+        assert context["calls"] == 2
+
+    def test_only_not_cached(self, serializer_class, objs):
+        context = {"calls": 0}
+        serializer_class(context=context).dump(objs[0])
+        serializer = serializer_class(only=("i",), context=context)
+        assert serializer.dump(objs[0]) == {"i": 0}
+        assert context["calls"] == 2
+
+
+class TestModelSerializerExpand:
+    class Parent(ModelSerializer):
+        class SMeta:
+            model = ParentModel
+            fields = ("id", "name")
+
+    @pytest.fixture(params=[False, True], ids=["generic", "compiled"])
+    def serializer_class(self, request):
+        class T(ModelSerializer):
+            class SMeta:
+                model = ChildModel
+                fields = ("id", "parent_id")
+                expand = {"parent": self.Parent}
+                compiled = request.param
+
+        return T
+
+    @pytest.fixture
+    def children(self, db):
+        children = []
+        for i in range(3):
+            parent = ParentModel.objects.create(name=f"p{i}")
+            for j in range(2):
+                children.append(ChildModel.objects.create(parent=parent, name="c"))
+        return children
+
+    @pytest.mark.parametrize(
+        "expand, errors",
+        [
+            (["parent"], ["`expand` has incorrect type"]),
+            ({"name": "T"}, ["`name` is not foreign key of model"]),
+            ({"error": "T"}, ["`error` is not foreign key of model"]),
+        ],
+    )
+    def test_incorrect_meta(self, expand, errors):
+        with pytest.raises(IncorrectMetaException) as e:
+
+            class T(ModelSerializer):
+                class SMeta:
+                    model = ChildModel
+                    locals()["expand"] = expand
+
+        assert e.value.errors == errors
+
+    def test_with_cache(self):
+        with pytest.raises(IncorrectMetaException):
+
+            class T(ModelSerializer):
+                class SMeta:
+                    model = ChildModel
+                    expand = {"parent": "T"}
+                    cache = True
+
+    def test_many(self, serializer_class, children):
+        objs = list(ChildModel.objects.all())
+        with CaptureQueriesContext(connection) as queries:
+            data = serializer_class(many=True).dump(objs)
+        assert len(queries) == 1
+        assert data[5] == {
+            "id": 6,
+            "parent_id": 3,
+            "parent": {"id": 3, "name": "p2"},
+        }
+        assert [item["parent"]["id"] for item in data] == [1, 1, 2, 2, 3, 3]
+
+    def test_columns(self, serializer_class, children):
+        objs = list(ChildModel.objects.all())
+        with CaptureQueriesContext(connection) as queries:
+            data = serializer_class(many=True).dump_columns(objs)
+        assert len(queries) == 1
+        assert data["columns"] == ["id", "parent_id", "parent"]
+        assert data["data"]["parent"][5] == {"id": 3, "name": "p2"}
+
+    def test_single(self, serializer_class, children):
+        obj = ChildModel.objects.get(pk=1)
+        with CaptureQueriesContext(connection) as queries:
+            data = serializer_class().dump(obj)
+        assert len(queries) == 1
+        assert data["parent"] == {"id": 1, "name": "p0"}
+
+    def test_cached_relation(self, serializer_class, children):
+        objs = list(ChildModel.objects.select_related("parent"))
+        with CaptureQueriesContext(connection) as queries:
+            data = serializer_class(many=True).dump(objs)
+        assert len(queries) == 0
+        assert data[0]["parent"] == {"id": 1, "name": "p0"}
+
+    def test_excluded(self, serializer_class, children):
+        objs = list(ChildModel.objects.all())
+        with CaptureQueriesContext(connection) as queries:
+            data = serializer_class(many=True, exclude=("parent",)).dump(objs)
+        assert len(queries) == 0
+        assert data[0] == {"id": 1, "parent_id": 1}
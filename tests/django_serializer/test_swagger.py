@@ -1,3 +1,4 @@
+import django
 from django import forms
 from marshmallow import fields as f
 
@@ -52,11 +53,18 @@ class TestSwagger:
         assert set((json["components"]["schemas"].keys())) == {
             "ListSomeModelSerializer",
             "SomeModelSerializer",
+            "ShortSomeModelSerializer",
+            "ParentSerializer",
+            "ChildSerializer",
+            "ChildSerializer1",
+            "ParentWithChildrenSerializer",
+            "ExpandedChildSerializer",
+            "LabelSerializer",
             "TestSerializer",
             "BadRequest",
             "NotFound",
         }
-        assert set((json["paths"].keys())) == {
+        paths = {
             "/500",
             "/create",
             "/delete",
@@ -67,11 +75,55 @@ class TestSwagger:
             "/paginate_list",
             "/post",
             "/limit_offset_paginate_list",
+            "/short_list",
+            "/short_get",
+            "/not_pruned_list",
+            "/child_list",
+            "/stream_list",
+            "/sparse_list",
+            "/expanded_child_list",
+            "/async/create",
+            "/bulk_create",
+            "/label_bulk_create",
+            "/async/bulk_create",
+            "/bulk_update",
+            "/label_bulk_update",
+            "/async/bulk_update",
+            "/bulk_delete",
+            "/permitted_bulk_delete",
+            "/fast_bulk_delete",
+            "/fast_parent_bulk_delete",
+            "/async/bulk_delete",
+            "/async/get_model",
+            "/async/update",
+            "/async/delete",
+            "/async/paginate_list",
+            "/async/stream_list",
+            "/async/expanded_child_list",
+            "/conditional_get",
+            "/conditional_list",
+            "/async/conditional_list",
+            "/cached_get",
+            "/cached_list",
+            "/async/cached_list",
+            "/compressed_list",
+            "/compressed_stream_list",
+            "/async/compressed_stream_list",
+            "/primitive_list",
+            "/chunked_list",
+            "/chunked_parent_list",
+            "/async/chunked_list",
+            "/parent_list",
             "/post_body",
+            "/limited_post_body",
+            "/stream_body",
             "/serializer",
             "/serializer_many",
             "/update",
         }
+        if django.VERSION < (4, 2):
+            paths = {p for p in paths if not p.startswith("/async/")}
+        assert set((json["paths"].keys())) == paths
 
     def test_get_view(self, client):
         resp = client.get("/swagger.json")
@@ -109,6 +161,13 @@ class TestSwagger:
 
         assert path_tags == SomeModelCreateView.Meta.tags
 
+    def test_bulk_create_view(self, client):
+        resp = client.get("/swagger.json")
+        path = resp.json()["paths"]["/bulk_create"]["post"]
+        path_body = path["requestBody"]["content"]["application/json"]["schema"]
+        assert path_body["type"] == "array"
+        assert sorted(path_body["items"]["properties"]) == ["f", "i", "nullable"]
+
     def test_update_view(self, client):
         resp = client.get("/swagger.json")
         path = resp.json()["paths"]["/update"]["post"]
@@ -0,0 +1,257 @@
+import gzip
+import json
+
+import django
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.test import AsyncClient
+
+from django_serializer.v2.views import AsyncApiView
+from tests.tproj.app.models import ChildModel, ParentModel, SomeModel
+
+pytestmark = pytest.mark.skipif(
+    django.VERSION < (4, 2), reason="async views require Django 4.2+"
+)
+
+
+class SyncAsyncClient:
+    """
+    Calls AsyncClient methods from sync tests, async ORM runs
+    in the test thread and sees test transaction
+    """
+
+    def __init__(self):
+        self.client = AsyncClient()
+
+    @staticmethod
+    def _run(coroutine):
+        async def _await():
+            return await coroutine
+
+        return async_to_sync(_await)()
+
+    def get(self, path, data=None, **extra):
+        return self._run(self.client.get(path, data, **extra))
+
+    def post(self, path, json_data):
+        return self._run(
+            self.client.post(
+                path, json.dumps(json_data), content_type="application/json"
+            )
+        )
+
+    def get_stream(self, path, data=None, **extra):
+        async def _get():
+            response = await self.client.get(path, data, **extra)
+            content = b"".join([chunk async for chunk in response])
+            return response, content
+
+        return self._run(_get())
+
+
+def test_unsupported_django(monkeypatch):
+    monkeypatch.setattr(django, "VERSION", (4, 1, 0, "final", 0))
+    with pytest.raises(ImproperlyConfigured):
+        AsyncApiView.as_view()
+
+
+@pytest.fixture
+def aclient():
+    return SyncAsyncClient()
+
+
+some_model_data = {
+    "created": "2020-02-28T16:00:00+00:00",
+    "f": 1.0,
+    "i": 1,
+    "id": 1,
+    "nullable": None,
+}
+
+
+class TestAsyncGetApiView:
+    def test_success(self, aclient, some_model):
+        resp = aclient.get("/async/get_model", {"id": some_model.pk})
+        assert resp.status_code == 200
+        assert resp.json() == {"data": some_model_data, "status": "ok"}
+
+    @pytest.mark.usefixtures("db")
+    def test_404(self, aclient):
+        resp = aclient.get("/async/get_model", {"id": 1})
+        assert resp.status_code == 404
+
+    def test_without_perm(self, aclient, some_model_without_perm):
+        resp = aclient.get("/async/get_model", {"id": some_model_without_perm.pk})
+        assert resp.status_code == 403
+
+    def test_bad_request(self, aclient):
+        resp = aclient.get("/async/get_model")
+        assert resp.status_code == 400
+        assert resp.json()["field_problems"] == {"id": ["This field is required."]}
+
+
+class TestAsyncCreateUpdateDeleteApiView:
+    @pytest.mark.usefixtures("db", "freeze_t")
+    def test_create(self, aclient):
+        resp = aclient.post("/async/create", {"f": 1, "i": 1, "nullable": "null"})
+        assert resp.status_code == 200
+        assert resp.json()["data"] == dict(some_model_data, nullable="null")
+
+    @pytest.mark.usefixtures("db")
+    def test_create_bad_request(self, aclient):
+        resp = aclient.post("/async/create", {})
+        assert resp.status_code == 400
+
+    def test_update(self, aclient, some_model):
+        resp = aclient.post(
+            "/async/update", {"id": some_model.pk, "f": 2, "i": 2, "nullable": "new"}
+        )
+        assert resp.status_code == 200
+        assert resp.json()["data"]["nullable"] == "new"
+        some_model.refresh_from_db()
+        assert some_model.i == 2
+
+    def test_delete(self, aclient, some_model):
+        resp = aclient.post("/async/delete", {"id": some_model.pk})
+        assert resp.status_code == 200
+        assert not SomeModel.objects.exists()
+
+
+class TestAsyncListApiView:
+    def test_paginate(self, aclient, some_model, some_model_2, some_model_3):
+        resp = aclient.get("/async/paginate_list", {"from_id": 1, "limit": 1})
+        assert resp.status_code == 200
+        data = resp.json()["data"]
+        assert data["count"] == 3
+        assert [item["id"] for item in data["list"]] == [2]
+
+    @pytest.mark.usefixtures("db")
+    def test_stream(self, aclient):
+        for i in range(3):
+            parent = ParentModel.objects.create(name=f"p{i}")
+            ChildModel.objects.create(parent=parent, name=f"c{i}")
+        with CaptureQueriesContext(connection) as queries:
+            resp, content = aclient.get_stream("/async/stream_list")
+        assert resp.status_code == 200
+        assert resp.streaming
+        # parents are iterated by aiterator, children are prefetched per chunk
+        assert len(queries) == 3
+        assert json.loads(content) == {
+            "status": "ok",
+            "data": [
+                {
+                    "id": i + 1,
+                    "name": f"p{i}",
+                    "children": [{"id": i + 1, "name": f"c{i}"}],
+                }
+                for i in range(3)
+            ],
+        }
+
+    @pytest.mark.usefixtures("db")
+    def test_expand(self, aclient):
+        for i in range(2):
+            parent = ParentModel.objects.create(name=f"p{i}")
+            ChildModel.objects.create(parent=parent, name=f"c{i}")
+        with CaptureQueriesContext(connection) as queries:
+            resp = aclient.get("/async/expanded_child_list")
+        assert resp.status_code == 200
+        assert len(queries) == 2
+        assert resp.json()["data"] == [
+            {"id": i + 1, "name": f"c{i}", "parent": {"id": i + 1, "name": f"p{i}"}}
+            for i in range(2)
+        ]
+
+
+class TestAsyncConditionalList:
+    def test_not_modified(self, aclient, some_model, some_model_2):
+        resp = aclient.get("/async/conditional_list")
+        assert resp.status_code == 200
+        assert resp["ETag"] == 'W/"2-1582905600.0"'
+        assert resp["Last-Modified"] == "Fri, 28 Feb 2020 16:00:00 GMT"
+
+        resp = aclient.get(
+            "/async/conditional_list", headers={"If-None-Match": resp["ETag"]}
+        )
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+    def test_head(self, aclient, some_model):
+        resp = aclient._run(aclient.client.head("/async/conditional_list"))
+        assert resp.status_code == 200
+        assert resp.content == b""
+        assert resp["ETag"] == 'W/"1-1582905600.0"'
+
+
+class TestAsyncResponseCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+        yield
+        cache.clear()
+
+    def test_cached(self, aclient, some_model):
+        resp = aclient.get("/async/cached_list")
+        assert resp.json()["data"] == [some_model_data]
+        with CaptureQueriesContext(connection) as queries:
+            assert aclient.get("/async/cached_list").content == resp.content
+        assert len(queries) == 0
+
+        SomeModel.objects.create(i=2, f=2)
+        assert len(aclient.get("/async/cached_list").json()["data"]) == 2
+
+
+def test_compressed_stream(aclient, some_model, some_model_2):
+    resp, content = aclient.get_stream(
+        "/async/compressed_stream_list", headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp["Content-Encoding"] == "gzip"
+    data = json.loads(gzip.decompress(content))
+    assert data["data"] == [
+        some_model_data,
+        dict(some_model_data, id=2, i=2, f=2.0, nullable="test"),
+    ]
+
+
+def test_chunked_rendering(aclient, client, some_model, some_model_2):
+    resp = aclient.get("/async/chunked_list")
+    assert resp.status_code == 200
+    assert not resp.streaming
+    assert resp.json() == client.get("/list").json()
+
+
+@pytest.mark.usefixtures("db")
+def test_bulk_create(aclient):
+    resp = aclient.post(
+        "/async/bulk_create",
+        [{"f": 1, "i": 1, "nullable": "a"}, {"f": 2, "i": 2}],
+    )
+    assert resp.status_code == 400
+    assert list(resp.json()["field_problems"]) == ["1"]
+
+    resp = aclient.post(
+        "/async/bulk_create",
+        [{"f": 1, "i": 1, "nullable": "a"}, {"f": 2, "i": 2, "nullable": "b"}],
+    )
+    assert resp.status_code == 200
+    assert [item["i"] for item in resp.json()["data"]] == [1, 2]
+    assert SomeModel.objects.count() == 2
+
+
+def test_bulk_update(aclient, some_model, some_model_2):
+    resp = aclient.post(
+        "/async/bulk_update",
+        [{"id": some_model.pk, "i": 10}, {"id": some_model_2.pk, "f": 20}],
+    )
+    assert resp.status_code == 200
+    assert list(SomeModel.objects.values_list("i", "f")) == [(10, 1.0), (2, 20.0)]
+
+
+def test_bulk_delete(aclient, some_model, some_model_2):
+    resp = aclient.post("/async/bulk_delete", [some_model.pk])
+    assert resp.status_code == 200
+    assert list(SomeModel.objects.values_list("pk", flat=True)) == [some_model_2.pk]
@@ -1,6 +1,18 @@
+import gzip
+import json
+
 import pytest
+from django.core.cache import cache
+from django.db import OperationalError, connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from marshmallow import fields
 
-from tests.tproj.app.models import SomeModel
+from django_serializer.v2.query import plan_queryset
+from django_serializer.v2.serializer import ModelSerializer
+from django_serializer.v2.views import generics
+from tests.tproj.app.models import ChildModel, LabelModel, ParentModel, SomeModel
+from tests.tproj.generic_views import CachedListApiView, PermittedBulkDeleteApiView
 
 
 class TestCreateApiView:
@@ -36,6 +48,114 @@ class TestCreateApiView:
         }
 
 
+class TestBulkCreate:
+    @pytest.mark.usefixtures("db", "freeze_t")
+    def test_success(self, json_client):
+        with CaptureQueriesContext(connection) as queries:
+            resp = json_client.post(
+                "/bulk_create",
+                json=[
+                    {"f": 1.1, "i": 1, "nullable": "a"},
+                    {"f": 2.2, "i": 2, "nullable": "b"},
+                ],
+            )
+        assert resp.status_code == 200
+        assert resp.json() == {
+            "status": "ok",
+            "data": [
+                {
+                    "id": 1,
+                    "i": 1,
+                    "f": 1.1,
+                    "nullable": "a",
+                    "created": "2020-02-28T16:00:00+00:00",
+                },
+                {
+                    "id": 2,
+                    "i": 2,
+                    "f": 2.2,
+                    "nullable": "b",
+                    "created": "2020-02-28T16:00:00+00:00",
+                },
+            ],
+        }
+        inserts = 1 if connection.features.can_return_rows_from_bulk_insert else 2
+        assert sum(q["sql"].startswith("INSERT") for q in queries) == inserts
+
+    @pytest.mark.usefixtures("db")
+    def test_empty(self, json_client):
+        resp = json_client.post("/bulk_create", json=[])
+        assert resp.json() == {"status": "ok", "data": []}
+
+    @pytest.mark.usefixtures("db")
+    def test_invalid_item(self, json_client):
+        resp = json_client.post(
+            "/bulk_create",
+            json=[{"f": 1, "i": 1, "nullable": "a"}, {"f": 2, "nullable": "b"}],
+        )
+        assert resp.status_code == 400
+        assert resp.json() == {
+            "status": "bad_request",
+            "message": "Bad request",
+            "data": {},
+            "field_problems": {"1": {"i": ["This field is required."]}},
+        }
+        assert not SomeModel.objects.exists()
+
+    @pytest.mark.usefixtures("db")
+    def test_not_array(self, json_client):
+        resp = json_client.post("/bulk_create", json={"f": 1, "i": 1})
+        assert resp.status_code == 400
+        assert resp.json()["message"] == "body json is invalid"
+
+        resp = json_client.post("/bulk_create", json=[1])
+        assert resp.status_code == 400
+        assert resp.json()["message"] == "body item is not an object"
+
+    def test_batched_checks(self, json_client, db):
+        parent = ParentModel.objects.create(name="p")
+        LabelModel.objects.create(parent=parent, code="a")
+        with CaptureQueriesContext(connection) as queries:
+            resp = json_client.post(
+                "/label_bulk_create",
+                json=[
+                    {"parent": parent.pk, "code": "a"},
+                    {"parent": parent.pk, "code": "b"},
+                    {"parent": parent.pk, "code": "b"},
+                    {"parent": parent.pk + 1, "code": "c"},
+                ],
+            )
+        # choices by one in_bulk and unique codes by one query
+        assert len(queries) == 2
+        assert resp.status_code == 400
+        assert resp.json()["field_problems"] == {
+            "0": {"code": ["Label model with this Code already exists."]},
+            "2": {"code": ["Label model with this Code already exists."]},
+            "3": {
+                "parent": [
+                    "Select a valid choice. "
+                    "That choice is not one of the available choices."
+                ]
+            },
+        }
+        assert LabelModel.objects.count() == 1
+
+    def test_labels(self, json_client, db):
+        parent = ParentModel.objects.create(name="p")
+        resp = json_client.post(
+            "/label_bulk_create",
+            json=[
+                {"parent": parent.pk, "code": "a"},
+                {"parent": parent.pk, "code": "b"},
+            ],
+        )
+        assert resp.status_code == 200
+        assert resp.json()["data"] == [
+            {"id": 1, "parent_id": parent.pk, "code": "a"},
+            {"id": 2, "parent_id": parent.pk, "code": "b"},
+        ]
+
+
 class TestGetApiView:
     def test_bad_request(self, client):
         resp = client.get("/get_model")
@@ -121,6 +241,115 @@ class TestUpdateApiView:
         some_model = SomeModel.objects.get(pk=some_model.pk)
         assert some_model.nullable == "new"
 
+    def test_update_fields(self, json_client, some_model_2):
+        data = {"id": some_model_2.pk, "f": 2, "i": 5, "nullable": "test"}
+        with CaptureQueriesContext(connection) as queries:
+            resp = json_client.post("/update", json=data)
+        assert resp.status_code == 200
+        (update,) = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        assert '"i" = 5' in update
+        assert '"f"' not in update and '"created"' not in update
+
+    def test_not_changed(self, json_client, some_model_2):
+        data = {"id": some_model_2.pk, "f": 2, "i": 2, "nullable": "test"}
+        with CaptureQueriesContext(connection) as queries:
+            resp = json_client.post("/update", json=data)
+        assert resp.status_code == 200
+        assert not any(q["sql"].startswith("UPDATE") for q in queries)
+
+
+class TestBulkUpdate:
+    def test_success(self, json_client, some_model, some_model_2, some_model_3):
+        with CaptureQueriesContext(connection) as queries:
+            resp = json_client.post(
+                "/bulk_update",
+                json=[
+                    {"id": some_model.pk, "i": 10},
+                    {"id": some_model_2.pk, "i": 20},
+                    {"id": some_model_3.pk, "nullable": "changed"},
+                ],
+            )
+        assert resp.status_code == 200
+        assert [(item["i"], item["nullable"]) for item in resp.json()["data"]] == [
+            (10, None),
+            (20, "test"),
+            (3, "changed"),
+        ]
+        # objects by in_bulk, one update per set of changed fields
+        assert len(queries) == 1 + 2 + 2
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        assert len(updates) == 2
+        assert all('"f"' not in sql for sql in updates)
+        assert list(SomeModel.objects.values_list("i", "f", "nullable")) == [
+            (10, 1.0, None),
+            (20, 2.0, "test"),
+            (3, 3.0, "changed"),
+        ]
+
+    @pytest.mark.usefixtures("db")
+    def test_not_found(self, json_client, some_model):
+        resp = json_client.post(
+            "/bulk_update",
+            json=[{"id": some_model.pk, "i": 2}, {"id": 100}, {"i": 3}],
+        )
+        assert resp.status_code == 400
+        assert resp.json()["field_problems"] == {
+            "1": {"id": ["Not Found"]},
+            "2": {"id": ["This field is required."]},
+        }
+
+    def test_duplicate(self, json_client, some_model):
+        resp = json_client.post(
+            "/bulk_update",
+            json=[{"id": some_model.pk, "i": 2}, {"id": some_model.pk, "i": 3}],
+        )
+        assert resp.status_code == 400
+        assert resp.json()["field_problems"] == {"1": {"id": ["Duplicate object"]}}
+
+    def test_without_perm(self, json_client, some_model, some_model_without_perm):
+        resp = json_client.post(
+            "/bulk_update",
+            json=[
+                {"id": some_model.pk, "i": 2},
+                {"id": some_model_without_perm.pk, "i": 3},
+            ],
+        )
+        assert resp.status_code == 403
+        assert SomeModel.objects.get(pk=some_model.pk).i == 1
+
+    def test_invalid_item(self, json_client, some_model, some_model_2):
+        resp = json_client.post(
+            "/bulk_update",
+            json=[{"id": some_model.pk, "i": 2}, {"id": some_model_2.pk, "i": "x"}],
+        )
+        assert resp.status_code == 400
+        assert resp.json()["field_problems"] == {"1": {"i": ["Enter a whole number."]}}
+        assert SomeModel.objects.get(pk=some_model.pk).i == 1
+
+    def test_labels(self, json_client, db):
+        parent = ParentModel.objects.create(name="p")
+        other = ParentModel.objects.create(name="o")
+        a = LabelModel.objects.create(parent=parent, code="a")
+        b = LabelModel.objects.create(parent=parent, code="b")
+        resp = json_client.post(
+            "/label_bulk_update",
+            json=[{"id": a.pk, "code": "b"}, {"id": b.pk, "parent": other.pk}],
+        )
+        assert resp.status_code == 400
+        assert resp.json()["field_problems"] == {
+            "0": {"code": ["Label model with this Code already exists."]}
+        }
+
+        resp = json_client.post(
+            "/label_bulk_update",
+            json=[{"id": a.pk, "code": "a"}, {"id": b.pk, "parent": other.pk}],
+        )
+        assert resp.status_code == 200
+        assert resp.json()["data"] == [
+            {"id": a.pk, "parent_id": parent.pk, "code": "a"},
+            {"id": b.pk, "parent_id": other.pk, "code": "b"},
+        ]
+
 
 class TestDeleteApiView:
     def test_bad_request(self, json_client):
@@ -163,6 +392,96 @@ class TestDeleteApiView:
         assert not SomeModel.objects.filter(pk=some_model.pk).exists()
 
 
+class TestBulkDelete:
+    def test_success(self, json_client, some_model, some_model_2, some_model_3):
+        resp = json_client.post(
+            "/bulk_delete", json=[some_model.pk, {"id": some_model_2.pk}, some_model.pk]
+        )
+        assert resp.status_code == 200
+        assert resp.json() == {"status": "ok", "data": {}}
+        assert list(SomeModel.objects.values_list("pk", flat=True)) == [some_model_3.pk]
+
+    @pytest.mark.usefixtures("db")
+    def test_empty(self, json_client):
+        resp = json_client.post("/bulk_delete", json=[])
+        assert resp.status_code == 200
+
+    def test_bad_request(self, json_client, some_model):
+        resp = json_client.post("/bulk_delete", json=[some_model.pk, "x", 100])
+        assert resp.status_code == 400
+        assert resp.json()["field_problems"] == {"1": {"id": ["Enter a whole number."]}}
+
+        resp = json_client.post("/bulk_delete", json=[some_model.pk, 100])
+        assert resp.status_code == 400
+        assert resp.json()["field_problems"] == {"1": {"id": ["Not Found"]}}
+        assert SomeModel.objects.exists()
+
+    @pytest.mark.parametrize("url", ["/bulk_delete", "/permitted_bulk_delete"])
+    def test_without_perm(self, json_client, url, some_model, some_model_without_perm):
+        resp = json_client.post(url, json=[some_model.pk, some_model_without_perm.pk])
+        assert resp.status_code == 403
+        assert SomeModel.objects.count() == 2
+
+    def test_permitted_queryset(self, json_client, some_model, some_model_2):
+        with CaptureQueriesContext(connection) as queries:
+            resp = json_client.post(
+                "/permitted_bulk_delete", json=[some_model.pk, some_model_2.pk, 100]
+            )
+        assert resp.status_code == 400
+        assert resp.json()["field_problems"] == {"2": {"id": ["Not Found"]}}
+        # permitted keys and existence of not permitted ones
+        assert len(queries) == 2
+
+        resp = json_client.post(
+            "/permitted_bulk_delete", json=[some_model.pk, some_model_2.pk]
+        )
+        assert resp.status_code == 200
+        assert not SomeModel.objects.exists()
+
+    def test_permitted_queryset_deleted(
+        self, json_client, some_model, some_model_2, monkeypatch
+    ):
+        check = PermittedBulkDeleteApiView._check_bulk_permissions
+
+        def revoke_after_check(self, qs, keys):
+            result = check(self, qs, keys)
+            SomeModel.objects.filter(pk=some_model_2.pk).update(
+                nullable="without_permissions"
+            )
+            return result
+
+        monkeypatch.setattr(
+            PermittedBulkDeleteApiView, "_check_bulk_permissions", revoke_after_check
+        )
+        resp = json_client.post(
+            "/permitted_bulk_delete", json=[some_model.pk, some_model_2.pk]
+        )
+        assert resp.status_code == 200
+        assert list(SomeModel.objects.values_list("pk", flat=True)) == [some_model_2.pk]
+
+    def test_fast_delete(self, json_client, some_model, some_model_2):
+        with CaptureQueriesContext(connection) as queries:
+            resp = json_client.post("/fast_bulk_delete", json=[some_model.pk])
+        assert resp.status_code == 200
+        assert [q["sql"].split()[0] for q in queries] == ["SELECT", "DELETE"]
+        assert list(SomeModel.objects.values_list("pk", flat=True)) == [some_model_2.pk]
+
+    def test_fast_delete_fallback(
+        self, json_client, some_model, some_model_2, monkeypatch
+    ):
+        monkeypatch.setattr(generics, "_raw_delete", None)
+        resp = json_client.post("/fast_bulk_delete", json=[some_model.pk])
+        assert resp.status_code == 200
+        assert list(SomeModel.objects.values_list("pk", flat=True)) == [some_model_2.pk]
+
+    def test_fast_delete_cascade(self, json_client, db):
+        parent = ParentModel.objects.create(name="p")
+        ChildModel.objects.create(parent=parent, name="c")
+        resp = json_client.post("/fast_parent_bulk_delete", json=[parent.pk])
+        assert resp.status_code == 200
+        assert not ChildModel.objects.exists()
+
+
 class TestListApiView:
     @pytest.mark.usefixtures("some_model")
     def test_simple(self, client):
@@ -249,3 +568,436 @@ class TestListApiView:
             ],
             "status": "ok",
         }
+
+    @pytest.mark.parametrize("count", [0, 1, 3])
+    def test_stream(self, client, db, freeze_t, count):
+        for i in range(count):
+            SomeModel.objects.create(i=i, f=i, nullable=None)
+
+        resp = client.get("/stream_list")
+        assert resp.status_code == 200
+        assert resp.streaming
+        document = json.loads(b"".join(resp.streaming_content))
+        assert document == {
+            "data": [
+                {
+                    "created": "2020-02-28T16:00:00+00:00",
+                    "f": float(i),
+                    "i": i,
+                    "id": i + 1,
+                    "nullable": None,
+                }
+                for i in range(count)
+            ],
+            "status": "ok",
+        }
+
+    def test_columnar(self, client, some_model, some_model_2):
+        resp = client.get("/stream_list", {"format": "columnar"})
+        assert resp.status_code == 200
+        assert not resp.streaming
+        assert resp.json() == {
+            "data": {
+                "columns": ["id", "i", "f", "nullable", "created"],
+                "data": {
+                    "id": [1, 2],
+                    "i": [1, 2],
+                    "f": [1.0, 2.0],
+                    "nullable": [None, "test"],
+                    "created": ["2020-02-28T16:00:00+00:00"] * 2,
+                },
+            },
+            "status": "ok",
+        }
+
+    def test_columnar_not_allowed(self, client, some_model):
+        resp = client.get("/list", {"format": "columnar"})
+        assert isinstance(resp.json()["data"], list)
+
+
+class TestPruneColumns:
+    @pytest.mark.parametrize(
+        "url, params",
+        [("/short_list", {}), ("/short_get", {"id": 1})],
+    )
+    def test_pruned(self, client, some_model, url, params):
+        with CaptureQueriesContext(connection) as queries:
+            resp = client.get(url, params)
+        assert resp.status_code == 200
+        data = resp.json()["data"]
+        assert data == [{"id": 1, "i": 1}] or data == {"id": 1, "i": 1}
+        assert len(queries) == 1
+        assert '"nullable"' not in queries[0]["sql"]
+
+    def test_method_field(self, some_model, some_model_2):
+        class T(ModelSerializer):
+            class SMeta:
+                model = SomeModel
+                fields = ("id",)
+
+            i = fields.Method("get_i")
+
+            def get_i(self, obj):
+                return f"{obj.i}-{obj.nullable}"
+
+        qs = plan_queryset(SomeModel.objects.order_by("id"), T)
+        with CaptureQueriesContext(connection) as queries:
+            data = T(many=True).dump(qs)
+        assert data == [{"id": 1, "i": "1-None"}, {"id": 2, "i": "2-test"}]
+        assert len(queries) == 1
+
+    def test_not_pruned(self, client, some_model):
+        with CaptureQueriesContext(connection) as queries:
+            resp = client.get("/not_pruned_list")
+        assert resp.json()["data"] == [{"id": 1, "i": 1}]
+        assert '"nullable"' in queries[0]["sql"]
+
+
+class TestPlanRelations:
+    @pytest.fixture
+    def parents(self, db):
+        parents = []
+        for i in range(3):
+            parent = ParentModel.objects.create(name=f"p{i}", description="long")
+            for j in range(2):
+                ChildModel.objects.create(parent=parent, name=f"c{i}{j}")
+            parents.append(parent)
+        return parents
+
+    def test_select_related(self, client, parents):
+        with CaptureQueriesContext(connection) as queries:
+            resp = client.get("/child_list")
+        assert resp.status_code == 200
+        assert len(queries) == 1
+        assert '"description"' not in queries[0]["sql"]
+        assert resp.json()["data"][0] == {
+            "id": 1,
+            "name": "c00",
+            "parent": {"id": 1, "name": "p0"},
+            "parent_name": "p0",
+        }
+
+    def test_expand(self, client, parents):
+        with CaptureQueriesContext(connection) as queries:
+            resp = client.get("/expanded_child_list")
+        assert resp.status_code == 200
+        assert len(queries) == 2
+        assert "JOIN" not in queries[0]["sql"]
+        assert resp.json()["data"][5] == {
+            "id": 6,
+            "name": "c21",
+            "parent": {"id": 3, "name": "p2"},
+        }
+
+    def test_prefetch_related(self, client, parents):
+        with CaptureQueriesContext(connection) as queries:
+            resp = client.get("/parent_list")
+        assert resp.status_code == 200
+        assert len(queries) == 2
+        assert all('"description"' not in q["sql"] for q in queries)
+        assert resp.json()["data"][2] == {
+            "id": 3,
+            "name": "p2",
+            "children": [{"id": 5, "name": "c20"}, {"id": 6, "name": "c21"}],
+        }
+
+
+class TestSparseFields:
+    def test_all_fields(self, client, some_model):
+        resp = client.get("/sparse_list")
+        assert resp.status_code == 200
+        assert set(resp.json()["data"][0]) == {"id", "i", "f", "nullable", "created"}
+
+    def test_fields(self, client, some_model):
+        with CaptureQueriesContext(connection) as queries:
+            resp = client.get("/sparse_list", {"fields": "i,id"})
+        assert resp.status_code == 200
+        assert resp.json()["data"] == [{"id": 1, "i": 1}]
+        assert '"nullable"' not in queries[0]["sql"]
+
+    def test_exclude(self, client, some_model):
+        with CaptureQueriesContext(connection) as queries:
+            resp = client.get("/sparse_list", {"exclude": "nullable, created"})
+        assert resp.status_code == 200
+        assert set(resp.json()["data"][0]) == {"id", "i", "f"}
+        assert '"created"' not in queries[0]["sql"]
+
+    def test_unknown_field(self, client, some_model):
+        resp = client.get("/sparse_list", {"fields": "id,password"})
+        assert resp.status_code == 400
+        assert resp.json()["field_problems"] == {"fields": ["unknown fields: password"]}
+
+    def test_ignored_without_option(self, client, some_model):
+        resp = client.get("/list", {"fields": "id"})
+        assert resp.status_code == 200
+        assert len(resp.json()["data"][0]) > 1
+
+
+class TestConditionalGet:
+    etag = 'W/"1-1582905600.0"'
+    last_modified = "Fri, 28 Feb 2020 16:00:00 GMT"
+
+    def test_get_validators(self, client, some_model):
+        with CaptureQueriesContext(connection) as queries:
+            resp = client.get("/conditional_get", {"id": some_model.id})
+        assert resp.status_code == 200
+        assert resp.json()["data"] == {"id": 1, "i": 1}
+        assert resp["ETag"] == self.etag
+        assert resp["Last-Modified"] == self.last_modified
+        assert len(queries) == 1
+
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            {"HTTP_IF_NONE_MATCH": etag},
+            {"HTTP_IF_NONE_MATCH": f'"other", {etag}'},
+            {"HTTP_IF_MODIFIED_SINCE": last_modified},
+        ],
+    )
+    def test_get_not_modified(self, client, some_model, headers):
+        resp = client.get("/conditional_get", {"id": some_model.id}, **headers)
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp["ETag"] == self.etag
+
+    def test_get_modified(self, client, some_model):
+        resp = client.get(
+            "/conditional_get",
+            {"id": some_model.id},
+            HTTP_IF_NONE_MATCH='W/"1-0.0"',
+            HTTP_IF_MODIFIED_SINCE="Fri, 28 Feb 2020 15:59:59 GMT",
+        )
+        assert resp.status_code == 200
+
+    def test_errors_not_validated(self, client, db):
+        resp = client.get("/conditional_get", {"id": 1}, HTTP_IF_NONE_MATCH="*")
+        assert resp.status_code == 404
+        assert "ETag" not in resp
+
+    def test_list_not_modified(self, client, some_model, some_model_2):
+        resp = client.get("/conditional_list")
+        assert resp.status_code == 200
+        assert resp["ETag"] == 'W/"2-1582905600.0"'
+        assert len(json.loads(b"".join(resp.streaming_content))["data"]) == 2
+
+        with CaptureQueriesContext(connection) as queries:
+            resp = client.get("/conditional_list", HTTP_IF_NONE_MATCH=resp["ETag"])
+        assert resp.status_code == 304
+        assert len(queries) == 1
+
+    def test_list_changed(self, client, some_model, some_model_2):
+        etag = client.get("/conditional_list")["ETag"]
+        some_model_2.delete()
+        resp = client.get("/conditional_list", HTTP_IF_NONE_MATCH=etag)
+        assert resp.status_code == 200
+        assert resp["ETag"] == 'W/"1-1582905600.0"'
+
+    def test_empty_list(self, client, db):
+        resp = client.get("/conditional_list")
+        assert resp["ETag"] == 'W/"0-"'
+        assert "Last-Modified" not in resp
+
+    def test_head(self, client, some_model):
+        with CaptureQueriesContext(connection) as queries:
+            resp = client.head("/conditional_list")
+        assert resp.status_code == 200
+        assert resp.content == b""
+        assert resp["ETag"] == 'W/"1-1582905600.0"'
+        assert len(queries) == 1
+
+    def test_head_without_validators(self, client, some_model):
+        resp = client.head("/list")
+        assert resp.status_code == 200
+        assert resp.content == b""
+        assert "ETag" not in resp
+
+    def test_head_not_allowed(self, client):
+        assert client.head("/create").status_code == 405
+
+
+class TestResponseCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+        yield
+        cache.clear()
+
+    def test_cached(self, client, some_model):
+        resp = client.get("/cached_get", {"id": some_model.id})
+        assert resp.status_code == 200
+        with CaptureQueriesContext(connection) as queries:
+            cached = client.get("/cached_get", {"id": some_model.id})
+        assert len(queries) == 0
+        assert cached.status_code == 200
+        assert cached.content == resp.content
+        assert cached["Content-Type"] == "application/json"
+
+    def test_key(self, client, some_model, some_model_2):
+        first = client.get("/cached_get", {"id": some_model.id}).json()
+        second = client.get("/cached_get", {"id": some_model_2.id}).json()
+        assert first["data"]["id"] == some_model.id
+        assert second["data"]["id"] == some_model_2.id
+
+    def test_key_of_cleaned_values(self, rf, some_model, some_model_2):
+        def key(**query):
+            view = CachedListApiView()
+            view.args, view.kwargs = (), {}
+            view._request_query = query
+            return view.get_cache_key(rf.get("/cached_list"))
+
+        qs = SomeModel.objects.all()
+        evaluated = qs.order_by("-id")
+        list(evaluated)
+        some_model.i = 10
+        assert key(obj=some_model, objs=qs) == key(
+            obj=SomeModel.objects.get(id=some_model.id), objs=evaluated
+        )
+        assert key(obj=some_model) != key(obj=some_model_2)
+        assert key(objs=qs) != key(objs=qs.filter(id=some_model.id))
+
+    def test_errors_not_cached(self, client, some_model):
+        assert client.get("/cached_get", {"id": 100}).status_code == 404
+        SomeModel.objects.filter(id=some_model.id).update(id=100)
+        assert client.get("/cached_get", {"id": 100}).status_code == 200
+
+    def test_invalidated(self, client, some_model):
+        client.get("/cached_get", {"id": some_model.id})
+        some_model.i = 10
+        some_model.save()
+        resp = client.get("/cached_get", {"id": some_model.id})
+        assert resp.json()["data"]["i"] == 10
+
+    def test_invalidated_by_bulk_update(self, client, json_client, some_model):
+        client.get("/cached_get", {"id": some_model.id})
+        with TestCase.captureOnCommitCallbacks(execute=True):
+            json_client.post("/bulk_update", json=[{"id": some_model.id, "i": 10}])
+        resp = client.get("/cached_get", {"id": some_model.id})
+        assert resp.json()["data"]["i"] == 10
+
+    def test_invalidated_by_bulk_create(self, client, json_client, some_model):
+        client.get("/cached_list")
+        with TestCase.captureOnCommitCallbacks(execute=True):
+            json_client.post("/bulk_create", json=[{"f": 2, "i": 2, "nullable": "b"}])
+        assert len(client.get("/cached_list").json()["data"]) == 2
+
+    def test_vary_on_headers(self, client, some_model):
+        resp = client.get("/cached_list", HTTP_X_TENANT="a")
+        assert resp["Vary"] == "X-Tenant"
+        SomeModel.objects.filter(id=some_model.id).update(i=10)
+        other = client.get("/cached_list", HTTP_X_TENANT="b")
+        assert other.json()["data"][0]["i"] == 10
+        with CaptureQueriesContext(connection) as queries:
+            cached = client.get("/cached_list", HTTP_X_TENANT="a")
+        assert cached.json()["data"][0]["i"] == 1
+        assert cached["Vary"] == "X-Tenant"
+        assert len(queries) == 0
+
+    def test_stale_while_revalidate(self, client, some_model, monkeypatch):
+        client.get("/cached_list")
+        SomeModel.objects.create(i=2, f=2)
+        view_cache = CachedListApiView._dispatch_plan.cache
+        with monkeypatch.context() as m:
+            # other request revalidates
+            m.setattr(view_cache, "lock", lambda key: False)
+            assert len(client.get("/cached_list").json()["data"]) == 1
+
+        assert len(client.get("/cached_list").json()["data"]) == 2
+        with CaptureQueriesContext(connection) as queries:
+            assert len(client.get("/cached_list").json()["data"]) == 2
+        assert len(queries) == 0
+
+    def test_stale_if_error(self, client, some_model, monkeypatch):
+        client.get("/cached_list")
+        SomeModel.objects.create(i=2, f=2)
+
+        def execute(self, request, *args, **kwargs):
+            raise OperationalError
+
+        monkeypatch.setattr(CachedListApiView, "execute", execute)
+        resp = client.get("/cached_list")
+        assert resp.status_code == 200
+        assert len(resp.json()["data"]) == 1
+
+    def test_not_modified(self, client, some_model):
+        etag = client.get("/cached_list")["ETag"]
+        with CaptureQueriesContext(connection) as queries:
+            resp = client.get("/cached_list", HTTP_IF_NONE_MATCH=etag)
+        assert resp.status_code == 304
+        assert resp["ETag"] == etag
+        assert len(queries) == 0
+
+
+class TestCompression:
+    gzip_headers = {"HTTP_ACCEPT_ENCODING": "deflate, gzip;q=0.5"}
+
+    def test_compressed(self, client, some_model, some_model_2, some_model_3):
+        resp = client.get("/compressed_list", **self.gzip_headers)
+        assert resp["Content-Encoding"] == "gzip"
+        assert resp["Vary"] == "Accept-Encoding"
+        assert int(resp["Content-Length"]) == len(resp.content)
+        data = json.loads(gzip.decompress(resp.content))
+        assert data == client.get("/compressed_list").json()
+        assert len(data["data"]) == 3
+
+    @pytest.mark.parametrize(
+        "headers",
+        [{}, {"HTTP_ACCEPT_ENCODING": "gzip;q=0"}, {"HTTP_ACCEPT_ENCODING": "br"}],
+    )
+    def test_not_accepted(self, client, some_model, some_model_2, headers):
+        resp = client.get("/compressed_list", **headers)
+        assert "Content-Encoding" not in resp
+        assert resp["Vary"] == "Accept-Encoding"
+        assert len(resp.json()["data"]) == 2
+
+    def test_min_size(self, client, db):
+        resp = client.get("/compressed_list", **self.gzip_headers)
+        assert "Content-Encoding" not in resp
+        assert "Vary" not in resp
+        assert resp.json() == {"status": "ok", "data": []}
+
+    def test_stream(self, client, some_model, some_model_2):
+        resp = client.get("/compressed_stream_list", HTTP_ACCEPT_ENCODING="*")
+        assert resp["Content-Encoding"] == "gzip"
+        chunks = list(resp.streaming_content)
+        assert len(chunks) == 5
+        data = json.loads(gzip.decompress(b"".join(chunks)))
+        assert [item["id"] for item in data["data"]] == [1, 2]
+
+
+def test_primitive_renderer(client, some_model, some_model_2):
+    resp = client.get("/primitive_list")
+    assert resp.status_code == 200
+    assert resp.json() == client.get("/list").json()
+
+
+class TestChunkedRendering:
+    def test_same_as_list(self, client, some_model, some_model_2):
+        resp = client.get("/chunked_list")
+        assert resp.status_code == 200
+        assert not resp.streaming
+        assert resp["Content-Type"] == "application/json"
+        assert resp.json() == client.get("/list").json()
+
+    def test_empty(self, client, db):
+        resp = client.get("/chunked_list")
+        assert resp.json() == {"status": "ok", "data": []}
+
+    def test_prefetch_by_chunks(self, client, db):
+        for i in range(3):
+            parent = ParentModel.objects.create(name=f"p{i}")
+            ChildModel.objects.create(parent=parent, name=f"c{i}")
+        with CaptureQueriesContext(connection) as queries:
+            resp = client.get("/chunked_parent_list")
+        # parents and children of each chunk of two parents
+        assert len(queries) == 3
+        assert resp.json() == {
+            "status": "ok",
+            "data": [
+                {
+                    "id": i + 1,
+                    "name": f"p{i}",
+                    "children": [{"id": i + 1, "name": f"c{i}"}],
+                }
+                for i in range(3)
+            ],
+        }
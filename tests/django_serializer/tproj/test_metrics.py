@@ -0,0 +1,81 @@
+import pytest
+
+from django_serializer.v2.metrics import BaseMetricsSink, LoggingMetricsSink
+
+
+class RecordingSink(BaseMetricsSink):
+    records = []
+
+    def send(self, view, request, response, timer):
+        self.records.append((type(view).__name__, response.status_code, timer))
+
+
+@pytest.fixture
+def sink(settings):
+    settings.SERIALIZER_METRICS_SINK = RecordingSink
+    RecordingSink.records = []
+    return RecordingSink
+
+
+class TestStageTiming:
+    def test_disabled(self, client, some_model):
+        resp = client.get("/get_model", {"id": some_model.pk})
+        assert resp.status_code == 200
+        assert "Server-Timing" not in resp
+
+    def test_sink(self, client, some_model, sink):
+        resp = client.get("/get_model", {"id": some_model.pk})
+        assert resp.status_code == 200
+        assert "Server-Timing" not in resp
+        [(view, status_code, timer)] = sink.records
+        assert (view, status_code) == ("SomeModelGetView", 200)
+        assert list(timer.stages) == [
+            "method",
+            "permission",
+            "query_form",
+            "body_form",
+            "execute",
+            "conditional",
+            "serializer",
+            "envelope",
+            "render",
+            "encode",
+        ]
+        assert timer.stages["execute"].queries == 1
+        assert timer.stages["serializer"].queries == 0
+
+    @pytest.mark.usefixtures("db")
+    def test_error(self, client, sink):
+        resp = client.get("/get_model", {"id": 1})
+        assert resp.status_code == 404
+        [(view, status_code, timer)] = sink.records
+        assert status_code == 404
+        assert "serializer" not in timer.stages
+        assert "render" in timer.stages
+
+    def test_server_timing(self, client, some_model, settings):
+        settings.SERIALIZER_SERVER_TIMING = True
+        resp = client.get("/get_model", {"id": some_model.pk})
+        metrics = [item.split(";")[0] for item in resp["Server-Timing"].split(", ")]
+        assert metrics == [
+            "method",
+            "permission",
+            "query_form",
+            "body_form",
+            "execute",
+            "execute.sql",
+            "conditional",
+            "serializer",
+            "envelope",
+            "render",
+            "encode",
+        ]
+        assert 'desc="1 queries"' in resp["Server-Timing"]
+
+    def test_logging_sink(self, client, some_model, settings, caplog):
+        settings.SERIALIZER_METRICS_SINK = LoggingMetricsSink
+        with caplog.at_level("INFO", logger="django_serializer.metrics"):
+            client.get("/get_model", {"id": some_model.pk})
+        [record] = caplog.records
+        assert record.getMessage().startswith("SomeModelGetView /get_model total=")
+        assert record.timings["execute"]["queries"] == 1
@@ -1,5 +1,9 @@
+import json
+
 import pytest
 
+from tests.tproj.views import LimitedPostBodyView
+
 
 class TestApiViews:
     def test_get_view(self, client):
@@ -57,6 +61,42 @@ class TestApiViews:
         document = resp.json()
         assert document == {"data": {"q": "1"}, "status": "ok"}
 
+    @pytest.mark.parametrize(
+        "body, status_code, message",
+        [
+            ({"q": "1"}, 200, None),
+            ({"q": "1" * 32}, 413, "Payload too large"),
+            ({"q": {"a": [1]}}, 400, "body json is too deep"),
+            ("{", 400, "body json is invalid"),
+        ],
+    )
+    def test_body_limits(self, json_client, body, status_code, message):
+        data = body if isinstance(body, str) else json.dumps(body)
+        resp = json_client.post("/limited_post_body", data=data)
+        assert resp.status_code == status_code
+        assert resp.json().get("message") == message
+
+    def test_body_size_without_content_length(self, rf):
+        request = rf.post("/", data=b"[" * 40, content_type="application/json")
+        del request.META["CONTENT_LENGTH"]
+        resp = LimitedPostBodyView.as_view()(request)
+        assert resp.status_code == 413
+
+    @pytest.mark.parametrize(
+        "body, status_code, data",
+        [
+            ("[]", 200, {"sum": 0}),
+            ('[{"a": 1}, {"a": 2}]', 200, {"sum": 3}),
+            ('[{"a": [[1]]}]', 400, {}),
+            ('[{"a": 1}, ', 400, {}),
+            ('{"a": 1}', 400, {}),
+        ],
+    )
+    def test_stream_body(self, json_client, body, status_code, data):
+        resp = json_client.post("/stream_body", data=body)
+        assert resp.status_code == status_code
+        assert resp.json()["data"] == data
+
     def test_500_debug_false(self, client):
         resp = client.get("/500")
         assert resp.status_code == 500
@@ -1,10 +1,14 @@
+import datetime
+
 import pytest
 from django.forms import Form
+from django.test import RequestFactory, override_settings
 
 from django_serializer.v2.exceptions import (
     IncorrectMetaException,
     BadRequestError,
 )
+from django_serializer.v2.renderers import JsonRenderer
 from django_serializer.v2.serializer import Serializer
 from django_serializer.v2.views import ApiView, HttpMethod
 
@@ -26,6 +30,42 @@ class TestMeta:
         errors = self._create_meta({})
         assert errors == ["`tags` is required", "`method` is required"]
 
+    def test_cache_method(self):
+        errors = self._create_meta(
+            {"tags": ["tags"], "method": HttpMethod.POST, "cache": True}
+        )
+        assert errors == ["`cache` is allowed with `HttpMethod.GET` only"]
+
+    @pytest.mark.parametrize(
+        "vary_on_user, expected_errors",
+        [
+            (
+                False,
+                [
+                    "`cache` requires `cache_vary_on_user` with overridden `has_permissions`"
+                ],
+            ),
+            (True, None),
+        ],
+    )
+    def test_cache_permissions(self, vary_on_user, expected_errors):
+        try:
+
+            class View(ApiView):
+                def has_permissions(self):
+                    return False
+
+                class Meta:
+                    tags = ["tags"]
+                    method = HttpMethod.GET
+                    cache = True
+                    cache_vary_on_user = vary_on_user
+
+        except IncorrectMetaException as e:
+            assert e.errors == expected_errors
+        else:
+            assert expected_errors is None
+
     def test_method(self):
         errors = self._create_meta({"tags": ["tags"], "method": "get"})
         assert errors == [
@@ -148,6 +188,12 @@ class TestMeta:
                 ["`errors` item has incorrect type, " "should be subtype of HttpError"],
             ),
             ("errors", [BadRequestError], None),
+            ("cache", True, None),
+            (
+                "cache_models",
+                (Form,),
+                ["`cache_models` item has incorrect type, should be subclass of Model"],
+            ),
         ],
     )
     def test_var(self, field, value, expected_errors):
@@ -155,3 +201,83 @@ class TestMeta:
             {"tags": ["tags"], "method": HttpMethod.GET, field: value}
         )
         assert errors == expected_errors
+
+
+class OtherRenderer(JsonRenderer):
+    pass
+
+
+class TestDispatchPlan:
+    class View(ApiView):
+        class Meta:
+            tags = ["tags"]
+            method = HttpMethod.POST
+            serializer_many = True
+
+    def test_plan(self):
+        plan = self.View._dispatch_plan
+        assert plan.methods == {"POST"}
+        assert plan.serializer_many is True
+        assert plan.pool_serializer is False
+        assert plan.logger.name == "django_serializer.views.View"
+        assert self.View()._logger is plan.logger
+
+    def test_shared_instances(self):
+        request = RequestFactory().post("/")
+        first, second = self.View(), self.View()
+        assert first.get_renderer(request) is second.get_renderer(request)
+        assert isinstance(first.get_renderer(request), JsonRenderer)
+        assert first.get_parser() is second.get_parser()
+
+    def test_reuse_serializer(self):
+        class View(self.View):
+            class Meta:
+                reuse_serializer = True
+
+        assert View._dispatch_plan.pool_serializer is True
+
+    def test_overridden_getters(self):
+        class View(self.View):
+            class Meta:
+                reuse_serializer = True
+
+            def get_renderer_class(self, request):
+                return OtherRenderer
+
+            def get_serializer_kwargs(self):
+                return super().get_serializer_kwargs()
+
+        assert View._dispatch_plan.renderer is None
+        assert View._dispatch_plan.pool_serializer is False
+        renderer = View().get_renderer(RequestFactory().post("/"))
+        assert isinstance(renderer, OtherRenderer)
+
+
+class TestConditionalResponse:
+    class View(ApiView):
+        class Meta:
+            tags = ["tags"]
+            method = HttpMethod.GET
+
+    @override_settings(USE_TZ=False, TIME_ZONE="Europe/Moscow")
+    def test_naive_last_modified(self):
+        request = RequestFactory().get("/")
+        view = self.View()
+        assert (
+            view._conditional_response(
+                request, (None, datetime.datetime(2020, 2, 28, 19))
+            )
+            is None
+        )
+        assert view._validator_headers == {
+            "Last-Modified": "Fri, 28 Feb 2020 16:00:00 GMT"
+        }
+
+    def test_head(self):
+        request = RequestFactory().head("/")
+        last_modified = datetime.datetime(2020, 2, 28, 16, tzinfo=datetime.timezone.utc)
+        response = self.View()._conditional_response(request, ("1", last_modified))
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/json"
+        assert response["ETag"] == '"1"'
+        assert response["Last-Modified"] == "Fri, 28 Feb 2020 16:00:00 GMT"
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-17 21:36
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0002_parentmodel_childmodel"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LabelModel",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("code", models.CharField(max_length=32, unique=True)),
+                (
+                    "parent",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="labels",
+                        to="app.parentmodel",
+                    ),
+                ),
+            ],
+        ),
+    ]
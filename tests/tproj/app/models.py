@@ -6,3 +6,23 @@ class SomeModel(models.Model):
     f = models.FloatField()
     nullable = models.CharField(null=True, max_length=64)
     created = models.DateTimeField(auto_now_add=True)
+
+
+class ParentModel(models.Model):
+    name = models.CharField(max_length=64)
+    description = models.TextField(default="")
+
+
+class ChildModel(models.Model):
+    parent = models.ForeignKey(
+        ParentModel, related_name="children", on_delete=models.CASCADE
+    )
+    name = models.CharField(max_length=64)
+    description = models.TextField(default="")
+
+
+class LabelModel(models.Model):
+    parent = models.ForeignKey(
+        ParentModel, related_name="labels", on_delete=models.CASCADE
+    )
+    code = models.CharField(max_length=32, unique=True)
@@ -1,19 +1,26 @@
 from django import forms
 
 from django_serializer.v2.exceptions import BadRequestError, NotFoundError
+from django_serializer.v2.renderers import GzipJsonRenderer, PrimitiveJsonRenderer
 from django_serializer.v2.serializer import ModelSerializer, Serializer
+from django_serializer.v2.serializer_fields import RelatedNested
 from django_serializer.v2.views import (
     CreateApiView,
     GetApiView,
     UpdateApiView,
     DeleteApiView,
     ListApiView,
+    AsyncCreateApiView,
+    AsyncGetApiView,
+    AsyncUpdateApiView,
+    AsyncDeleteApiView,
+    AsyncListApiView,
 )
 from django_serializer.v2.views.paginator import (
     AscFromIdPaginator,
     LimitOffsetPaginator,
 )
-from tests.tproj.app.models import SomeModel
+from tests.tproj.app.models import ChildModel, LabelModel, ParentModel, SomeModel
 from marshmallow import fields
 
 
@@ -28,6 +35,12 @@ class SomeModelSerializer(ModelSerializer):
         model = SomeModel
 
 
+class ShortSomeModelSerializer(ModelSerializer):
+    class SMeta:
+        model = SomeModel
+        fields = ("id", "i")
+
+
 class SomeModelCreateView(CreateApiView):
     class Meta:
         tags = ["create"]
@@ -102,3 +115,377 @@ class LimitOffsetPaginateListApiView(ListApiView):
         model = SomeModel
         serializer = SomeModelSerializer
         paginator = LimitOffsetPaginator
+
+
+class ShortListApiView(ListApiView):
+    class Meta:
+        tags = ["list"]
+        model = SomeModel
+        serializer = ShortSomeModelSerializer
+
+
+class ShortGetApiView(GetApiView):
+    class Meta:
+        tags = ["get"]
+        model = SomeModel
+        serializer = ShortSomeModelSerializer
+
+
+class NotPrunedListApiView(ListApiView):
+    class Meta:
+        tags = ["list"]
+        model = SomeModel
+        serializer = ShortSomeModelSerializer
+        prune_columns = False
+
+
+class ParentSerializer(ModelSerializer):
+    class SMeta:
+        model = ParentModel
+        fields = ("id", "name")
+
+
+class ChildSerializer(ModelSerializer):
+    class SMeta:
+        model = ChildModel
+        fields = ("id", "name")
+
+    parent = fields.Nested(ParentSerializer)
+    parent_name = fields.Str(attribute="parent.name")
+
+
+class ExpandedChildSerializer(ModelSerializer):
+    class SMeta:
+        model = ChildModel
+        fields = ("id", "name")
+        expand = {"parent": ParentSerializer}
+
+
+class ParentWithChildrenSerializer(ParentSerializer):
+    children = RelatedNested("ChildSerializer", only=("id", "name"), many=True)
+
+
+class ChildListApiView(ListApiView):
+    class Meta:
+        tags = ["list"]
+        model = ChildModel
+        serializer = ChildSerializer
+
+
+class ExpandedChildListApiView(ListApiView):
+    class Meta:
+        tags = ["list"]
+        model = ChildModel
+        serializer = ExpandedChildSerializer
+
+
+class AsyncExpandedChildListApiView(AsyncListApiView):
+    class Meta:
+        tags = ["list"]
+        model = ChildModel
+        serializer = ExpandedChildSerializer
+
+
+class ParentListApiView(ListApiView):
+    class Meta:
+        tags = ["list"]
+        model = ParentModel
+        serializer = ParentWithChildrenSerializer
+
+
+class StreamListApiView(ListApiView):
+    class Meta:
+        tags = ["list"]
+        model = SomeModel
+        serializer = SomeModelSerializer
+        stream = True
+        stream_chunk_size = 2
+        columnar = True
+
+
+class SparseListApiView(ListApiView):
+    class Meta:
+        tags = ["list"]
+        model = SomeModel
+        serializer = SomeModelSerializer
+        sparse_fields = True
+
+
+class AsyncSomeModelCreateView(AsyncCreateApiView):
+    class Meta:
+        tags = ["create"]
+        model_form = SomeModelForm
+        serializer = SomeModelSerializer
+
+
+class AsyncSomeModelGetView(AsyncGetApiView):
+    class Meta:
+        tags = ["get"]
+        model = SomeModel
+        serializer = SomeModelSerializer
+
+    def has_permissions(self, obj: SomeModel) -> bool:
+        return obj.nullable != "without_permissions"
+
+
+class AsyncSomeModelUpdateView(AsyncUpdateApiView):
+    class Meta:
+        tags = ["update"]
+        model = SomeModel
+        model_form = SomeModelForm
+        serializer = SomeModelSerializer
+
+
+class AsyncSomeModelDeleteView(AsyncDeleteApiView):
+    class Meta:
+        tags = ["update"]
+        model = SomeModel
+
+
+class AsyncPaginateListApiView(AsyncListApiView):
+    class Meta:
+        tags = ["list"]
+        model = SomeModel
+        serializer = ListSomeModelSerializer
+        serializer_many = False
+        paginator = AscFromIdPaginator
+
+    async def abuild_response(self, qs, qs_after_paginator=None):
+        return {"count": await qs.acount(), "list": qs_after_paginator}
+
+
+class AsyncStreamListApiView(AsyncListApiView):
+    class Meta:
+        tags = ["list"]
+        model = ParentModel
+        serializer = ParentWithChildrenSerializer
+        stream = True
+        stream_chunk_size = 2
+
+
+class ConditionalGetApiView(GetApiView):
+    class Meta:
+        tags = ["get"]
+        model = SomeModel
+        serializer = ShortSomeModelSerializer
+        last_modified_field = "created"
+
+
+class ConditionalListApiView(ListApiView):
+    class Meta:
+        tags = ["list"]
+        model = SomeModel
+        serializer = SomeModelSerializer
+        stream = True
+        last_modified_field = "created"
+
+
+class AsyncConditionalListApiView(AsyncListApiView):
+    class Meta:
+        tags = ["list"]
+        model = SomeModel
+        serializer = SomeModelSerializer
+        last_modified_field = "created"
+
+
+class CachedGetApiView(GetApiView):
+    class Meta:
+        tags = ["get"]
+        model = SomeModel
+        serializer = SomeModelSerializer
+        cache = True
+        cache_models = (SomeModel,)
+
+
+class CachedListApiView(ListApiView):
+    class Meta:
+        tags = ["list"]
+        model = SomeModel
+        serializer = SomeModelSerializer
+        cache = True
+        cache_stale_timeout = 60
+        cache_vary_on_headers = ("X-Tenant",)
+        cache_models = (SomeModel,)
+        last_modified_field = "created"
+
+
+class AsyncCachedListApiView(AsyncListApiView):
+    class Meta:
+        tags = ["list"]
+        model = SomeModel
+        serializer = SomeModelSerializer
+        cache = True
+        cache_models = (SomeModel,)
+
+
+class SmallGzipJsonRenderer(GzipJsonRenderer):
+    compress_min_size = 100
+
+
+class CompressedListApiView(ListApiView):
+    class Meta:
+        tags = ["list"]
+        model = SomeModel
+        serializer = SomeModelSerializer
+        renderer = SmallGzipJsonRenderer
+
+
+class CompressedStreamListApiView(ListApiView):
+    class Meta:
+        tags = ["list"]
+        model = SomeModel
+        serializer = SomeModelSerializer
+        renderer = SmallGzipJsonRenderer
+        stream = True
+        stream_chunk_size = 1
+
+
+class AsyncCompressedStreamListApiView(AsyncListApiView):
+    class Meta:
+        tags = ["list"]
+        model = SomeModel
+        serializer = SomeModelSerializer
+        renderer = SmallGzipJsonRenderer
+        stream = True
+        stream_chunk_size = 1
+
+
+class PrimitiveListApiView(ListApiView):
+    class Meta:
+        tags = ["list"]
+        model = SomeModel
+        serializer = SomeModelSerializer
+        renderer = PrimitiveJsonRenderer
+
+
+class ChunkedListApiView(ListApiView):
+    class Meta:
+        tags = ["list"]
+        model = SomeModel
+        serializer = SomeModelSerializer
+        render_chunk_size = 1
+
+
+class ChunkedParentListApiView(ListApiView):
+    class Meta:
+        tags = ["list"]
+        model = ParentModel
+        serializer = ParentWithChildrenSerializer
+        render_chunk_size = 2
+
+
+class AsyncChunkedListApiView(AsyncListApiView):
+    class Meta:
+        tags = ["list"]
+        model = SomeModel
+        serializer = SomeModelSerializer
+        render_chunk_size = 1
+
+
+class BulkCreateApiView(CreateApiView):
+    class Meta:
+        tags = ["create"]
+        model_form = SomeModelForm
+        serializer = SomeModelSerializer
+        many = True
+
+
+class LabelModelForm(forms.ModelForm):
+    class Meta:
+        model = LabelModel
+        fields = ("parent", "code")
+
+
+class LabelSerializer(ModelSerializer):
+    class SMeta:
+        model = LabelModel
+        fields = ("id", "parent_id", "code")
+
+
+class LabelBulkCreateApiView(CreateApiView):
+    class Meta:
+        tags = ["create"]
+        model_form = LabelModelForm
+        serializer = LabelSerializer
+        many = True
+
+
+class AsyncBulkCreateApiView(AsyncCreateApiView):
+    class Meta:
+        tags = ["create"]
+        model_form = SomeModelForm
+        serializer = SomeModelSerializer
+        many = True
+
+
+class BulkUpdateApiView(UpdateApiView):
+    class Meta:
+        tags = ["update"]
+        model = SomeModel
+        model_form = SomeModelForm
+        serializer = SomeModelSerializer
+        many = True
+
+    def has_permissions(self, obj: SomeModel) -> bool:
+        return obj.nullable != "without_permissions"
+
+
+class LabelBulkUpdateApiView(UpdateApiView):
+    class Meta:
+        tags = ["update"]
+        model = LabelModel
+        model_form = LabelModelForm
+        serializer = LabelSerializer
+        many = True
+
+
+class AsyncBulkUpdateApiView(AsyncUpdateApiView):
+    class Meta:
+        tags = ["update"]
+        model = SomeModel
+        model_form = SomeModelForm
+        serializer = SomeModelSerializer
+        many = True
+
+
+class BulkDeleteApiView(DeleteApiView):
+    class Meta:
+        tags = ["delete"]
+        model = SomeModel
+        many = True
+
+    def has_permissions(self, obj: SomeModel) -> bool:
+        return obj.nullable != "without_permissions"
+
+
+class PermittedBulkDeleteApiView(DeleteApiView):
+    class Meta:
+        tags = ["delete"]
+        model = SomeModel
+        many = True
+
+    def get_permitted_queryset(self, qs):
+        return qs.exclude(nullable="without_permissions")
+
+
+class FastBulkDeleteApiView(DeleteApiView):
+    class Meta:
+        tags = ["delete"]
+        model = SomeModel
+        many = True
+        fast_delete = True
+
+
+class FastParentBulkDeleteApiView(DeleteApiView):
+    class Meta:
+        tags = ["delete"]
+        model = ParentModel
+        many = True
+        fast_delete = True
+
+
+class AsyncBulkDeleteApiView(AsyncDeleteApiView):
+    class Meta:
+        tags = ["delete"]
+        model = SomeModel
+        many = True
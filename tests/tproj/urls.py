@@ -1,3 +1,4 @@
+import django
 from django.urls import path
 
 from . import views
@@ -8,18 +9,78 @@ urlpatterns = [
     path("get_query", views.GetQueryView.as_view()),
     path("post", views.PostView.as_view()),
     path("post_body", views.PostBodyView.as_view()),
+    path("limited_post_body", views.LimitedPostBodyView.as_view()),
+    path("stream_body", views.StreamBodyView.as_view()),
     path("500", views.InternalServerErrorView.as_view()),
     path("serializer", views.SerializerView.as_view()),
     path("serializer_many", views.SerializerManyView.as_view()),
     # generics
     path("create", generic_views.SomeModelCreateView.as_view()),
+    path("bulk_create", generic_views.BulkCreateApiView.as_view()),
+    path("label_bulk_create", generic_views.LabelBulkCreateApiView.as_view()),
     path("get_model", generic_views.SomeModelGetView.as_view()),
     path("update", generic_views.SomeModelUpdateView.as_view()),
+    path("bulk_update", generic_views.BulkUpdateApiView.as_view()),
+    path("label_bulk_update", generic_views.LabelBulkUpdateApiView.as_view()),
     path("delete", generic_views.SomeModelDeleteView.as_view()),
+    path("bulk_delete", generic_views.BulkDeleteApiView.as_view()),
+    path("permitted_bulk_delete", generic_views.PermittedBulkDeleteApiView.as_view()),
+    path("fast_bulk_delete", generic_views.FastBulkDeleteApiView.as_view()),
+    path(
+        "fast_parent_bulk_delete",
+        generic_views.FastParentBulkDeleteApiView.as_view(),
+    ),
     path("list", generic_views.SimpleListApiView.as_view()),
     path("paginate_list", generic_views.PaginateListApiView.as_view()),
+    path("short_list", generic_views.ShortListApiView.as_view()),
+    path("short_get", generic_views.ShortGetApiView.as_view()),
+    path("not_pruned_list", generic_views.NotPrunedListApiView.as_view()),
+    path("stream_list", generic_views.StreamListApiView.as_view()),
+    path("sparse_list", generic_views.SparseListApiView.as_view()),
+    path("child_list", generic_views.ChildListApiView.as_view()),
+    path("parent_list", generic_views.ParentListApiView.as_view()),
+    path("expanded_child_list", generic_views.ExpandedChildListApiView.as_view()),
+    path("conditional_get", generic_views.ConditionalGetApiView.as_view()),
+    path("conditional_list", generic_views.ConditionalListApiView.as_view()),
+    path("cached_get", generic_views.CachedGetApiView.as_view()),
+    path("cached_list", generic_views.CachedListApiView.as_view()),
+    path("compressed_list", generic_views.CompressedListApiView.as_view()),
+    path(
+        "compressed_stream_list",
+        generic_views.CompressedStreamListApiView.as_view(),
+    ),
+    path("primitive_list", generic_views.PrimitiveListApiView.as_view()),
+    path("chunked_list", generic_views.ChunkedListApiView.as_view()),
+    path("chunked_parent_list", generic_views.ChunkedParentListApiView.as_view()),
     path(
         "limit_offset_paginate_list",
         generic_views.LimitOffsetPaginateListApiView.as_view(),
     ),
 ]
+
+if django.VERSION >= (4, 2):
+    urlpatterns += [
+        path("async/create", generic_views.AsyncSomeModelCreateView.as_view()),
+        path("async/bulk_create", generic_views.AsyncBulkCreateApiView.as_view()),
+        path("async/get_model", generic_views.AsyncSomeModelGetView.as_view()),
+        path("async/update", generic_views.AsyncSomeModelUpdateView.as_view()),
+        path("async/bulk_update", generic_views.AsyncBulkUpdateApiView.as_view()),
+        path("async/delete", generic_views.AsyncSomeModelDeleteView.as_view()),
+        path("async/bulk_delete", generic_views.AsyncBulkDeleteApiView.as_view()),
+        path("async/paginate_list", generic_views.AsyncPaginateListApiView.as_view()),
+        path("async/stream_list", generic_views.AsyncStreamListApiView.as_view()),
+        path(
+            "async/expanded_child_list",
+            generic_views.AsyncExpandedChildListApiView.as_view(),
+        ),
+        path(
+            "async/conditional_list",
+            generic_views.AsyncConditionalListApiView.as_view(),
+        ),
+        path("async/cached_list", generic_views.AsyncCachedListApiView.as_view()),
+        path(
+            "async/compressed_stream_list",
+            generic_views.AsyncCompressedStreamListApiView.as_view(),
+        ),
+        path("async/chunked_list", generic_views.AsyncChunkedListApiView.as_view()),
+    ]
@@ -49,6 +49,22 @@ class PostBodyView(ApiView):
         return self.request_body
 
 
+class LimitedPostBodyView(PostBodyView):
+    class Meta:
+        body_max_size = 32
+        body_max_depth = 2
+
+
+class StreamBodyView(ApiView):
+    class Meta:
+        tags = ["general"]
+        method = HttpMethod.POST
+        body_max_depth = 2
+
+    def execute(self, request, *args, **kwargs):
+        return {"sum": sum(item["a"] for item in self.iter_request_json(request))}
+
+
 class InternalServerErrorView(ApiView):
     class Meta:
         tags = ["general"]